@@ -0,0 +1,44 @@
+"""Compare the JSON codecs on realistic Kafka Connect payloads.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_json.py [--connectors 5000] [--repeat 5]
+"""
+from bench_list_memory import payload
+from kafka_connect.codec import CODECS
+
+import argparse
+import timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    listing_body = payload(args.connectors)
+    listing = CODECS["json"]().loads(listing_body)
+    config = next(iter(listing.values()))["info"]["config"]
+    print(f"connectors={args.connectors}  listing={len(listing_body) / 2**20:.1f}MiB")
+
+    for name, codec_class in CODECS.items():
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f"{name:<7} not installed")
+            continue
+        cases = {
+            # Decoding the response of list_connectors(expand=["status", "info"])
+            "decode listing": lambda: codec.loads(listing_body),
+            # Printing the listing with `kc list -e status -e info`
+            "dumps listing": lambda: codec.dumps(listing),
+            # Encoding the request body of update_connector, per 1000 connectors
+            "encode config x1000": lambda: [codec.encode(config) for _ in range(1000)],
+        }
+        for case, run in cases.items():
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(f"{name:<7} {case:<20} {best * 1000:9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
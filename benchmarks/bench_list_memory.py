@@ -0,0 +1,70 @@
+"""Compare the peak memory of decoding a whole expand=status,info listing against filtering it while it streams.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_list_memory.py [--connectors 50000] [--pattern REGEX] [--state STATE]
+"""
+from stub_server import connector
+from kafka_connect.stream import iter_matching
+
+import argparse
+import json
+import re
+import time
+import tracemalloc
+
+CHUNK_SIZE = 64 * 1024
+
+
+def payload(connectors):
+    """Build a synthetic `GET /connectors?expand=status&expand=info` body, with one connector in ten failed."""
+    return json.dumps({f"connector-{i}": connector(i) for i in range(connectors)}).encode()
+
+
+def chunked(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i : i + CHUNK_SIZE]
+
+
+def decode_all(body, pattern, state):
+    connectors = json.loads(b"".join(chunked(body)))
+    return {
+        name: data
+        for name, data in connectors.items()
+        if (not pattern or re.match(pattern, name))
+        and (not state or data["status"]["connector"]["state"].lower() == state.lower())
+    }
+
+
+def decode_streaming(body, pattern, state):
+    return dict(iter_matching(chunked(body), pattern=pattern, state=state))
+
+
+def measure(decode, body, pattern, state):
+    tracemalloc.start()
+    start = time.perf_counter()
+    connectors = decode(body, pattern, state)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return len(connectors), peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=50000)
+    parser.add_argument("--pattern", default="connector-4")
+    parser.add_argument("--state", default="FAILED")
+    args = parser.parse_args()
+
+    body = payload(args.connectors)
+    print(f"connectors={args.connectors}  body={len(body) / 2**20:.1f}MiB")
+    for decode in (decode_all, decode_streaming):
+        matches, peak, elapsed = measure(decode, body, args.pattern, args.state)
+        print(
+            f"{decode.__name__:<17} matches={matches:<6}  peak={peak / 2**20:8.1f}MiB"
+            f"  elapsed={elapsed:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare the memory retained by an expand=status,info listing as dictionaries and as typed models.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_models_memory.py [--connectors 20000] [--tasks 4]
+"""
+from stub_server import connector
+from kafka_connect.models import to_models
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+
+def retained(build, body):
+    """Measure the memory still allocated by the result of `build` once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(body)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(result), current, elapsed
+
+
+def dicts(body):
+    return json.loads(body)
+
+
+def models(body):
+    # The dictionaries are released as soon as they are converted
+    return to_models(json.loads(body))
+
+
+def statuses(body):
+    # The status alone is what the exporter and the autoheal daemon keep between polls
+    return to_models({name: {"status": data["status"]} for name, data in json.loads(body).items()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=20000)
+    parser.add_argument("--tasks", type=int, default=4)
+    args = parser.parse_args()
+
+    body = json.dumps(
+        {f"connector-{i}": connector(i, tasks=args.tasks) for i in range(args.connectors)}
+    ).encode()
+    print(f"connectors={args.connectors}  tasks={args.tasks}  body={len(body) / 2**20:.1f}MiB")
+    baseline = None
+    for build in (dicts, models, statuses):
+        count, current, elapsed = retained(build, body)
+        baseline = baseline or current
+        print(
+            f"{build.__name__:<8} connectors={count:<6}  retained={current / 2**20:8.1f}MiB"
+            f"  ({current / baseline:4.0%})  elapsed={elapsed:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compare pooled keep-alive connections against a new TLS handshake per request.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_session.py [--connectors 200]
+"""
+from stub_server import StubConnectServer
+from kafka_connect import KafkaConnect
+
+import argparse
+import time
+
+
+def run(url, keep_alive):
+    with KafkaConnect(url=url, ssl_verify=False, keep_alive=keep_alive) as kafka_connect:
+        start = time.perf_counter()
+        kafka_connect.pause_all_connectors()
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=200)
+    args = parser.parse_args()
+
+    for keep_alive in (False, True):
+        with StubConnectServer(connectors=args.connectors, tls=True) as server:
+            elapsed = run(server.url, keep_alive)
+            print(
+                f"keep_alive={keep_alive!s:<5}  requests={args.connectors + 1:<6}"
+                f"  handshakes={server.connections:<6}  elapsed={elapsed:.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measure the startup time of the kc command-line interface and fail if it regresses past a threshold.
+
+The times are the median over several runs, minus the startup time of a bare interpreter, so that they only
+count the work done by kafka-connect-py.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_startup.py [--runs 20] [--threshold-ms 100]
+"""
+import argparse
+import importlib.metadata
+import statistics
+import subprocess
+import sys
+import time
+
+CLI = "from kafka_connect.cli import cli; cli(prog_name='kc')"
+
+
+def median_ms(args, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--threshold-ms", type=float, default=100)
+    args = parser.parse_args()
+
+    try:
+        importlib.metadata.version("kafka-connect-py")
+        # --version reads the version from the package metadata, so it needs an installed package
+        flag = "--version"
+    except importlib.metadata.PackageNotFoundError:
+        flag = "--help"
+
+    baseline = median_ms(["-c", "pass"], args.runs)
+    cases = {
+        "import kafka_connect.cli": ["-c", "import kafka_connect.cli"],
+        f"kc {flag}": ["-c", CLI, flag],
+    }
+    print(f"{'python -c pass':<26} {baseline:7.1f}ms")
+    failed = False
+    for case, case_args in cases.items():
+        elapsed = median_ms(case_args, args.runs) - baseline
+        failed |= elapsed > args.threshold_ms
+        print(f"{case:<26} {elapsed:+7.1f}ms")
+    if failed:
+        sys.exit(f"Startup regressed past the {args.threshold_ms:.0f}ms threshold.")
+
+
+if __name__ == "__main__":
+    main()
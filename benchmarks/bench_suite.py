@@ -0,0 +1,238 @@
+"""Measure the latency and throughput of the client and the command-line interface against a stub REST API.
+
+Every case runs once to warm up and then for a number of rounds. The results can be saved as JSON and compared
+with the results of a previous run, in which case the command fails if any case regressed.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_suite.py [--connectors 1000] [--config-keys 20] [--latency 0]
+        [--rounds 5] [--min-time 0.2] [--parallelism 8] [--case REGEX] [--save results.json]
+        [--baseline previous.json] [--threshold 0.2]
+"""
+from stub_server import StubConnectServer
+from click.testing import CliRunner
+from functools import partial
+from kafka_connect import KafkaConnect
+from kafka_connect.cli import cli
+from kafka_connect.codec import default_codec
+
+import argparse
+import json
+import math
+import platform
+import re
+import statistics
+import sys
+import time
+
+PATTERN = "connector-1"
+
+
+def list_cases():
+    """The `list_connectors` calls, with each filter and expansion."""
+    return {
+        "list": lambda client: client.list_connectors(),
+        "list pattern": lambda client: client.list_connectors(pattern=PATTERN),
+        "list state": lambda client: client.list_connectors(state="failed"),
+        "list expand=status": lambda client: client.list_connectors(expand="status"),
+        "list expand=info": lambda client: client.list_connectors(expand="info"),
+        "list expand=status,info": lambda client: client.list_connectors(expand=["status", "info"]),
+        "list expand=status,info pattern": lambda client: client.list_connectors(
+            expand=["status", "info"], pattern=PATTERN
+        ),
+        "list expand=status,info state": lambda client: client.list_connectors(
+            expand=["status", "info"], state="failed"
+        ),
+    }
+
+
+def bulk_cases(parallelism):
+    """The bulk `*_all_connectors` and `iter_connectors` calls, acting on every connector with `parallelism`
+    threads."""
+    return {
+        f"pause_all x{parallelism}": lambda client: client.pause_all_connectors(
+            max_workers=parallelism
+        ),
+        f"pause_all state x{parallelism}": lambda client: client.pause_all_connectors(
+            state="failed", max_workers=parallelism
+        ),
+        f"resume_all x{parallelism}": lambda client: client.resume_all_connectors(
+            max_workers=parallelism
+        ),
+        f"stop_all x{parallelism}": lambda client: client.stop_all_connectors(
+            max_workers=parallelism
+        ),
+        f"restart_all x{parallelism}": lambda client: client.restart_all_connectors(
+            max_workers=parallelism
+        ),
+        f"restart_all tasks state x{parallelism}": lambda client: client.restart_all_connectors(
+            include_tasks=True, only_failed=True, state="failed", max_workers=parallelism
+        ),
+        f"delete_all x{parallelism}": lambda client: client.delete_all_connectors(
+            max_workers=parallelism
+        ),
+        f"iter_connectors config x{parallelism}": lambda client: sum(
+            1 for _ in client.iter_connectors(prefetch=parallelism)
+        ),
+    }
+
+
+def cli_cases(parallelism):
+    """The `kc` commands, run in-process so that the interpreter startup is not measured."""
+    parallel = ["--parallelism", str(parallelism)]
+    return {
+        "kc list": ["list"],
+        "kc list -e status -e info": ["list", "-e", "status", "-e", "info"],
+        "kc list -e status -s failed --output ndjson": [
+            *["list", "-e", "status", "-s", "failed", "--output", "ndjson"]
+        ],
+        f"kc pause --all x{parallelism}": ["pause", "--all", *parallel],
+        f"kc restart --all -s failed --output ndjson x{parallelism}": [
+            *["restart", "--all", "-s", "failed", "--output", "ndjson", *parallel]
+        ],
+    }
+
+
+def invoke(runner, url, args):
+    result = runner.invoke(cli, ["--url", url, *args], catch_exceptions=False)
+    if result.exit_code != 0:
+        raise RuntimeError(f"kc {' '.join(args)} exited with {result.exit_code}: {result.output}")
+
+
+def measure(server, run, rounds, min_time):
+    """Warm up a case, then time it for a number of rounds.
+    Each round repeats the case until it lasts at least `min_time`, so that fast cases are not dominated by the
+    resolution of the clock and by scheduling noise.
+    Args:
+        server (StubConnectServer): The server the case calls.
+        run (Callable[[], Any]): The case.
+        rounds (int): The number of timed rounds.
+        min_time (float): The shortest duration of a round in seconds.
+    Returns:
+        Dict[str, float]: The latency of a single call in seconds, as the best, median and worst of the rounds, the
+            number of requests per call and the throughput in requests per second of the best round.
+    """
+    start = time.perf_counter()
+    run()
+    number = max(1, math.ceil(min_time / max(time.perf_counter() - start, 1e-9)))
+    elapsed = []
+    requests = server.requests
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed.append((time.perf_counter() - start) / number)
+    requests = (server.requests - requests) / (rounds * number)
+    return {
+        "min": min(elapsed),
+        "median": statistics.median(elapsed),
+        "max": max(elapsed),
+        "calls": number,
+        "requests": requests,
+        "requests_per_second": requests / min(elapsed),
+    }
+
+
+def run_suite(args):
+    cases = {}
+    with StubConnectServer(
+        connectors=args.connectors, config_keys=args.config_keys, latency=args.latency
+    ) as server:
+        runner = CliRunner()
+        client_cases = {**list_cases(), **bulk_cases(args.parallelism)}
+        for name, call in client_cases.items():
+            if not re.search(args.case, name):
+                continue
+            with KafkaConnect(url=server.url) as client:
+                cases[name] = measure(server, lambda: call(client), args.rounds, args.min_time)
+            print_case(name, cases[name])
+        for name, command in cli_cases(args.parallelism).items():
+            if not re.search(args.case, name):
+                continue
+            run = partial(invoke, runner, server.url, command)
+            cases[name] = measure(server, run, args.rounds, args.min_time)
+            print_case(name, cases[name])
+    return cases
+
+
+def print_case(name, result):
+    print(
+        f"{name:<48} best={result['min'] * 1000:9.2f}ms  median={result['median'] * 1000:9.2f}ms"
+        f"  requests={result['requests']:<7g} rps={result['requests_per_second']:9.1f}"
+    )
+
+
+def compare(cases, baseline, threshold):
+    """Compare the best latency of each case with a baseline, which is the least sensitive to noise.
+    Args:
+        cases (Dict[str, Dict[str, float]]): The results of this run.
+        baseline (Dict[str, Any]): The saved results of a previous run.
+        threshold (float): The relative slowdown above which a case regressed, such as 0.2 for 20%.
+    Returns:
+        List[str]: The names of the cases that regressed.
+    """
+    regressions = []
+    print(f"\nCompared with the baseline of {baseline['environment']['timestamp']}:")
+    for name, result in cases.items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            print(f"{name:<48} new")
+            continue
+        change = result["min"] / before["min"] - 1
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<48} {change:+8.1%}{'  REGRESSED' if regressed else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connectors", type=int, default=1000)
+    parser.add_argument("--config-keys", type=int, default=20, help="Sets the payload size.")
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Seconds the server waits per request."
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Shortest seconds per round.")
+    parser.add_argument("--parallelism", type=int, default=8)
+    parser.add_argument("--case", default="", metavar="REGEX", help="Only run the matching cases.")
+    parser.add_argument("--save", metavar="PATH", help="Save the results as JSON.")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare with saved results.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    config = {
+        "connectors": args.connectors,
+        "config_keys": args.config_keys,
+        "latency": args.latency,
+        "rounds": args.rounds,
+        "min_time": args.min_time,
+        "parallelism": args.parallelism,
+    }
+    print("  ".join(f"{key}={value}" for key, value in config.items()))
+    cases = run_suite(args)
+    results = {
+        "environment": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "json": default_codec().name,
+        },
+        "config": config,
+        "cases": cases,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["config"] != config:
+            print(f"\nWarning: the baseline was run with {baseline['config']}")
+        if compare(cases, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""An in-process stub of the Kafka Connect REST API used by the benchmarks."""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import json
+import os
+import re
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+
+PLUGINS = [
+    {"class": "io.example.SinkConnector", "type": "sink", "version": "1.0.0"},
+    {"class": "io.example.SourceConnector", "type": "source", "version": "1.0.0"},
+]
+
+# The stack trace reported by the failed tasks, about as long as a real one
+TRACE = "org.apache.kafka.connect.errors.ConnectException: Connection refused\n" + "".join(
+    f"\tat io.example.sink.Writer.write{j}(Writer.java:{100 + j})\n" for j in range(40)
+)
+
+
+def connector(i, config_keys=20, tasks=4, failed_every=10):
+    """Build the status and info of a synthetic connector, with one connector in `failed_every` failed.
+    The tasks of the failed connectors report a stack trace.
+    Args:
+        i (int): The index of the connector, used in its name.
+        config_keys (int): The number of extra configuration keys, which sets the payload size. Defaults to 20.
+        tasks (int): The number of tasks. Defaults to 4.
+        failed_every (int): Fail one connector in this many, or none when 0. Defaults to 10.
+    Returns:
+        Dict[str, Any]: The `status` and `info` expansions of the connector.
+    """
+    name = f"connector-{i}"
+    state = "FAILED" if failed_every and i % failed_every == 0 else "RUNNING"
+    worker = f"10.0.{i % 16}.1:8083"
+    config = {f"transforms.t{j}.field": f"field-{i}-{j}" for j in range(config_keys)}
+    config.update(
+        {"name": name, "connector.class": "io.example.SinkConnector", "tasks.max": str(tasks)}
+    )
+    return {
+        "status": {
+            "name": name,
+            "connector": {"state": state, "worker_id": worker},
+            "tasks": [
+                {
+                    "id": t,
+                    "state": state,
+                    "worker_id": worker,
+                    **({"trace": TRACE} if state == "FAILED" else {}),
+                }
+                for t in range(tasks)
+            ],
+            "type": "sink",
+        },
+        "info": {
+            "name": name,
+            "config": config,
+            "tasks": [{"connector": name, "task": t} for t in range(tasks)],
+            "type": "sink",
+        },
+    }
+
+
+class StubConnectHandler(BaseHTTPRequestHandler):
+    """Answer the subset of Kafka Connect endpoints exercised by the benchmarks."""
+
+    protocol_version = "HTTP/1.1"
+    # Buffer the headers with the body, so that small responses are not delayed by Nagle's algorithm
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _send(self, status, body=None):
+        # Responses may be served from the pre-encoded listings
+        if isinstance(body, bytes):
+            payload = body
+        else:
+            payload = json.dumps(body).encode() if body is not None else b""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.requests += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_found(self):
+        self._send(404, {"error_code": 404, "message": "Not found"})
+
+    def _route(self):
+        """Split the request path into the connector name, the sub-resource and the query parameters."""
+        url = urlsplit(self.path)
+        match = re.match(r"^/connectors/([^/]+)(?:/(.+))?$", url.path)
+        if not match:
+            return None, None, parse_qs(url.query)
+        name, resource = unquote(match.group(1)), match.group(2)
+        if name not in self.server.connectors:
+            name = None
+        return name, resource or "", parse_qs(url.query)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/connectors":
+            expand = tuple(sorted(set(parse_qs(urlsplit(self.path).query).get("expand", []))))
+            self._send(200, self.server.listing(expand))
+        elif path == "/":
+            self._send(200, {"version": "7.3.0", "commit": "stub", "kafka_cluster_id": "stub"})
+        elif path == "/connector-plugins":
+            self._send(200, PLUGINS)
+        else:
+            name, resource, _ = self._route()
+            if name is None:
+                return self._not_found()
+            data = self.server.connectors[name]
+            if resource == "":
+                self._send(200, data["info"])
+            elif resource == "config":
+                self._send(200, data["info"]["config"])
+            elif resource == "status":
+                self._send(200, data["status"])
+            elif resource == "tasks":
+                self._send(200, [{"id": task, "config": {}} for task in data["info"]["tasks"]])
+            elif resource == "topics":
+                self._send(200, {name: {"topics": [f"{name}-topic"]}})
+            else:
+                self._not_found()
+
+    def do_POST(self):
+        name, resource, query = self._route()
+        if name is not None and resource == "restart":
+            if query.get("includeTasks") == ["True"] or query.get("onlyFailed") == ["True"]:
+                self._send(202, self.server.connectors[name]["status"])
+            else:
+                self._send(204)
+        elif name is not None and re.match(r"^tasks/\d+/restart$", resource):
+            self._send(204)
+        else:
+            self._not_found()
+
+    def do_PUT(self):
+        name, resource, _ = self._route()
+        if name is not None and resource in ("pause", "resume", "stop"):
+            self._send(202)
+        elif name is not None and resource == "config":
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._send(200, self.server.connectors[name]["info"])
+        else:
+            self._not_found()
+
+    def do_DELETE(self):
+        # Connectors are never removed, so that every benchmark round acts on the same cluster
+        name, resource, _ = self._route()
+        if name is not None and resource == "":
+            self._send(204)
+        else:
+            self._not_found()
+
+
+class StubConnectServer:
+    """Run a stub Kafka Connect REST API in a background thread.
+    Actions such as pause and delete are acknowledged without changing any connector, so repeated rounds of a
+    benchmark see the same cluster.
+    Args:
+        connectors (int): The number of connectors to serve. Defaults to 100.
+        tls (bool): Whether to serve over TLS with a throwaway self-signed certificate. Defaults to False.
+        config_keys (int): The number of extra configuration keys per connector, which sets the payload size.
+            Defaults to 20.
+        latency (float): The number of seconds to wait before answering each request. Defaults to 0.
+        failed_every (int): Fail one connector in this many, or none when 0. Defaults to 10.
+    """
+
+    def __init__(self, connectors=100, tls=False, config_keys=20, latency=0, failed_every=10):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubConnectHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.connectors = {
+            f"connector-{i}": connector(i, config_keys=config_keys, failed_every=failed_every)
+            for i in range(connectors)
+        }
+        self.httpd.latency = latency
+        self.httpd.connections = 0
+        self.httpd.requests = 0
+        self.httpd.lock = threading.Lock()
+        self.httpd.listing = self.__listing
+        self.__listings = {}
+        self.tls = tls
+        if tls:
+            self._certdir = tempfile.TemporaryDirectory()
+            cert = os.path.join(self._certdir.name, "cert.pem")
+            key = os.path.join(self._certdir.name, "key.pem")
+            subprocess.run(
+                ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+                + ["-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+                check=True,
+                capture_output=True,
+            )
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert, key)
+            self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+
+    def __listing(self, expand):
+        """Encode the `GET /connectors` body of a set of expansions once, so that serving it costs no CPU."""
+        if expand not in self.__listings:
+            connectors = self.httpd.connectors
+            if expand:
+                body = {
+                    name: {key: data[key] for key in expand if key in data}
+                    for name, data in connectors.items()
+                }
+            else:
+                body = [*connectors]
+            self.__listings[expand] = json.dumps(body).encode()
+        return self.__listings[expand]
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"{'https' if self.tls else 'http'}://{host}:{port}"
+
+    @property
+    def connections(self):
+        """The number of TCP (and TLS) connections accepted so far."""
+        return self.httpd.connections
+
+    @property
+    def requests(self):
+        """The number of requests answered so far."""
+        return self.httpd.requests
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.tls:
+            self._certdir.cleanup()
@@ -1 +1,32 @@
-from .kafka_connect import KafkaConnect
+import importlib
+
+# The classes are imported on first use, so that importing the command-line interface does not import
+# requests or asyncio before they are needed
+_EXPORTS = {
+    "KafkaConnect": ".kafka_connect",
+    "AsyncKafkaConnect": ".async_kafka_connect",
+    "TTLCache": ".cache",
+    "DiskCache": ".disk_cache",
+    "KafkaConnectFleet": ".fleet",
+    "RetryPolicy": ".retry",
+    "RequestMetrics": ".metrics",
+    "RequestHook": ".hooks",
+    "SlowRequestLogger": ".hooks",
+    "ConnectorStatus": ".models",
+    "TaskStatus": ".models",
+    "ConnectorInfo": ".models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
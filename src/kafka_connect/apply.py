@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+
+
+def normalize_config(config, name=None):
+    """Normalize a connector configuration into the form the Kafka Connect REST API returns it in.
+    Accepts both the `{"name": ..., "config": {...}}` payload of a POST request and a flat configuration. Values
+    are stringified, since the REST API returns every configuration value as a string.
+    Args:
+        config (Dict[str, Any]): The connector configuration.
+        name (str): The connector name to use when the configuration does not set one. Defaults to `None`.
+    Returns:
+        Tuple[str, Dict[str, str]]: The connector name and its normalized flat configuration.
+    Raises:
+        ValueError: If the configuration does not name the connector and no name is given.
+    """
+    if isinstance(config.get("config"), dict):
+        name = config.get("name", name)
+        config = config["config"]
+    name = config.get("name", name)
+    if not name:
+        raise ValueError("The connector configuration does not set a `name`.")
+
+    normalized = {}
+    for key, value in config.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        normalized[key] = value if isinstance(value, str) else str(value)
+    normalized["name"] = name
+    return name, normalized
+
+
+def fingerprint(config):
+    """Hash a normalized connector configuration.
+    Args:
+        config (Dict[str, str]): The normalized connector configuration.
+    Returns:
+        str: The SHA-256 hex digest of the configuration.
+    """
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+def load_connector_configs(directory):
+    """Load the desired connector configurations from the JSON files of a directory.
+    A file that does not name its connector is named after the file, without the `.json` extension.
+    Args:
+        directory (str): The path of the directory.
+    Returns:
+        Dict[str, Dict[str, str]]: The normalized configurations keyed by connector name.
+    Raises:
+        ValueError: If two files configure the same connector.
+    """
+    configs = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(directory, filename)) as f:
+            name, config = normalize_config(json.load(f), name=filename[: -len(".json")])
+        if name in configs:
+            raise ValueError(f"The {name} connector is configured more than once in {directory}.")
+        configs[name] = config
+    return configs
+
+
+def plan_changes(desired, live, prune=False):
+    """Compare the desired connector configurations with the live ones.
+    Args:
+        desired (Dict[str, Dict[str, Any]]): The desired configurations keyed by connector name.
+        live (Dict[str, Dict[str, Any]]): The live configurations keyed by connector name.
+        prune (bool): Whether to delete the live connectors that are not desired. Defaults to False.
+    Returns:
+        Dict[str, List[str]]: The connector names to `create`, `update` and `delete`, and those `unchanged`.
+    """
+    plan = {"create": [], "update": [], "delete": [], "unchanged": []}
+    for name, config in desired.items():
+        if name not in live:
+            plan["create"].append(name)
+        elif fingerprint(normalize_config(config, name)[1]) != fingerprint(
+            normalize_config(live[name], name)[1]
+        ):
+            plan["update"].append(name)
+        else:
+            plan["unchanged"].append(name)
+    if prune:
+        plan["delete"] = [name for name in live if name not in desired]
+    return plan
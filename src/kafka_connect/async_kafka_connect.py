@@ -0,0 +1,541 @@
+from .codec import encode, loads
+from .models import to_models
+
+import asyncio
+import logging
+import re
+
+
+class AsyncKafkaConnect:
+    """An asyncio client for the Confluent Platform Kafka Connect REST API.
+    Every endpoint method of `KafkaConnect` is available as a coroutine. Requires the optional `httpx` dependency,
+    which is installed with `pip install kafka-connect-py[async]`.
+    Args:
+        url (str): The base URL for the Kafka Connect REST API.
+        auth (str): A colon-delimited string of `username` and `password` to use for authenticating with the Kafka Connect REST API.
+        ssl_verify (bool): Whether to verify the SSL certificate when making requests to the Kafka Connect REST API. Defaults to True.
+        logger (logging.Logger): The logger to be used. If not specified, a new logger will be created.
+        pool_maxsize (int): The maximum number of connections to keep alive. Defaults to 10.
+        max_retries (int): The transport-level retries for failed connections. Defaults to 0.
+        keep_alive (bool): Whether to reuse connections between requests. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        url="http://localhost:8083",
+        auth=None,
+        ssl_verify=True,
+        logger=None,
+        pool_maxsize=10,
+        max_retries=0,
+        keep_alive=True,
+    ):
+        self.url = url
+        self.headers = {"Content-Type": "application/json"}
+
+        # Split the auth string into username and password and store them as a tuple
+        if auth:
+            if ":" not in auth:
+                raise ValueError(
+                    "Invalid auth string. Expected a colon-delimited string of `username` and `password`."
+                )
+            username, password = auth.split(":")
+            self.auth = (username.strip(), password.strip())
+        else:
+            self.auth = None
+
+        self.verify = ssl_verify
+        self.logger = logger if logger else logging.getLogger()
+
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    @property
+    def client(self):
+        """The pooled HTTP client shared by every endpoint method.
+        The client is created on first use so that constructing an `AsyncKafkaConnect` does not open any connections.
+        Returns:
+            httpx.AsyncClient: The client.
+        """
+        if self._client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError(
+                    "AsyncKafkaConnect requires httpx. Install it with `pip install kafka-connect-py[async]`."
+                )
+
+            limits = httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+            )
+            transport = httpx.AsyncHTTPTransport(
+                verify=self.verify, limits=limits, retries=self.max_retries
+            )
+            self._client = httpx.AsyncClient(transport=transport)
+        return self._client
+
+    async def aclose(self):
+        """Close the HTTP client and release its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __request(self, method, path, params=None, **kwargs):
+        """Send a request to the Kafka Connect REST API over the pooled client.
+        Args:
+            method (str): The HTTP method.
+            path (str): The path relative to the base URL.
+            params (Dict[str, Any]): The query parameters. Parameters set to `None` are omitted.
+            **kwargs: Additional arguments passed to `httpx.AsyncClient.request`.
+        Returns:
+            httpx.Response: The response from the REST API.
+        """
+        if params:
+            params = {key: value for key, value in params.items() if value is not None}
+        return await self.client.request(
+            method, f"{self.url}{path}", auth=self.auth, params=params, **kwargs
+        )
+
+    async def __run_all(self, action, connectors, max_workers=1, **kwargs):
+        """Run a single connector coroutine against many connectors, at most `max_workers` at a time.
+        Failures do not stop the remaining connectors; each outcome is logged in the order of `connectors`.
+        Args:
+            action (Callable): The single connector coroutine method to run, such as `pause_connector`.
+            connectors (Iterable[str]): The names of the connectors.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 1.
+            **kwargs: Additional arguments passed to `action`.
+        Returns:
+            Dict[str, Any]: The response, or the raised exception, for each connector in the order of `connectors`.
+        """
+        connectors = list(connectors)
+        if max_workers > self.pool_maxsize:
+            if self._client is None:
+                # Size the connection pool before the client is created so that it does not cap the concurrency
+                self.pool_maxsize = max_workers
+            else:
+                # The live client may be in use by other coroutines, so its pool caps the concurrency instead
+                max_workers = self.pool_maxsize
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(connector):
+            async with semaphore:
+                try:
+                    return await action(connector, **kwargs)
+                except Exception as e:
+                    return e
+
+        results = dict(zip(connectors, await asyncio.gather(*(run(c) for c in connectors))))
+
+        for connector, result in results.items():
+            if isinstance(result, Exception):
+                self.logger.error(f"{action.__name__} failed for {connector} connector: {result}")
+            else:
+                self.logger.info(f"{action.__name__} succeeded for {connector} connector")
+        return results
+
+    async def get_cluster_info(self):
+        """Get the version and other details of the Kafka Connect cluster.
+        Returns:
+            Dict[str, str]: The details of the cluster, including its version, commit ID, and Kafka cluster ID.
+        """
+        self.logger.info("Getting cluster details")
+        response = await self.__request("GET", "")
+        response.raise_for_status()
+        return loads(response.content)
+
+    def __filter_by_name(self, connectors, pattern):
+        """Filter connectors based on a regex pattern.
+        Args:
+            connectors (List[str] or Dict[str, Any]): The list or dictionary of connectors to filter.
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+        Returns:
+            List[str] or Dict[str, Any]: The filtered connectors.
+        """
+        if not pattern:
+            return connectors
+        if isinstance(connectors, list):
+            return [conn for conn in connectors if re.match(pattern, conn)]
+        return {conn: data for conn, data in connectors.items() if re.match(pattern, conn)}
+
+    async def __filter_by_state(self, connectors, state):
+        """Filter connectors based on state.
+        Args:
+            connectors (List[str] or Dict[str, Any]): The list or dictionary of connectors to filter.
+            state (str): The state of a connector to filter.
+        Returns:
+            List[str] or Dict[str, Any]: The filtered connectors.
+        """
+        if not state:
+            return connectors
+
+        if isinstance(connectors, dict) and all("status" in data for data in connectors.values()):
+            connectors_status = connectors
+        else:
+            connectors_status = await self.list_connectors(expand="status")
+
+        def matches(conn):
+            return (
+                connectors_status.get(conn, {})
+                .get("status", {})
+                .get("connector", {})
+                .get("state", "")
+                .lower()
+                == state.lower()
+            )
+
+        if isinstance(connectors, list):
+            return [conn for conn in connectors if matches(conn)]
+        return {conn: data for conn, data in connectors.items() if matches(conn)}
+
+    async def list_connectors(self, expand=None, pattern=None, state=None, typed=False):
+        """Get the list of connectors.
+        Args:
+            expand (str or List[str]): Optional parameter that retrieves additional information about the connectors.
+                Valid values are "status" and "info". Pass both to fetch them in a single request.
+            pattern (str): Only list connectors that match the regex pattern.
+            state (str): Only list connectors that match the state.
+            typed (bool): Whether to return the expansions as `ConnectorStatus` and `ConnectorInfo` objects, which
+                take a fraction of the memory of the dictionaries. Ignored without `expand`. Defaults to False.
+        Returns:
+            list or dict: The list of connector names or dictionary of connector names and its details.
+        """
+        expansions = [expand] if isinstance(expand, str) else list(expand or [])
+
+        # Fetch the status in the same request when it is needed to filter by state
+        fetched = expansions + ["status"] if state and "status" not in expansions else expansions
+
+        self.logger.info(
+            f"Listing connectors{' with expand=' + ','.join(fetched) if fetched else ''}"
+        )
+        response = await self.__request("GET", "/connectors", params={"expand": fetched or None})
+        response.raise_for_status()
+        connectors = await self.__filter_by_state(
+            self.__filter_by_name(loads(response.content), pattern=pattern), state=state
+        )
+
+        if fetched != expansions:
+            # Drop the status that was only fetched to filter by state
+            if not expansions:
+                return list(connectors)
+            connectors = {
+                conn: {key: data[key] for key in expansions if key in data}
+                for conn, data in connectors.items()
+            }
+        # A listing without expansions is a list of names, which has nothing to convert
+        return to_models(connectors) if typed and expansions else connectors
+
+    async def create_connector(self, config):
+        """Create a new connector.
+        Args:
+            config (Dict[str, Any]): The configuration for the connector.
+        Returns:
+            Dict[str, Any]: The response from the REST API.
+        Raises:
+            httpx.HTTPStatusError: If the REST API responds with an error status code.
+        """
+        self.logger.info(f"Creating connector: {config.get('name')}")
+        response = await self.__request(
+            "POST", "/connectors", headers=self.headers, content=encode(config)
+        )
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def update_connector(self, connector, config):
+        """Update an existing connector.
+        Args:
+            connector (str): The name of the connector.
+            config (Dict[str, Any]): The new configuration for the connector.
+        Returns:
+            Dict[str, Any]: The response from the REST API.
+        """
+        if "config" in config:
+            self.logger.error(
+                'The payload is not wrapped in {"config": {}} as in the POST request. The config is directly provided.'
+            )
+
+        self.logger.info(f"Updating {connector} connector")
+        response = await self.__request(
+            "PUT",
+            f"/connectors/{connector}/config",
+            headers=self.headers,
+            content=encode(config),
+        )
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def get_connector(self, connector):
+        """Get the details of a single connector.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            Dict[str, Any]: The details of the connector.
+        """
+        self.logger.info(f"Getting {connector} connector")
+        response = await self.__request("GET", f"/connectors/{connector}")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def get_connector_config(self, connector):
+        """Get the configuration of a single connector.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            Dict[str, Any]: The configuration of the connector.
+        """
+        self.logger.info(f"Getting connector config: {connector}")
+        response = await self.__request("GET", f"/connectors/{connector}/config")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def get_connector_status(self, connector):
+        """Get the status of a single connector.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            Dict[str, Any]: The status of the connector.
+        """
+        self.logger.info(f"Getting connector status: {connector}")
+        response = await self.__request("GET", f"/connectors/{connector}/status")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def restart_connector(self, connector, include_tasks=False, only_failed=False):
+        """Restart a single connector.
+        Args:
+            connector (str): The name of the connector.
+            include_tasks (bool): If `True`, the tasks of the connector will also be restarted. Defaults to `False`.
+            only_failed (bool): Whether to restart only failed Task objects. Defaults to `False`.
+        Returns:
+            Dict[str, Any]: The response from the REST API, or `None` if no response body is returned.
+        """
+        self.logger.info(f"Restarting {connector} connector")
+        params = {"includeTasks": include_tasks, "onlyFailed": only_failed}
+        response = await self.__request("POST", f"/connectors/{connector}/restart", params=params)
+
+        if response.status_code == 404:
+            self.logger.error("Connector not found.")
+        elif response.status_code == 409:
+            self.logger.error("Rebalance needed to restart connector.")
+        elif response.status_code == 500:
+            self.logger.error("Connector restart request timed out.")
+        response.raise_for_status()
+
+        if response.status_code in (200, 202) and response.content:
+            return loads(response.content)
+        return None
+
+    async def restart_all_connectors(
+        self, include_tasks=False, only_failed=False, pattern=None, state=None, max_workers=1
+    ):
+        """Restart all connectors.
+        Args:
+            include_tasks (bool): Whether to include tasks when restarting the connector. Default is False.
+            only_failed (bool): Whether to only restart failed tasks. Default is False.
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to restart concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
+        """
+        return await self.__run_all(
+            self.restart_connector,
+            await self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            include_tasks=include_tasks,
+            only_failed=only_failed,
+        )
+
+    async def pause_connector(self, connector):
+        """Pause a single connector.
+        Args:
+            connector (str): The name of the connector.
+        """
+        self.logger.info(f"Pausing {connector} connector")
+        response = await self.__request("PUT", f"/connectors/{connector}/pause")
+        response.raise_for_status()
+        return None
+
+    async def pause_all_connectors(self, pattern=None, state=None, max_workers=1):
+        """Pause all connectors.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to pause concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
+        """
+        return await self.__run_all(
+            self.pause_connector,
+            await self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+        )
+
+    async def resume_connector(self, connector):
+        """Resume a single connector.
+        Args:
+            connector (str): The name of the connector.
+        """
+        self.logger.info(f"Resuming {connector} connector")
+        response = await self.__request("PUT", f"/connectors/{connector}/resume")
+        response.raise_for_status()
+        return None
+
+    async def resume_all_connectors(self, pattern=None, state=None, max_workers=1):
+        """Resume all connectors.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to resume concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
+        """
+        return await self.__run_all(
+            self.resume_connector,
+            await self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+        )
+
+    async def stop_connector(self, connector):
+        """Stop a single connector.
+        Args:
+            connector (str): The name of the connector.
+        """
+        self.logger.info(f"Stopping {connector} connector")
+        response = await self.__request("PUT", f"/connectors/{connector}/stop")
+        response.raise_for_status()
+        return None
+
+    async def stop_all_connectors(self, pattern=None, state=None, max_workers=1):
+        """Stop all connectors.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to stop concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
+        """
+        return await self.__run_all(
+            self.stop_connector,
+            await self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+        )
+
+    async def delete_connector(self, connector):
+        """Delete a single connector.
+        Args:
+            connector (str): The name of the connector.
+        """
+        self.logger.info(f"Deleting {connector} connector")
+        response = await self.__request("DELETE", f"/connectors/{connector}")
+        response.raise_for_status()
+        return None
+
+    async def delete_all_connectors(self, pattern=None, state=None, max_workers=1):
+        """Delete all connectors.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to delete concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
+        """
+        return await self.__run_all(
+            self.delete_connector,
+            await self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+        )
+
+    async def list_connector_tasks(self, connector):
+        """Get the list of tasks for a connector.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            List[Dict[str, Any]]: The list of tasks for the connector.
+        """
+        self.logger.info(f"Getting tasks for {connector} connector")
+        response = await self.__request("GET", f"/connectors/{connector}/tasks")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def get_connector_task_status(self, connector, task_id):
+        """Get the status of a specific task for a connector.
+        Args:
+            connector (str): The name of the connector.
+            task_id (int): The ID of the task.
+        Returns:
+            Dict[str, Any]: The response from the REST API.
+        """
+        self.logger.info(f"Getting task status for {task_id} task for {connector} connector")
+        response = await self.__request("GET", f"/connectors/{connector}/tasks/{task_id}/status")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def restart_connector_task(self, connector, task_id):
+        """Restart a specific task of a connector.
+        Args:
+            connector (str): The name of the connector.
+            task_id (int): The ID of the task.
+        """
+        self.logger.info(f"Restarting {task_id} task of {connector} connector")
+        response = await self.__request("POST", f"/connectors/{connector}/tasks/{task_id}/restart")
+        response.raise_for_status()
+        return None
+
+    async def list_connector_topics(self, connector):
+        """Get the list of topics for a connector.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            Dict[str, Dict[str, List[str]]]: The topics used by the connector.
+        """
+        self.logger.info(f"Getting topics for {connector} connector")
+        response = await self.__request("GET", f"/connectors/{connector}/topics")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def reset_connector_topics(self, connector):
+        """Reset the list of topics for a connector.
+        Args:
+            connector (str): The name of the connector.
+        """
+        self.logger.info(f"Resetting topics for {connector} connector")
+        response = await self.__request("PUT", f"/connectors/{connector}/topics/reset")
+        response.raise_for_status()
+        return None
+
+    async def list_connector_plugins(self):
+        """Get the list of connector plugins.
+        Returns:
+            List[Dict[str, Any]]: The list of connector plugins.
+        """
+        self.logger.info("Getting connector plugins")
+        response = await self.__request("GET", "/connector-plugins")
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def validate_connector_config(self, plugin, config):
+        """Validate the configuration for a specific connector plugin.
+        Args:
+            plugin (str): The name of the plugin.
+            config (Dict[str, Any]): The configuration to be validated.
+        Returns:
+            Dict[str, Any]: The response from the REST API.
+        """
+        self.logger.info(f"Validating config for plugin: {plugin}")
+        response = await self.__request(
+            "PUT",
+            f"/connector-plugins/{plugin}/config/validate",
+            headers=self.headers,
+            content=encode(config),
+        )
+        response.raise_for_status()
+        return loads(response.content)
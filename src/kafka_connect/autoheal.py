@@ -0,0 +1,195 @@
+from .watch import snapshot
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.exceptions import RequestException
+
+import time
+
+
+class _TaskState:
+    """The restart history of a failed task."""
+
+    __slots__ = ("attempts", "next_attempt", "restarts", "running_since", "exhausted")
+
+    def __init__(self):
+        self.attempts = 0
+        self.next_attempt = 0.0
+        self.restarts = deque()
+        self.running_since = None
+        self.exhausted = False
+
+
+class AutoHealer:
+    """Restart the failed tasks of a Kafka Connect cluster, backing off from the tasks that keep failing.
+    Every pass lists the connector statuses with a single request and restarts the failed tasks that are due.
+    After its n-th restart a task waits `base_delay * 2 ** (n - 1)` seconds, up to `max_delay`, before it is
+    restarted again, and it is restarted at most `max_restarts` times in any `window` seconds. The backoff resets
+    once the task has been running for `healthy_after` seconds. The state is kept in memory and forgotten once a
+    task is healthy and its restarts have left the window.
+    Args:
+        kafka_connect (KafkaConnect): The client of the cluster.
+        pattern (str): Only heal the connectors that match the regex pattern. Defaults to every connector.
+        interval (float): The number of seconds between passes. Defaults to 10.
+        base_delay (float): The number of seconds to wait after the first restart of a task. Defaults to 10.
+        max_delay (float): The longest number of seconds to wait between restarts of a task. Defaults to 600.
+        max_restarts (int): The most restarts of a task in the window. Defaults to 5.
+        window (float): The number of seconds of the sliding window of the restart budget. Defaults to 3600.
+        healthy_after (float): The number of seconds a task must be running to reset its backoff. Defaults to 300.
+        max_workers (int): The maximum number of concurrent restarts. Defaults to 4.
+        max_restarts_per_pass (int): The most restarts of a single pass, so that a cluster-wide outage does not
+            flood the REST API. The remaining tasks are restarted by the following passes. Defaults to 100.
+        logger (logging.Logger): The logger to be used. Defaults to the logger of `kafka_connect`.
+        clock (Callable[[], float]): The monotonic clock. Defaults to `time.monotonic`.
+        sleep (Callable[[float], None]): Waits between passes. Defaults to `time.sleep`.
+    """
+
+    def __init__(
+        self,
+        kafka_connect,
+        pattern=None,
+        interval=10,
+        base_delay=10,
+        max_delay=600,
+        max_restarts=5,
+        window=3600,
+        healthy_after=300,
+        max_workers=4,
+        max_restarts_per_pass=100,
+        logger=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.kafka_connect = kafka_connect
+        self.pattern = pattern
+        self.interval = interval
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_restarts = max_restarts
+        self.window = window
+        self.healthy_after = healthy_after
+        self.max_workers = max_workers
+        self.max_restarts_per_pass = max_restarts_per_pass
+        self.logger = logger if logger else kafka_connect.logger
+        self.clock = clock
+        self.sleep = sleep
+        self.tasks = {}
+
+    def delay(self, attempts):
+        """Get the number of seconds to wait after a restart.
+        Args:
+            attempts (int): The number of restarts since the task was last healthy, including this one.
+        Returns:
+            float: The delay.
+        """
+        # Capping the exponent keeps the delay a float however long a task keeps failing
+        return min(self.max_delay, self.base_delay * 2 ** min(attempts - 1, 32))
+
+    def __event(self, event, connector, task_id, **fields):
+        return {"event": event, "connector": connector, "task": task_id, **fields}
+
+    def __restart(self, connector, task_id):
+        try:
+            self.kafka_connect.restart_connector_task(connector, task_id)
+        except RequestException as e:
+            return e
+        return None
+
+    def heal(self):
+        """Run a single pass: list the connector statuses once and restart the failed tasks that are due.
+        Returns:
+            List[Dict[str, Any]]: The events of the pass, each with its `event`, `connector`, `task` and
+                `timestamp`. A "restarted" or "restart_failed" event has the `worker_id` the task failed on,
+                its `attempt`, the `restarts` left in the window and the seconds until the `next_attempt`.
+                A "budget_exhausted" event, emitted once per exhaustion, has the seconds until the task can be
+                restarted again in `retry_in`. A "recovered" event has the number of `attempts` it took.
+        Raises:
+            requests.exceptions.RequestException: If the connector statuses cannot be listed.
+        """
+        states = snapshot(self.kafka_connect.list_connectors(expand="status", pattern=self.pattern))
+        now = self.clock()
+        events, due, seen = [], [], set()
+
+        for name, (_, _, tasks) in states.items():
+            for task_id, (task_state, worker_id) in tasks.items():
+                key = (name, task_id)
+                seen.add(key)
+                task = self.tasks.get(key)
+
+                if task_state != "FAILED":
+                    if task is None or task_state != "RUNNING":
+                        continue
+                    if task.running_since is None:
+                        task.running_since = now
+                    if task.attempts and now - task.running_since >= self.healthy_after:
+                        events.append(
+                            self.__event("recovered", name, task_id, attempts=task.attempts)
+                        )
+                        task.attempts, task.next_attempt, task.exhausted = 0, 0.0, False
+                    continue
+
+                if task is None:
+                    task = self.tasks[key] = _TaskState()
+                task.running_since = None
+                while task.restarts and task.restarts[0] <= now - self.window:
+                    task.restarts.popleft()
+                if len(task.restarts) >= self.max_restarts:
+                    if not task.exhausted:
+                        task.exhausted = True
+                        retry_in = task.restarts[0] + self.window - now
+                        events.append(
+                            self.__event("budget_exhausted", name, task_id, retry_in=retry_in)
+                        )
+                    continue
+                task.exhausted = False
+                if task.next_attempt <= now and len(due) < self.max_restarts_per_pass:
+                    due.append((name, task_id, worker_id))
+
+        if due:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(due))) as executor:
+                errors = list(executor.map(lambda d: self.__restart(d[0], d[1]), due))
+            now = self.clock()
+            for (name, task_id, worker_id), error in zip(due, errors):
+                task = self.tasks[(name, task_id)]
+                task.attempts += 1
+                task.next_attempt = now + self.delay(task.attempts)
+                fields = dict(worker_id=worker_id, attempt=task.attempts)
+                if error is None:
+                    # Only the restarts that were accepted count against the budget
+                    task.restarts.append(now)
+                    event = self.__event("restarted", name, task_id, **fields)
+                else:
+                    self.logger.warning(
+                        f"Failed to restart {task_id} task of {name} connector: {error}"
+                    )
+                    event = self.__event(
+                        "restart_failed", name, task_id, error=str(error), **fields
+                    )
+                event["restarts"] = self.max_restarts - len(task.restarts)
+                event["next_attempt"] = self.delay(task.attempts)
+                events.append(event)
+
+        # Forget the tasks that are healthy or gone once their restarts have left the window
+        for key in [
+            key for key, task in self.tasks.items() if not task.attempts or key not in seen
+        ]:
+            task = self.tasks[key]
+            if not task.restarts or task.restarts[-1] <= now - self.window:
+                del self.tasks[key]
+
+        timestamp = time.time()
+        for event in events:
+            event["timestamp"] = timestamp
+        return events
+
+    def run(self):
+        """Heal the cluster every `interval` seconds until the generator is closed.
+        Failed passes are logged and retried after the interval.
+        Yields:
+            Dict[str, Any]: The events returned by `heal`.
+        """
+        while True:
+            try:
+                yield from self.heal()
+            except RequestException as e:
+                self.logger.warning(f"Failed to poll connector statuses: {e}")
+            self.sleep(self.interval)
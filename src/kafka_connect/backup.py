@@ -0,0 +1,160 @@
+from .codec import loads
+from urllib.parse import quote
+
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import time
+
+# The version of the layout written by `write_backup`
+FORMAT = 1
+
+ARCHIVE_EXTENSIONS = (".tar.gz", ".tgz")
+
+
+def is_archive(path):
+    """Tell whether a backup path names a compressed archive rather than a directory.
+    Args:
+        path (str): The path of the backup.
+    Returns:
+        bool: Whether the path ends with `.tar.gz` or `.tgz`.
+    """
+    return path.endswith(ARCHIVE_EXTENSIONS)
+
+
+def _pretty(obj):
+    # Indented, sorted JSON keeps the backups readable and diffable between exports
+    return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False).encode()
+
+
+def backup_files(backup):
+    """Lay out a backup as the files of a directory.
+    Each connector is written to `connectors/<name>.json` in the `{"name": ..., "config": {...}}` form, so that
+    the directory can also be passed to `kc apply`. Names are percent-encoded to be safe file names.
+    Args:
+        backup (Dict[str, Any]): The `manifest` and the `connectors` keyed by name, as returned by
+            `KafkaConnect.export_connectors`.
+    Returns:
+        Dict[str, bytes]: The content of each file keyed by its relative path.
+    """
+    files = {"manifest.json": _pretty({"format": FORMAT, **backup["manifest"]})}
+    for name, connector in backup["connectors"].items():
+        files[f"connectors/{quote(name, safe='')}.json"] = _pretty(connector)
+    return files
+
+
+def is_backup(path):
+    """Tell whether a path holds a backup written by `write_backup`, in a format this version can read.
+    Args:
+        path (str): The path of the archive or the directory.
+    Returns:
+        bool: Whether the path has a `manifest.json` with a known `format`.
+    """
+    try:
+        if os.path.isdir(path):
+            with open(os.path.join(path, "manifest.json"), "rb") as f:
+                manifest = loads(f.read())
+        else:
+            with tarfile.open(path, "r:*") as tar:
+                manifest = loads(tar.extractfile("manifest.json").read())
+    except (OSError, KeyError, ValueError, tarfile.TarError):
+        return False
+    return isinstance(manifest, dict) and manifest.get("format") == FORMAT
+
+
+def write_backup(path, backup, overwrite=False):
+    """Write a backup to a compressed archive or to a directory.
+    The backup is written to a temporary path first and then moved into place, so an interrupted export never
+    leaves a partial backup behind.
+    Args:
+        path (str): A path ending with `.tar.gz` or `.tgz` for an archive, or else a directory.
+        backup (Dict[str, Any]): The `manifest` and the `connectors` keyed by name.
+        overwrite (bool): Whether to replace an existing backup. Anything else at the path is never replaced.
+            Defaults to False.
+    Raises:
+        FileExistsError: If the path exists and either `overwrite` is False or it is not a backup.
+    """
+    if os.path.exists(path):
+        if not overwrite:
+            raise FileExistsError(f"{path} already exists.")
+        if not is_backup(path):
+            raise FileExistsError(
+                f"{path} already exists and is not a backup, so it is not replaced."
+            )
+    files = backup_files(backup)
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+
+    if is_archive(path):
+        fd, tmp = tempfile.mkstemp(dir=parent, prefix=".kc-export-")
+        try:
+            # The lowest compression level keeps thousands of small files fast to write
+            with os.fdopen(fd, "wb") as f, tarfile.open(
+                fileobj=f, mode="w:gz", compresslevel=1
+            ) as tar:
+                mtime = time.time()
+                for name, content in files.items():
+                    info = tarfile.TarInfo(name)
+                    info.size, info.mtime = len(content), mtime
+                    tar.addfile(info, io.BytesIO(content))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return
+
+    tmp = tempfile.mkdtemp(dir=parent, prefix=".kc-export-")
+    try:
+        os.mkdir(os.path.join(tmp, "connectors"))
+        for name, content in files.items():
+            with open(os.path.join(tmp, name), "wb") as f:
+                f.write(content)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.rename(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def read_backup(path, pattern=None):
+    """Read a backup written by `write_backup`.
+    Args:
+        path (str): The path of the archive or the directory.
+        pattern (str): Only read the connectors that match the regex pattern. Defaults to every connector.
+    Returns:
+        Dict[str, Any]: The `manifest` and the `connectors` keyed by name.
+    Raises:
+        ValueError: If the backup has no manifest or was written in an unknown format.
+    """
+    files = {}
+    if os.path.isdir(path):
+        for directory, _, filenames in os.walk(path):
+            for filename in filenames:
+                full_path = os.path.join(directory, filename)
+                with open(full_path, "rb") as f:
+                    files[os.path.relpath(full_path, path).replace(os.sep, "/")] = f.read()
+    else:
+        with tarfile.open(path, "r:*") as tar:
+            for member in tar:
+                if member.isfile():
+                    files[member.name] = tar.extractfile(member).read()
+
+    if "manifest.json" not in files:
+        raise ValueError(f"{path} is not a backup: it has no manifest.json.")
+    manifest = loads(files.pop("manifest.json"))
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"{path} was written in an unknown format: {manifest.get('format')}.")
+
+    connectors = {}
+    for name, content in sorted(files.items()):
+        if not (name.startswith("connectors/") and name.endswith(".json")):
+            continue
+        connector = loads(content)
+        if pattern is None or re.match(pattern, connector["name"]):
+            connectors[connector["name"]] = connector
+    return {"manifest": manifest, "connectors": connectors}
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+
+import copy
+import functools
+import inspect
+import threading
+import time
+
+
+class TTLCache:
+    """A thread-safe, size-bounded LRU cache whose entries expire after a per-endpoint time-to-live.
+    Entries are keyed by endpoint method name and arguments, and can be evicted per connector. Every call returns its
+    own copy of the value, so callers may mutate it without corrupting the cache.
+    Args:
+        ttl (float): The default number of seconds an entry stays fresh. Defaults to 30.
+        ttls (Dict[str, float]): Per-endpoint overrides of `ttl`, keyed by method name such as `list_connector_plugins`.
+        maxsize (int): The maximum number of entries to keep. Defaults to 1024.
+        clock (Callable[[], float]): The monotonic clock used to expire entries. Defaults to `time.monotonic`.
+    """
+
+    def __init__(self, ttl=30, ttls=None, maxsize=1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Bumped by `invalidate`, so that a value loaded while its connector was mutated is not stored
+        self._generation = 0
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def __generation(self, args):
+        return self._generation, self._generations.get(args[:1])
+
+    def get_or_load(self, endpoint, args, load):
+        """Return the fresh cached value for an endpoint call, loading and storing it on a miss.
+        Args:
+            endpoint (str): The name of the endpoint method.
+            args (Tuple[Any, ...]): The arguments of the call. The first argument is the connector name, if any.
+            load (Callable[[], Any]): Fetches the value on a miss. Exceptions are raised and never cached.
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        key = (endpoint, args)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+            generation = self.__generation(args)
+
+        value = load()
+        expires = self.clock() + self.ttls.get(endpoint, self.ttl)
+        with self._lock:
+            # A value loaded while the connector was mutated may predate the change, so it is returned but not stored
+            if self.__generation(args) == generation:
+                self._entries[key] = (expires, copy.deepcopy(value))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, connector=None):
+        """Evict the entries of a connector, or every entry when no connector is given.
+        Args:
+            connector (str): The name of the connector. Defaults to `None`.
+        """
+        with self._lock:
+            if connector is None:
+                self._generation += 1
+                self._generations.clear()
+                self._entries.clear()
+                return
+            self._generations[(connector,)] = self._generations.get((connector,), 0) + 1
+            for key in [key for key in self._entries if key[1][:1] == (connector,)]:
+                del self._entries[key]
+
+    def stats(self):
+        """Get the cache counters.
+        Returns:
+            Dict[str, int]: The number of hits, misses and entries.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def cached(method):
+    """Serve a read endpoint method from the client's `cache`, if it has one."""
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.cache is None:
+            return method(self, *args, **kwargs)
+        # Bind keyword arguments to their positions, so that `connector="x"` and `"x"` share an entry
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        args = bound.args[1:]
+        return self.cache.get_or_load(method.__name__, args, lambda: method(self, *args))
+
+    return wrapper
+
+
+def evicts(method):
+    """Evict the cached entries of the connector passed as the first argument of a mutating method."""
+
+    @functools.wraps(method)
+    def wrapper(self, connector, *args, **kwargs):
+        try:
+            return method(self, connector, *args, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(connector)
+
+    return wrapper
@@ -1,12 +1,11 @@
-from .kafka_connect import KafkaConnect
+# Only modules needed to parse the command line are imported up front, so that `kc --help` and `kc --version`
+# start quickly. The client and its dependencies, such as requests, are imported once a command runs.
+from .codec import dumps, loads
 
 import click
 import json
 import os
-import logging
-import requests
-import traceback
-import urllib3
+import sys
 
 
 class CatchAllExceptions(click.Group):
@@ -20,13 +19,12 @@ class CatchAllExceptions(click.Group):
     def __call__(self, *args, **kwargs):
         try:
             return self.main(*args, **kwargs)
-        except (
-            requests.exceptions.RequestException,
-            urllib3.exceptions.HTTPError,
-        ) as e:
-            click.echo(e)
         except Exception as e:
-            if os.environ.get("KAFKA_CONNECT_ENABLE_TRACEBACK", "false").lower() == "true":
+            if is_request_error(e):
+                click.echo(e)
+            elif os.environ.get("KAFKA_CONNECT_ENABLE_TRACEBACK", "false").lower() == "true":
+                import traceback
+
                 click.echo(traceback.print_exc())
             else:
                 click.echo(
@@ -41,6 +39,38 @@ class CatchAllExceptions(click.Group):
                 )
 
 
+def is_request_error(e):
+    """Check whether an exception was raised by requests or urllib3.
+
+    Args:
+        e (Exception): The exception.
+
+    Returns:
+        bool: Whether the exception is a request error. Neither library is imported to find out, since an
+            exception can only come from them once they are imported.
+    """
+    requests = sys.modules.get("requests")
+    urllib3 = sys.modules.get("urllib3")
+    return bool(
+        (requests and isinstance(e, requests.exceptions.RequestException))
+        or (urllib3 and isinstance(e, urllib3.exceptions.HTTPError))
+    )
+
+
+def is_fleet(kafka_connect):
+    """Check whether a client runs commands on several clusters.
+
+    Args:
+        kafka_connect (KafkaConnect or KafkaConnectFleet): The client.
+
+    Returns:
+        bool: Whether the client is a `KafkaConnectFleet`.
+    """
+    from .fleet import KafkaConnectFleet
+
+    return isinstance(kafka_connect, KafkaConnectFleet)
+
+
 def get_logger(log_level="NOTSET"):
     """Get a logger configured to write to the console.
 
@@ -52,6 +82,8 @@ def get_logger(log_level="NOTSET"):
         A logger configured to write log messages with a level equal to or higher
         than `log_level` to the console.
     """
+    import logging
+
     # create logger
     logger = logging.getLogger("kafka-connect")
     log_level_number = logging.getLevelName(log_level.upper())
@@ -73,17 +105,178 @@ def get_logger(log_level="NOTSET"):
     return logger
 
 
+# The sub-commands that fan out to several clusters selected with --cluster
+FLEET_COMMANDS = ("info", "list", "status", "restart", "restart-failed", "pause", "resume", "stop", "delete")
+
+
+def find_failures(responses, prefix=""):
+    """Find the failures of a bulk operation, including those nested in the per-cluster results of a fleet.
+
+    Args:
+        responses (Dict[str, Any]): The responses of a bulk operation, keyed by connector or cluster name.
+        prefix (str): The prefix of the keys of the failures. Defaults to "".
+
+    Returns:
+        Dict[str, str]: The error messages keyed by connector name, or by `cluster/connector` for a fleet.
+    """
+    failures = {}
+    for key, resp in responses.items():
+        if isinstance(resp, Exception):
+            failures[prefix + key] = str(resp)
+        elif isinstance(resp, dict):
+            failures.update(find_failures(resp, f"{prefix}{key}/"))
+    return failures
+
+
+def raise_for_failures(responses):
+    """Raise an error naming the connectors that failed during a bulk operation.
+
+    Args:
+        responses (Dict[str, Any]): The responses of a bulk operation, keyed by connector name.
+
+    Raises:
+        click.ClickException: If any of the responses is an exception.
+    """
+    failures = find_failures(responses)
+    if failures:
+        raise click.ClickException(f"Failed for {len(failures)} connector(s): {dumps(failures)}")
+
+
+def echo_results(response):
+    """Print a response as JSON, reporting the clusters of a fleet that failed as errors.
+
+    Args:
+        response (Any): The response, or the results of a fleet keyed by cluster name.
+
+    Raises:
+        click.ClickException: If the operation failed for any cluster of a fleet.
+    """
+    click.echo(dumps(response, default=lambda e: {"error": str(e)}))
+    failures = [key for key, resp in response.items() if isinstance(resp, Exception)] if isinstance(response, dict) else []
+    if failures:
+        raise click.ClickException(f"Failed for {len(failures)} cluster(s): {', '.join(failures)}")
+
+
+def echo_connectors(kafka_connect, response, output="json"):
+    """Print listed connectors as JSON, or as newline-delimited JSON with one connector per line.
+
+    Args:
+        kafka_connect (KafkaConnect or KafkaConnectFleet): The client that listed the connectors.
+        response (Any): The listed connectors, or the listed connectors of a fleet keyed by cluster name.
+        output (str): The output format, either "json" or "ndjson". Defaults to "json".
+
+    Raises:
+        click.ClickException: If listing the connectors failed for any cluster of a fleet.
+    """
+    if output == "json":
+        return echo_results(response)
+    clusters = response.items() if is_fleet(kafka_connect) else [(None, response)]
+    failures = []
+    for cluster, connectors in clusters:
+        record = {"cluster": cluster} if cluster else {}
+        if isinstance(connectors, Exception):
+            click.echo(dumps({**record, "error": str(connectors)}))
+            failures.append(cluster)
+            continue
+        items = connectors.items() if isinstance(connectors, dict) else ((name, {}) for name in connectors)
+        for name, data in items:
+            click.echo(dumps({**record, "name": name, **data}))
+    if failures:
+        raise click.ClickException(f"Failed for {len(failures)} cluster(s): {', '.join(failures)}")
+
+
+def echo_outcome(connector, response, cluster=None):
+    """Print the outcome of a bulk operation for a single connector as a line of JSON.
+
+    Args:
+        connector (str): The name of the connector.
+        response (Any): The response, or the raised exception, for the connector.
+        cluster (str): The name of the cluster of the connector, for a fleet. Defaults to `None`.
+    """
+    record = {"cluster": cluster} if cluster else {}
+    record["name"] = connector
+    if isinstance(response, Exception):
+        record["error"] = str(response)
+    else:
+        record["response"] = response
+    click.echo(dumps(record))
+
+
+def outcome_callback(kafka_connect, output):
+    """Get the callback that streams the outcomes of a bulk operation as they complete.
+
+    Args:
+        kafka_connect (KafkaConnect or KafkaConnectFleet): The client running the bulk operation.
+        output (str): The output format, either "json" or "ndjson".
+
+    Returns:
+        Callable: The callback for `ndjson` output, or `None` for `json` output.
+    """
+    if output != "ndjson":
+        return None
+    if is_fleet(kafka_connect):
+        return lambda cluster, connector, response: echo_outcome(connector, response, cluster)
+    return echo_outcome
+
+
+def require_single_cluster(kafka_connect):
+    """Reject acting on a single connector when several clusters are selected.
+
+    Args:
+        kafka_connect (KafkaConnect or KafkaConnectFleet): The client of the selected clusters.
+
+    Raises:
+        click.UsageError: If several clusters are selected.
+    """
+    if is_fleet(kafka_connect):
+        raise click.UsageError("The --all option is required when several clusters are selected")
+
+
 @click.group(cls=CatchAllExceptions)
 @click.version_option(package_name="kafka-connect-py", prog_name="kc|kafka-connect")
-@click.option("--url", "-u", default="http://localhost:8083", metavar="URL", envvar="KAFKA_CONNECT_URL", show_envvar=True, help="The base URL for the Kafka Connect REST API.")
+@click.option("--url", "-u", default="http://localhost:8083", metavar="URL[,URL...]", envvar="KAFKA_CONNECT_URL", show_envvar=True, help="The base URL for the Kafka Connect REST API. Pass a comma-delimited list of the workers of a cluster to spread reads over them and fail over between them.")
+@click.option("--strategy", type=click.Choice(["round-robin", "least-latency"]), default="round-robin", envvar="KAFKA_CONNECT_STRATEGY", show_envvar=True, help="How to spread requests over several workers.")
 @click.option("--auth", "-a", metavar="USERNAME:PASSWORD", envvar="KAFKA_CONNECT_BASIC_AUTH", show_envvar=True, help="A colon-delimited string of `username` and `password` to use for authenticating with the Kafka Connect REST API.")
 @click.option("--ssl-verify/--no-ssl-verify", "-s", default=True, is_flag=True, envvar="KAFKA_CONNECT_SSL_VERIFY", show_envvar=True, help="Whether to verify the SSL certificate when making requests to the Kafka Connect REST API.")
 @click.option("--log-level", "-l", type=click.Choice( ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"], case_sensitive=False, ), default="NOTSET", metavar="LEVEL", envvar="KAFKA_CONNECT_LOG_LEVEL", show_envvar=True, help="The logging level to use for the logger and console handler.")
+@click.option("--retries", type=click.IntRange(min=0), default=0, metavar="N", envvar="KAFKA_CONNECT_RETRIES", show_envvar=True, help="The number of times to retry a request that fails with a 500 or 503 status code, a 409 during a rebalance, or a connection error.")
+@click.option("--retry-backoff", type=click.FloatRange(min=0), default=0.5, metavar="SECONDS", envvar="KAFKA_CONNECT_RETRY_BACKOFF", show_envvar=True, help="The maximum delay before the first retry. The delay doubles with every retry, with full jitter, up to 30 seconds.")
+@click.option("--max-rps", type=click.FloatRange(min=0, min_open=True), default=None, metavar="RATE", envvar="KAFKA_CONNECT_MAX_RPS", show_envvar=True, help="The maximum number of requests per second sent to the Kafka Connect REST API.")
+@click.option("--max-inflight", type=click.IntRange(min=1), default=None, metavar="N", envvar="KAFKA_CONNECT_MAX_INFLIGHT", show_envvar=True, help="The maximum number of concurrent requests sent to the Kafka Connect REST API.")
+@click.option("--slow-request-threshold", type=click.FloatRange(min=0), default=None, metavar="SECONDS", envvar="KAFKA_CONNECT_SLOW_REQUEST_THRESHOLD", show_envvar=True, help="Log a warning for every request that takes longer than this.")
+@click.option("--cluster", "-c", "clusters", multiple=True, metavar="NAME", envvar="KAFKA_CONNECT_CLUSTER", show_envvar=True, help="The name of a cluster of the clusters file to use instead of --url. Repeat, or pass a shell-style pattern such as 'prod-*', to run the command on several clusters concurrently.")
+@click.option("--clusters-file", type=click.Path(dir_okay=False), default=None, metavar="PATH", envvar="KAFKA_CONNECT_CLUSTERS_FILE", show_envvar=True, help="The JSON file of named clusters. Defaults to $XDG_CONFIG_HOME/kafka-connect/clusters.json.")
+@click.option("--cache/--no-cache", default=False, envvar="KAFKA_CONNECT_CACHE", show_envvar=True, help="Whether to cache the cluster info and the connector plugins on disk, under $XDG_CACHE_HOME/kafka-connect, across invocations. The plugins are refetched whenever the cluster version or commit changes.")
+@click.option("--refresh", is_flag=True, default=False, help="Refetch the cached cluster info and connector plugins and update the on-disk cache.")
 @click.pass_context
-def cli(ctx, url, auth, ssl_verify, log_level):
+def cli(ctx, url, strategy, auth, ssl_verify, log_level, retries, retry_backoff, max_rps, max_inflight, slow_request_threshold, clusters, clusters_file, cache, refresh):
     """A command-line client for the Confluent Platform Kafka Connect REST API."""
+    from .disk_cache import DiskCache
+    from .fleet import KafkaConnectFleet, default_clusters_file, load_clusters, select_clusters
+    from .hooks import SlowRequestLogger
+    from .kafka_connect import KafkaConnect
+    from .retry import RetryPolicy
+
     logger = get_logger(log_level)
-    kafka_connect = KafkaConnect(url, auth, ssl_verify, logger)
+    retry = RetryPolicy(max_attempts=retries + 1, base_delay=retry_backoff) if retries else None
+    disk_cache = DiskCache(refresh=refresh) if cache or refresh else None
+    hooks = [SlowRequestLogger(slow_request_threshold, logger=logger)] if slow_request_threshold is not None else None
+    options = dict(auth=auth, ssl_verify=ssl_verify, logger=logger, retry=retry, max_rps=max_rps, max_inflight=max_inflight, strategy=strategy, disk_cache=disk_cache, hooks=hooks)
+    if not clusters:
+        kafka_connect = KafkaConnect(url, **options)
+    else:
+        clusters_file = clusters_file or default_clusters_file()
+        try:
+            selected = select_clusters(load_clusters(clusters_file), clusters)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--cluster")
+        if len(clusters) == 1 and clusters[0] in selected:
+            kafka_connect = KafkaConnect(**{**options, **selected[clusters[0]]})
+        else:
+            if ctx.invoked_subcommand not in FLEET_COMMANDS:
+                raise click.UsageError(f"Only the {', '.join(FLEET_COMMANDS)} commands support several clusters")
+            kafka_connect = KafkaConnectFleet(selected, **options)
+    ctx.call_on_close(kafka_connect.close)
     ctx.obj = kafka_connect
 
 
@@ -92,18 +285,88 @@ def cli(ctx, url, auth, ssl_verify, log_level):
 def info(kafka_connect):
     """Get the version and other details of the Kafka Connect cluster."""
     cluster = kafka_connect.get_cluster_info()
-    click.echo(json.dumps(cluster))
+    echo_results(cluster)
 
 
 @cli.command()
-@click.option("-e", "--expand", type=click.Choice(["status", "info"]), show_envvar=True, help="Whether to retrieve additional information about the connectors.")
+@click.option("-e", "--expand", type=click.Choice(["status", "info"]), multiple=True, show_envvar=True, help="Whether to retrieve additional information about the connectors. Repeat to fetch both in a single request.")
 @click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will list only the connectors that match.")
 @click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will list only the connectors that match.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
 @click.pass_obj
-def list(kafka_connect, expand, pattern, state):
+def list(kafka_connect, expand, pattern, state, output):
     """Get a list of active connectors."""
+    if output == "ndjson" and not is_fleet(kafka_connect):
+        # Print each connector as soon as it is decoded rather than once the whole listing has arrived
+        for name, data in kafka_connect.stream_connectors(expand=expand, pattern=pattern, state=state):
+            click.echo(dumps({"name": name, **data}))
+        return
     response = kafka_connect.list_connectors(expand=expand, pattern=pattern, state=state)
-    click.echo(json.dumps(response))
+    echo_connectors(kafka_connect, response, output)
+
+
+@cli.command()
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will watch only the connectors that match.")
+@click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will print only the transitions from or to it.")
+@click.option("--min-interval", type=click.FloatRange(min=0.1), default=1, show_default=True, metavar="SECONDS", help="The shortest time between polls, used right after a change.")
+@click.option("--max-interval", type=click.FloatRange(min=0.1), default=30, show_default=True, metavar="SECONDS", help="The longest time between polls, reached while the cluster is stable.")
+@click.option("--initial/--no-initial", default=True, show_default=True, help="Whether to print the states found by the first poll.")
+@click.pass_obj
+def watch(kafka_connect, pattern, state, min_interval, max_interval, initial):
+    """Stream connector and task state transitions as newline-delimited JSON."""
+    try:
+        for event in kafka_connect.watch(pattern=pattern, state=state, min_interval=min_interval, max_interval=max_interval, initial=initial):
+            click.echo(dumps(event))
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.option("--port", type=click.IntRange(0, 65535), default=9400, show_default=True, envvar="KAFKA_CONNECT_EXPORTER_PORT", show_envvar=True, help="The port to serve /metrics on.")
+@click.option("--host", default="", metavar="ADDRESS", help="The address to listen on. Defaults to every address.")
+@click.option("--interval", type=click.FloatRange(min=1), default=15, show_default=True, metavar="SECONDS", help="The time between polls of the connector states.")
+@click.pass_obj
+def exporter(kafka_connect, port, host, interval):
+    """Serve the connector and task states as Prometheus metrics on /metrics. The states are polled in the background, and scrapes are answered from the last poll."""
+    from .exporter import ConnectorStateExporter
+    from .metrics import RequestMetrics
+
+    # Export the latency of the polls along with the states
+    if kafka_connect.metrics is None:
+        kafka_connect.metrics = RequestMetrics()
+    state_exporter = ConnectorStateExporter(kafka_connect, interval=interval)
+    httpd = state_exporter.server(host, port)
+    state_exporter.start()
+    click.echo(f"Serving metrics on http://{host or '0.0.0.0'}:{httpd.server_address[1]}/metrics", err=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        state_exporter.stop()
+        httpd.server_close()
+
+
+@cli.command()
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will heal only the connectors that match.")
+@click.option("--interval", type=click.FloatRange(min=1), default=10, show_default=True, metavar="SECONDS", help="The time between polls of the connector statuses.")
+@click.option("--base-delay", type=click.FloatRange(min=0), default=10, show_default=True, metavar="SECONDS", help="The time to wait after the first restart of a task, doubled after every further restart.")
+@click.option("--max-delay", type=click.FloatRange(min=0), default=600, show_default=True, metavar="SECONDS", help="The longest time to wait between restarts of a task.")
+@click.option("--max-restarts", type=click.IntRange(min=1), default=5, show_default=True, metavar="N", help="The most restarts of a task in the window.")
+@click.option("--window", type=click.FloatRange(min=1), default=3600, show_default=True, metavar="SECONDS", help="The sliding window of the restart budget of each task.")
+@click.option("--healthy-after", type=click.FloatRange(min=0), default=300, show_default=True, metavar="SECONDS", help="The time a task must be running to reset its backoff.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=4, show_default=True, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of tasks to restart concurrently.")
+@click.pass_obj
+def autoheal(kafka_connect, pattern, interval, base_delay, max_delay, max_restarts, window, healthy_after, parallelism):
+    """Restart failed tasks with a per-task exponential backoff and restart budget. Streams every restart, exhausted budget and recovery as newline-delimited JSON."""
+    from .autoheal import AutoHealer
+
+    healer = AutoHealer(kafka_connect, pattern=pattern, interval=interval, base_delay=base_delay, max_delay=max_delay, max_restarts=max_restarts, window=window, healthy_after=healthy_after, max_workers=parallelism)
+    try:
+        for event in healer.run():
+            click.echo(dumps(event))
+    except KeyboardInterrupt:
+        pass
 
 
 @cli.command()
@@ -114,9 +377,9 @@ def create(kafka_connect, config_file, config_data):
     """Create a new connector, returning the current connector info if successful. Return 409 (Conflict) if rebalance is in process, or if the connector already exists."""
     try:
         if config_file:
-            config_data = json.loads(config_file.read())
+            config_data = loads(config_file.read())
         elif config_data:
-            config_data = json.loads(config_data)
+            config_data = loads(config_data)
         else:
             raise click.UsageError("One of --config-file or --config-data is required")
     except json.JSONDecodeError as e:
@@ -124,7 +387,7 @@ def create(kafka_connect, config_file, config_data):
         return None
     
     response = kafka_connect.create_connector(config_data)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -136,9 +399,9 @@ def update(kafka_connect, connector, config_file, config_data):
     """Create a new connector using the given configuration, or update the configuration for an existing connector. Returns information about the connector after the change has been made. Return 409 (Conflict) if rebalance is in process."""
     try:
         if config_file:
-            config_data = json.loads(config_file.read())
+            config_data = loads(config_file.read())
         elif config_data:
-            config_data = json.loads(config_data)
+            config_data = loads(config_data)
         else:
             raise click.UsageError("One of --config-file or --config-data is required")
     except json.JSONDecodeError as e:
@@ -146,7 +409,7 @@ def update(kafka_connect, connector, config_file, config_data):
         return None
     
     response = kafka_connect.update_connector(connector, config_data)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -155,7 +418,7 @@ def update(kafka_connect, connector, config_file, config_data):
 def get(kafka_connect, connector):
     """Gets the details of a connector or all connectors matching a certain pattern."""
     response = kafka_connect.get_connector(connector)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -164,7 +427,7 @@ def get(kafka_connect, connector):
 def config(kafka_connect, connector):
     """Gets the config of a connector."""
     response = kafka_connect.get_connector_config(connector)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -173,7 +436,7 @@ def config(kafka_connect, connector):
 def status(kafka_connect, connector):
     """Gets the status of a connector."""
     response = kafka_connect.get_connector_status(connector)
-    click.echo(json.dumps(response))
+    echo_results(response)
 
 
 @cli.command()
@@ -183,36 +446,64 @@ def status(kafka_connect, connector):
 @click.option("-a", "--all", is_flag=True, default=False, show_envvar=True, help="Whether to restart all connectors.")
 @click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will restart only the connectors that match when the --all option is set.")
 @click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will list only the connectors that match.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to act on concurrently when the --all option is set.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
 @click.pass_obj
-def restart(kafka_connect, connector, include_tasks, only_failed, all, pattern, state):
+def restart(kafka_connect, connector, include_tasks, only_failed, all, pattern, state, parallelism, output):
     """Restart a connector or all connectors matching a certain pattern."""
     if all:
         response = kafka_connect.restart_all_connectors(
-            include_tasks=include_tasks, only_failed=only_failed, pattern=pattern
-        )
-        click.echo(
-            json.dumps(kafka_connect.list_connectors(expand="status", pattern=pattern, state=state))
+            include_tasks=include_tasks, only_failed=only_failed, pattern=pattern, state=state, max_workers=parallelism, callback=outcome_callback(kafka_connect, output)
         )
+        raise_for_failures(response)
+        if output == "json":
+            echo_results(kafka_connect.list_connectors(expand="status", pattern=pattern, state=state))
     elif connector:
+        require_single_cluster(kafka_connect)
         response = kafka_connect.restart_connector(
             connector, include_tasks=include_tasks, only_failed=only_failed
         )
-        click.echo(json.dumps(kafka_connect.get_connector_status(connector)))
+        click.echo(dumps(kafka_connect.get_connector_status(connector)))
     else:
         raise click.UsageError("One of connector or --all is required")
 
 
+@cli.command()
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will restart only the connectors that match.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to restart concurrently.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
+@click.pass_obj
+def restart_failed(kafka_connect, pattern, parallelism, output):
+    """Restart every failed connector and task, found with a single status listing. Prints the failed connector instance and task IDs restarted for each connector."""
+    import time
+
+    start = time.perf_counter()
+    response = kafka_connect.restart_failed_tasks(pattern=pattern, max_workers=parallelism, callback=outcome_callback(kafka_connect, output))
+    elapsed = time.perf_counter() - start
+
+    clusters = response.values() if is_fleet(kafka_connect) else [response]
+    restarted = [result for results in clusters if isinstance(results, dict) for result in results.values() if isinstance(result, dict)]
+    click.echo(f"Restarted {sum(result['connector'] for result in restarted)} connector(s) and {sum(len(result['tasks']) for result in restarted)} task(s) in {elapsed:.2f}s", err=True)
+    if output == "json":
+        echo_results(response)
+    raise_for_failures(response)
+
+
 @cli.command()
 @click.argument("connector", required=False)
 @click.option("-a", "--all", is_flag=True, default=False, show_envvar=True, help="Whether to pause all connectors.")
 @click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will pause only the connectors that match when the --all option is set.")
 @click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will list only the connectors that match.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to act on concurrently when the --all option is set.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
 @click.pass_obj
-def pause(kafka_connect, connector, all, pattern, state):
+def pause(kafka_connect, connector, all, pattern, state, parallelism, output):
     """Pauses a connector or all connectors that match a certain pattern."""
     if all:
-        response = kafka_connect.pause_all_connectors(pattern=pattern, state=state)
+        response = kafka_connect.pause_all_connectors(pattern=pattern, state=state, max_workers=parallelism, callback=outcome_callback(kafka_connect, output))
+        raise_for_failures(response)
     elif connector:
+        require_single_cluster(kafka_connect)
         response = kafka_connect.pause_connector(connector)
     else:
         raise click.UsageError("One of connector or --all is required")
@@ -223,40 +514,127 @@ def pause(kafka_connect, connector, all, pattern, state):
 @click.option("-a", "--all", is_flag=True, default=False, show_envvar=True, help="Whether to resume all connectors.")
 @click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will resume only the connectors that match when the --all option is set.")
 @click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will list only the connectors that match.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to act on concurrently when the --all option is set.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
 @click.pass_obj
-def resume(kafka_connect, connector, all, pattern, state):
+def resume(kafka_connect, connector, all, pattern, state, parallelism, output):
     """Resumes a connector or all connectors that match a certain pattern."""
     if all:
-        response = kafka_connect.resume_all_connectors(pattern=pattern, state=state)
+        response = kafka_connect.resume_all_connectors(pattern=pattern, state=state, max_workers=parallelism, callback=outcome_callback(kafka_connect, output))
+        raise_for_failures(response)
     elif connector:
+        require_single_cluster(kafka_connect)
         response = kafka_connect.resume_connector(connector)
     else:
         raise click.UsageError("One of connector or --all is required")
 
 
+@cli.command()
+@click.argument("connector", required=False)
+@click.option("-a", "--all", is_flag=True, default=False, show_envvar=True, help="Whether to stop all connectors.")
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will stop only the connectors that match when the --all option is set.")
+@click.option("-s", "--state", type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False), default=None, metavar="STATE", show_envvar=True, help="The state that will list only the connectors that match.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to act on concurrently when the --all option is set.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
+@click.pass_obj
+def stop(kafka_connect, connector, all, pattern, state, parallelism, output):
+    """Stops a connector or all connectors that match a certain pattern."""
+    if all:
+        response = kafka_connect.stop_all_connectors(pattern=pattern, state=state, max_workers=parallelism, callback=outcome_callback(kafka_connect, output))
+        raise_for_failures(response)
+    elif connector:
+        require_single_cluster(kafka_connect)
+        response = kafka_connect.stop_connector(connector)
+    else:
+        raise click.UsageError("One of connector or --all is required")
+
+
 @cli.command()
 @click.argument("connector", required=False)
 @click.option("-a","--all",is_flag=True,default=False,show_envvar=True,help="Whether to delete all connectors.")
 @click.option("-p","--pattern",default=None,metavar="REGEX",show_envvar=True,help="The regex pattern that will delete only the connectors that match when the --all option is set.")
 @click.option("-s","--state",type=click.Choice(["RUNNING", "PAUSED", "UNASSIGNED", "FAILED"], case_sensitive=False),default=None,metavar="STATE",show_envvar=True,help="The state that will list only the connectors that match.")
+@click.option("--parallelism",type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM",show_envvar=True,help="The maximum number of connectors to act on concurrently when the --all option is set.")
+@click.option("--output", type=click.Choice(["json", "ndjson"]), default="json", show_default=True, envvar="KAFKA_CONNECT_OUTPUT", show_envvar=True, help="The output format. ndjson writes one connector per line as soon as it is processed.")
 @click.pass_obj
-def delete(kafka_connect, connector, all, pattern, state):
+def delete(kafka_connect, connector, all, pattern, state, parallelism, output):
     """Deletes a connector or all connectors that match a certain pattern."""
     if all:
-        response = kafka_connect.delete_all_connectors(pattern=pattern, state=state)
+        response = kafka_connect.delete_all_connectors(pattern=pattern, state=state, max_workers=parallelism, callback=outcome_callback(kafka_connect, output))
+        raise_for_failures(response)
     elif connector:
+        require_single_cluster(kafka_connect)
         response = kafka_connect.delete_connector(connector)
     else:
         raise click.UsageError("One of connector or --all is required")
 
 
+@cli.command()
+@click.option("-d", "--directory", required=True, type=click.Path(exists=True, file_okay=False), help="The directory of connector configuration JSON files.")
+@click.option("--prune", is_flag=True, default=False, help="Whether to delete the connectors that are not configured in the directory.")
+@click.option("--dry-run", is_flag=True, default=False, help="Whether to only print the plan without changing any connector.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to change concurrently.")
+@click.pass_obj
+def apply(kafka_connect, directory, prune, dry_run, parallelism):
+    """Create, update and optionally delete connectors so that the cluster matches a directory of configurations. Only connectors whose configuration changed are updated."""
+    from .apply import load_connector_configs
+
+    configs = load_connector_configs(directory)
+    plan = kafka_connect.apply_connectors(configs, prune=prune, dry_run=dry_run, max_workers=parallelism)
+    failed = plan.pop("failed")
+    click.echo(dumps(plan))
+    raise_for_failures(failed)
+
+
+@cli.command("export")
+@click.argument("path", type=click.Path())
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will export only the connectors that match.")
+@click.option("-i", "--include", type=click.Choice(["status", "tasks", "topics"]), multiple=True, help="The details to back up along with the configurations. Repeat to include several.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=8, show_default=True, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors whose tasks or topics are fetched concurrently.")
+@click.option("--force", is_flag=True, default=False, help="Whether to replace an existing backup. A path that does not hold a backup is never replaced.")
+@click.pass_obj
+def export_backup(kafka_connect, path, pattern, include, parallelism, force):
+    """Back up the connector configurations to PATH, a compressed archive when it ends with .tar.gz or .tgz, or else a directory of JSON files whose connectors directory kc apply also accepts."""
+    import time
+    from .backup import write_backup
+
+    if os.path.exists(path) and not force:
+        raise click.UsageError(f"{path} already exists. Set --force to replace it.")
+    start = time.perf_counter()
+    backup = kafka_connect.export_connectors(pattern=pattern, include=include, max_workers=parallelism)
+    failed = backup.pop("failed")
+    try:
+        write_backup(path, backup, overwrite=force)
+    except FileExistsError as e:
+        raise click.UsageError(str(e))
+    click.echo(f"Exported {len(backup['connectors'])} connector(s) to {path} in {time.perf_counter() - start:.2f}s", err=True)
+    raise_for_failures(failed)
+
+
+@cli.command("import")
+@click.argument("path", type=click.Path(exists=True))
+@click.option("-p", "--pattern", default=None, metavar="REGEX", show_envvar=True, help="The regex pattern that will import only the connectors that match.")
+@click.option("--dry-run", is_flag=True, default=False, help="Whether to only print the plan without changing any connector.")
+@click.option("--parallelism", type=click.IntRange(min=1), default=1, metavar="N", envvar="KAFKA_CONNECT_PARALLELISM", show_envvar=True, help="The maximum number of connectors to change concurrently.")
+@click.pass_obj
+def import_backup(kafka_connect, path, pattern, dry_run, parallelism):
+    """Create or update the connectors backed up by kc export. Connectors whose configuration is identical are skipped."""
+    from .backup import read_backup
+
+    backup = read_backup(path, pattern=pattern)
+    plan = kafka_connect.import_connectors(backup, dry_run=dry_run, max_workers=parallelism)
+    failed = plan.pop("failed")
+    click.echo(dumps(plan))
+    raise_for_failures(failed)
+
+
 @cli.command()
 @click.argument("connector")
 @click.pass_obj
 def list_tasks(kafka_connect, connector):
     """Gets the list of tasks associated with a connector."""
     response = kafka_connect.list_connector_tasks(connector)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -266,7 +644,7 @@ def list_tasks(kafka_connect, connector):
 def task_status(kafka_connect, connector, task_id):
     """Gets the status of a task associated with a connector."""
     response = kafka_connect.get_connector_task_status(connector, task_id)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -276,7 +654,7 @@ def task_status(kafka_connect, connector, task_id):
 def restart_task(kafka_connect, connector, task_id):
     """Restart a specific task of a connector."""
     response = kafka_connect.restart_connector_task(connector, task_id)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -285,7 +663,7 @@ def restart_task(kafka_connect, connector, task_id):
 def list_topics(kafka_connect, connector):
     """Get the list of topics for a connector."""
     response = kafka_connect.list_connector_topics(connector)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -294,7 +672,7 @@ def list_topics(kafka_connect, connector):
 def reset_topics(kafka_connect, connector):
     """Reset the list of topics for a connector."""
     response = kafka_connect.reset_connector_topics(connector)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -302,7 +680,7 @@ def reset_topics(kafka_connect, connector):
 def list_plugins(kafka_connect):
     """Get the list of connector plugins."""
     response = kafka_connect.list_connector_plugins()
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
 
 
 @cli.command()
@@ -318,6 +696,6 @@ def validate_config(kafka_connect, plugin, config_file, config_data):
         config_data = config_data
     else:
         raise click.UsageError("One of --config-file or --config-data is required")
-    config = json.loads(config_data)
+    config = loads(config_data)
     response = kafka_connect.validate_connector_config(plugin, config_data)
-    click.echo(json.dumps(response))
+    click.echo(dumps(response))
@@ -0,0 +1,118 @@
+import json
+import os
+
+
+class StdlibCodec:
+    """Encode and decode JSON with the standard library `json` module."""
+
+    name = "json"
+
+    def loads(self, data):
+        """Decode a JSON document.
+        Args:
+            data (bytes or str): The document.
+        Returns:
+            Any: The decoded value.
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj, default=None):
+        """Encode a value as a compact JSON string.
+        Args:
+            obj (Any): The value.
+            default (Callable[[Any], Any]): Converts the objects that JSON cannot represent. Defaults to `None`.
+        Returns:
+            str: The JSON document.
+        """
+        return json.dumps(obj, default=default, ensure_ascii=False, separators=(",", ":"))
+
+    def encode(self, obj, default=None):
+        """Encode a value as a compact, UTF-8 encoded JSON document, such as a request body.
+        Args:
+            obj (Any): The value.
+            default (Callable[[Any], Any]): Converts the objects that JSON cannot represent. Defaults to `None`.
+        Returns:
+            bytes: The JSON document.
+        """
+        return self.dumps(obj, default=default).encode()
+
+
+class OrjsonCodec(StdlibCodec):
+    """Encode and decode JSON with `orjson`, which is several times faster than the standard library."""
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError:
+            raise ImportError(
+                "orjson is not installed. Install it with `pip install orjson`."
+            ) from None
+        self.orjson = orjson
+
+    def loads(self, data):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return self.orjson.loads(data)
+
+    def dumps(self, obj, default=None):
+        return self.encode(obj, default=default).decode()
+
+    def encode(self, obj, default=None):
+        return self.orjson.dumps(obj, default=default, option=self.orjson.OPT_NON_STR_KEYS)
+
+
+CODECS = {"json": StdlibCodec, "orjson": OrjsonCodec}
+
+
+def get_codec(name=None):
+    """Get a JSON codec.
+    Args:
+        name (str): The name of the codec, either "json" or "orjson". Defaults to the `KAFKA_CONNECT_JSON`
+            environment variable, or else the fastest codec installed.
+    Returns:
+        StdlibCodec: The codec.
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the library of the codec is not installed.
+    """
+    name = name or os.environ.get("KAFKA_CONNECT_JSON")
+    if name is None:
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibCodec()
+    if name not in CODECS:
+        raise ValueError(f"Invalid JSON codec. Expected one of {', '.join(CODECS)}.")
+    return CODECS[name]()
+
+
+_codec = None
+
+
+def default_codec():
+    """Get the codec used by the clients and the command-line interface, choosing it on first use.
+    Returns:
+        StdlibCodec: The codec.
+    """
+    global _codec
+    if _codec is None:
+        _codec = get_codec()
+    return _codec
+
+
+def loads(data):
+    """Decode a JSON document with the default codec."""
+    return default_codec().loads(data)
+
+
+def dumps(obj, default=None):
+    """Encode a value as a compact JSON string with the default codec."""
+    return default_codec().dumps(obj, default=default)
+
+
+def encode(obj, default=None):
+    """Encode a value as a compact, UTF-8 encoded JSON document with the default codec."""
+    return default_codec().encode(obj, default=default)
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+def default_cache_dir():
+    """Get the default directory of the on-disk cache.
+    Returns:
+        str: `$XDG_CACHE_HOME/kafka-connect`, falling back to `~/.cache` for `XDG_CACHE_HOME`.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "kafka-connect")
+
+
+def _digest(value):
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+class DiskCache:
+    """A cache of rarely changing responses, such as the connector plugins, shared across processes on disk.
+    Entries are stored per cluster URL. An entry stored for a version, such as the version and commit of the
+    cluster, is only served for that version; an entry without a version expires after `ttl` seconds.
+    Args:
+        directory (str): The cache directory. Defaults to `$XDG_CACHE_HOME/kafka-connect`.
+        ttl (float): The number of seconds an entry without a version stays fresh. Defaults to 300.
+        refresh (bool): Whether to ignore the stored entries and replace them with fresh responses.
+            Defaults to False.
+        clock (Callable[[], float]): The wall clock, shared by every process. Defaults to `time.time`.
+    """
+
+    def __init__(self, directory=None, ttl=300, refresh=False, clock=time.time):
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+        self.refresh = refresh
+        self.clock = clock
+
+    def __path(self, url, name, version):
+        filename = f"{name}-{_digest(version)}.json" if version is not None else f"{name}.json"
+        return os.path.join(self.directory, _digest(url), filename)
+
+    def get(self, url, name, version=None):
+        """Get a fresh entry.
+        Args:
+            url (str): The base URL of the cluster.
+            name (str): The name of the entry, such as `connector-plugins`.
+            version (str): The version the entry must have been stored for. Defaults to `None`.
+        Returns:
+            Tuple[bool, Any]: Whether a fresh entry was found, and its value.
+        """
+        if self.refresh:
+            return False, None
+        try:
+            with open(self.__path(url, name, version)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False, None
+        if entry.get("url") != url or entry.get("version") != version:
+            return False, None
+        if version is None and self.clock() - entry.get("stored_at", 0) >= self.ttl:
+            return False, None
+        return True, entry.get("value")
+
+    def set(self, url, name, value, version=None):
+        """Store an entry, replacing the entries of the same name stored for other versions.
+        The entry is written to a temporary file first, so that concurrent processes never read a partial entry.
+        Failures to write are ignored, since the cache is only an optimization.
+        Args:
+            url (str): The base URL of the cluster.
+            name (str): The name of the entry, such as `connector-plugins`.
+            value (Any): The JSON-serializable value.
+            version (str): The version the entry is stored for. Defaults to `None`.
+        """
+        path = self.__path(url, name, version)
+        directory = os.path.dirname(path)
+        entry = {"url": url, "version": version, "stored_at": self.clock(), "value": value}
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+            if version is not None:
+                for filename in os.listdir(directory):
+                    stale = os.path.join(directory, filename)
+                    if filename.startswith(f"{name}-") and stale != path:
+                        os.remove(stale)
+        except OSError:
+            pass
+
+    def get_or_load(self, url, name, load, version=None):
+        """Return a fresh entry, loading and storing it on a miss.
+        Args:
+            url (str): The base URL of the cluster.
+            name (str): The name of the entry, such as `connector-plugins`.
+            load (Callable[[], Any]): Fetches the value on a miss. Exceptions are raised and never stored.
+            version (str): The version the entry must have been stored for. Defaults to `None`.
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        found, value = self.get(url, name, version)
+        if not found:
+            value = load()
+            self.set(url, name, value, version)
+        return value
+
+    def clear(self):
+        """Delete every entry."""
+        if not os.path.isdir(self.directory):
+            return
+        for root, dirs, files in os.walk(self.directory, topdown=False):
+            for filename in files:
+                os.remove(os.path.join(root, filename))
+            for dirname in dirs:
+                os.rmdir(os.path.join(root, dirname))
@@ -0,0 +1,234 @@
+from .metrics import format_labels
+from .models import intern_value
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import threading
+import time
+
+# The states a connector or task can report, each exported as its own series so that a state change never
+# makes a series disappear
+STATES = ("RUNNING", "PAUSED", "STOPPED", "UNASSIGNED", "FAILED", "RESTARTING")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def compact(connectors):
+    """Reduce an `expand=status,info` listing to the states, workers and types that are exported.
+    Args:
+        connectors (Dict[str, Any]): The connectors listed with `expand=["status", "info"]`.
+    Returns:
+        Dict[str, Tuple[str, str, str, Tuple[Tuple[int, str, str], ...]]]: The connector type, state, worker ID
+            and the ID, state and worker ID of each task, keyed by connector name. The strings are interned, so
+            the states of thousands of connectors share a single copy of each state and worker ID.
+    """
+    states = {}
+    for name, data in connectors.items():
+        status = data.get("status", {})
+        connector = status.get("connector", {})
+        connector_type = status.get("type") or data.get("info", {}).get("type")
+        tasks = tuple(
+            (task.get("id"), intern_value(task.get("state")), intern_value(task.get("worker_id")))
+            for task in status.get("tasks", [])
+        )
+        states[name] = (
+            intern_value(connector_type),
+            intern_value(connector.get("state")),
+            intern_value(connector.get("worker_id")),
+            tasks,
+        )
+    return states
+
+
+def render_states(states, prefix="kafka_connect"):
+    """Render the connector and task states in the Prometheus text exposition format.
+    Args:
+        states (Dict[str, Tuple[Any, ...]]): The states returned by `compact`.
+        prefix (str): The prefix of the metric names. Defaults to "kafka_connect".
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    connector_lines, task_lines = [], []
+    connector_counts = dict.fromkeys(STATES, 0)
+    task_counts = dict.fromkeys(STATES, 0)
+
+    def samples(lines, name, labels, current):
+        for state in STATES if current in STATES else STATES + (current,):
+            lines.append(
+                f"{prefix}_{name}{{{format_labels({**labels, 'state': state})}}} "
+                f"{1 if state == current else 0}"
+            )
+
+    for name, (connector_type, state, worker_id, tasks) in states.items():
+        labels = {"connector": name, "type": connector_type or "", "worker_id": worker_id or ""}
+        samples(connector_lines, "connector_state", labels, state or "")
+        connector_counts[state] = connector_counts.get(state, 0) + 1
+        for task_id, task_state, task_worker_id in tasks:
+            labels = {
+                "connector": name,
+                "task": task_id,
+                "type": connector_type or "",
+                "worker_id": task_worker_id or "",
+            }
+            samples(task_lines, "task_state", labels, task_state or "")
+            task_counts[task_state] = task_counts.get(task_state, 0) + 1
+
+    lines = [
+        f"# HELP {prefix}_connector_state Whether the connector is in the state.",
+        f"# TYPE {prefix}_connector_state gauge",
+        *connector_lines,
+        f"# HELP {prefix}_task_state Whether the task is in the state.",
+        f"# TYPE {prefix}_task_state gauge",
+        *task_lines,
+        f"# HELP {prefix}_connectors The number of connectors in each state.",
+        f"# TYPE {prefix}_connectors gauge",
+        *(
+            f"{prefix}_connectors{{{format_labels({'state': s})}}} {n}"
+            for s, n in connector_counts.items()
+            if s
+        ),
+        f"# HELP {prefix}_tasks The number of tasks in each state.",
+        f"# TYPE {prefix}_tasks gauge",
+        *(
+            f"{prefix}_tasks{{{format_labels({'state': s})}}} {n}"
+            for s, n in task_counts.items()
+            if s
+        ),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+class ConnectorStateExporter:
+    """Poll the connector and task states in the background and export them to Prometheus.
+    Scrapes are answered from the metrics rendered by the last poll, so the load on the REST API depends only on
+    the poll interval, however often the exporter is scraped. When a poll fails, the states of the last successful
+    poll are kept and `<prefix>_up` drops to 0.
+    Args:
+        kafka_connect (KafkaConnect): The client of the cluster. Its request metrics, if enabled, are exported too.
+        interval (float): The number of seconds between polls. Defaults to 15.
+        prefix (str): The prefix of the metric names. Defaults to "kafka_connect".
+        logger (logging.Logger): The logger to be used. Defaults to the logger of `kafka_connect`.
+        clock (Callable[[], float]): The wall clock of the poll timestamps. Defaults to `time.time`.
+    """
+
+    def __init__(
+        self, kafka_connect, interval=15, prefix="kafka_connect", logger=None, clock=time.time
+    ):
+        self.kafka_connect = kafka_connect
+        self.interval = interval
+        self.prefix = prefix
+        self.logger = logger if logger else kafka_connect.logger
+        self.clock = clock
+        self.states = {}
+        self.up = 0
+        self.last_success = None
+        self.poll_duration = None
+        self.poll_errors = 0
+        self._rendered_states = render_states({}, prefix)
+        self._body = self.__render()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __render(self):
+        p = self.prefix
+        lines = [
+            f"# HELP {p}_up Whether the last poll of the REST API succeeded.",
+            f"# TYPE {p}_up gauge",
+            f"{p}_up {self.up}",
+            f"# HELP {p}_exporter_poll_errors_total The number of polls that failed.",
+            f"# TYPE {p}_exporter_poll_errors_total counter",
+            f"{p}_exporter_poll_errors_total {self.poll_errors}",
+        ]
+        if self.last_success is not None:
+            lines += [
+                f"# HELP {p}_exporter_last_success_timestamp_seconds When the last poll succeeded.",
+                f"# TYPE {p}_exporter_last_success_timestamp_seconds gauge",
+                f"{p}_exporter_last_success_timestamp_seconds {self.last_success}",
+            ]
+        if self.poll_duration is not None:
+            lines += [
+                f"# HELP {p}_exporter_poll_duration_seconds The duration of the last poll.",
+                f"# TYPE {p}_exporter_poll_duration_seconds gauge",
+                f"{p}_exporter_poll_duration_seconds {self.poll_duration}",
+            ]
+        return (self._rendered_states + "\n".join(lines) + "\n").encode()
+
+    def poll(self):
+        """List the connectors once and render the metrics served to the following scrapes.
+        Returns:
+            bool: Whether the poll succeeded.
+        """
+        start = time.perf_counter()
+        try:
+            connectors = self.kafka_connect.list_connectors(expand=["status", "info"])
+        except Exception as e:
+            self.logger.error(f"Failed to poll the connector states: {e}")
+            self.up = 0
+            self.poll_errors += 1
+        else:
+            # Only the compact states are kept, so the configurations are released right away
+            self.states = compact(connectors)
+            self._rendered_states = render_states(self.states, self.prefix)
+            self.up = 1
+            self.last_success = self.clock()
+        self.poll_duration = time.perf_counter() - start
+        self._body = self.__render()
+        return bool(self.up)
+
+    def scrape(self):
+        """Get the metrics rendered by the last poll, without calling the REST API.
+        Returns:
+            bytes: The metrics in the Prometheus text exposition format.
+        """
+        body = self._body
+        if self.kafka_connect.metrics is not None:
+            body += self.kafka_connect.metrics.to_prometheus().encode()
+        return body
+
+    def __run(self):
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start polling in a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.__run, name="kafka-connect-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling, waiting for the poll in progress to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def server(self, host="", port=9400):
+        """Create an HTTP server that answers `GET /metrics` with `scrape`.
+        Args:
+            host (str): The address to listen on. Defaults to every address.
+            port (int): The port to listen on. Defaults to 9400.
+        Returns:
+            http.server.ThreadingHTTPServer: The server, which starts serving with `serve_forever`.
+        """
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.scrape()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+        httpd.daemon_threads = True
+        return httpd
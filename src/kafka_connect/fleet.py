@@ -0,0 +1,294 @@
+from .kafka_connect import KafkaConnect
+from concurrent.futures import ThreadPoolExecutor
+
+import fnmatch
+import json
+import logging
+import os
+import threading
+
+
+def default_clusters_file():
+    """Get the default path of the clusters configuration file.
+    Returns:
+        str: `$XDG_CONFIG_HOME/kafka-connect/clusters.json`, falling back to `~/.config` for `XDG_CONFIG_HOME`.
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return os.path.join(config_home, "kafka-connect", "clusters.json")
+
+
+def load_clusters(path):
+    """Load the named clusters of a clusters configuration file.
+    The file is a JSON object keyed by cluster name, whose values are either the URL of the cluster or an object of
+    `KafkaConnect` arguments such as `url`, `auth` and `ssl_verify`.
+    Args:
+        path (str): The path of the file.
+    Returns:
+        Dict[str, Dict[str, Any]]: The `KafkaConnect` arguments keyed by cluster name, in file order.
+    Raises:
+        ValueError: If a cluster does not set a `url`.
+    """
+    with open(path) as f:
+        clusters = json.load(f)
+    configs = {}
+    for name, config in clusters.items():
+        config = {"url": config} if isinstance(config, str) else dict(config)
+        if not config.get("url"):
+            raise ValueError(f"The {name} cluster does not set a `url` in {path}.")
+        configs[name] = config
+    return configs
+
+
+def select_clusters(clusters, patterns):
+    """Select the clusters whose names match any of the given shell-style patterns.
+    Args:
+        clusters (Dict[str, Any]): The clusters keyed by name.
+        patterns (Iterable[str]): The cluster names or patterns, such as `prod-*`.
+    Returns:
+        Dict[str, Any]: The matching clusters, in the order of `clusters`.
+    Raises:
+        ValueError: If a pattern matches no cluster.
+    """
+    selected = set()
+    for pattern in patterns:
+        matches = fnmatch.filter(clusters, pattern)
+        if not matches:
+            raise ValueError(
+                f"No cluster matches {pattern}. Expected one of {', '.join(clusters)}."
+            )
+        selected.update(matches)
+    return {name: cluster for name, cluster in clusters.items() if name in selected}
+
+
+class KafkaConnectFleet:
+    """A client that fans operations out concurrently to many Kafka Connect clusters.
+    Every operation returns its results keyed by cluster name, in the order of `clusters`. A cluster that fails
+    does not stop the others; its value is the raised exception.
+    Args:
+        clusters (Dict[str, Any]): The clusters keyed by name. Each value is a `KafkaConnect` client, the URL of the
+            cluster, or a dictionary of `KafkaConnect` arguments.
+        max_workers (int): The maximum number of clusters called concurrently. Defaults to the number of clusters.
+        logger (logging.Logger): The logger to be used. If not specified, a new logger will be created.
+        **kwargs: Default `KafkaConnect` arguments, such as `retry`, for the clusters that are not given as clients.
+    """
+
+    def __init__(self, clusters, max_workers=None, logger=None, **kwargs):
+        if not clusters:
+            raise ValueError("At least one cluster is required.")
+        self.logger = logger if logger else logging.getLogger()
+        self.clusters = {}
+        for name, cluster in clusters.items():
+            if isinstance(cluster, str):
+                cluster = {"url": cluster}
+            if isinstance(cluster, dict):
+                cluster = KafkaConnect(**{"logger": self.logger, **kwargs, **cluster})
+            self.clusters[name] = cluster
+        self.max_workers = max_workers or len(self.clusters)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the HTTP sessions of every cluster."""
+        for cluster in self.clusters.values():
+            cluster.close()
+
+    def __map(self, method, call):
+        """Call a function on every cluster concurrently, logging the clusters it failed for.
+        Args:
+            method (str): The name of the method called, for logging.
+            call (Callable[[str, KafkaConnect], Any]): Called with the name and the client of each cluster.
+        Returns:
+            Dict[str, Any]: The result, or the raised exception, for each cluster.
+        """
+
+        def run(name):
+            try:
+                return call(name, self.clusters[name])
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = dict(zip(self.clusters, executor.map(run, self.clusters)))
+
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                self.logger.error(f"{method} failed for {name} cluster: {result}")
+        return results
+
+    def __run_all(self, method, callback=None, **kwargs):
+        """Call a bulk `KafkaConnect` method on every cluster concurrently.
+        Args:
+            method (str): The name of the method, such as `pause_all_connectors`.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Calls are serialized
+                across clusters. Defaults to `None`.
+            **kwargs: Keyword arguments passed to the method.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        lock = threading.Lock()
+
+        def call(name, cluster):
+            cluster_callback = None
+            if callback is not None:
+
+                def cluster_callback(connector, result):
+                    with lock:
+                        callback(name, connector, result)
+
+            return getattr(cluster, method)(callback=cluster_callback, **kwargs)
+
+        return self.__map(method, call)
+
+    def map(self, method, *args, **kwargs):
+        """Call a `KafkaConnect` method on every cluster concurrently.
+        Args:
+            method (str): The name of the method, such as `list_connectors`.
+            *args: Positional arguments passed to the method.
+            **kwargs: Keyword arguments passed to the method.
+        Returns:
+            Dict[str, Any]: The result, or the raised exception, for each cluster.
+        """
+        return self.__map(method, lambda name, cluster: getattr(cluster, method)(*args, **kwargs))
+
+    def get_cluster_info(self):
+        """Get the version and other details of every cluster.
+        Returns:
+            Dict[str, Any]: The cluster details keyed by cluster name.
+        """
+        return self.map("get_cluster_info")
+
+    def list_connectors(self, expand=None, pattern=None, state=None, typed=False):
+        """List the connectors of every cluster.
+        Args:
+            expand (str or List[str]): Optional parameter that retrieves additional information about the connectors.
+                Valid values are "status" and "info".
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            typed (bool): Whether to return the expansions as `ConnectorStatus` and `ConnectorInfo` objects.
+                Defaults to False.
+        Returns:
+            Dict[str, Any]: The connectors keyed by cluster name.
+        """
+        return self.map("list_connectors", expand=expand, pattern=pattern, state=state, typed=typed)
+
+    def get_connector_status(self, connector):
+        """Get the status of a connector on every cluster.
+        Args:
+            connector (str): The name of the connector.
+        Returns:
+            Dict[str, Any]: The connector status keyed by cluster name.
+        """
+        return self.map("get_connector_status", connector)
+
+    def restart_all_connectors(
+        self,
+        include_tasks=False,
+        only_failed=False,
+        pattern=None,
+        state=None,
+        max_workers=1,
+        callback=None,
+    ):
+        """Restart all connectors of every cluster.
+        Args:
+            include_tasks (bool): Whether to include tasks when restarting the connector. Default is False.
+            only_failed (bool): Whether to only restart failed tasks. Default is False.
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to restart concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "restart_all_connectors",
+            callback,
+            include_tasks=include_tasks,
+            only_failed=only_failed,
+            pattern=pattern,
+            state=state,
+            max_workers=max_workers,
+        )
+
+    def restart_failed_tasks(self, pattern=None, max_workers=1, callback=None):
+        """Restart every failed connector and task of every cluster.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to restart concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and what
+                was restarted, or the raised exception, of each connector as soon as it completes. Defaults to
+                `None`.
+        Returns:
+            Dict[str, Any]: What was restarted keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "restart_failed_tasks", callback, pattern=pattern, max_workers=max_workers
+        )
+
+    def pause_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
+        """Pause all connectors of every cluster.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to pause concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "pause_all_connectors", callback, pattern=pattern, state=state, max_workers=max_workers
+        )
+
+    def resume_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
+        """Resume all connectors of every cluster.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to resume concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "resume_all_connectors", callback, pattern=pattern, state=state, max_workers=max_workers
+        )
+
+    def stop_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
+        """Stop all connectors of every cluster.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to stop concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "stop_all_connectors", callback, pattern=pattern, state=state, max_workers=max_workers
+        )
+
+    def delete_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
+        """Delete all connectors of every cluster.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to delete concurrently per cluster. Defaults to 1.
+            callback (Callable[[str, str, Any], None]): Called with the cluster name, the connector name and the
+                response, or the raised exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: The responses keyed by cluster name, and then by connector name.
+        """
+        return self.__run_all(
+            "delete_all_connectors", callback, pattern=pattern, state=state, max_workers=max_workers
+        )
@@ -0,0 +1,97 @@
+from .metrics import endpoint_template
+
+import logging
+import re
+
+_CONNECTOR = re.compile(r"^/connectors/([^/]+)")
+
+
+class RequestContext:
+    """The details of an attempt of a request, passed to every hook it calls.
+    Hooks may set attributes of their own, such as a tracing span started in `before_request` and ended in
+    `after_response` or `on_error`.
+    Args:
+        method (str): The HTTP method.
+        path (str): The path relative to the base URL.
+        attempt (int): The number of the attempt, starting at 1. Defaults to 1.
+    Attributes:
+        endpoint (str): The endpoint template, such as `/connectors/{name}/status`.
+        connector (str): The name of the connector the request is about, or `None`.
+        url (str): The base URL of the worker the attempt is sent to, set before `before_request` is called.
+        latency (float): The number of seconds the attempt took, set before `after_response` or `on_error` is
+            called.
+    """
+
+    def __init__(self, method, path, attempt=1):
+        self.method = method
+        self.path = path
+        self.attempt = attempt
+        self.endpoint = endpoint_template(path)
+        match = _CONNECTOR.match(path)
+        self.connector = match.group(1) if match else None
+        self.url = None
+        self.latency = None
+
+
+class RequestHook:
+    """The interface of the hooks called around every request sent by `KafkaConnect`.
+    Subclass it and override the methods of interest. Every attempt of a request, including retries and
+    fail-overs to another worker, calls `before_request` and then either `after_response` or `on_error`.
+    Exceptions raised by a hook are logged and otherwise ignored, so a broken hook never fails a request.
+    """
+
+    def before_request(self, context):
+        """Called before an attempt is sent.
+        Args:
+            context (RequestContext): The attempt.
+        """
+
+    def after_response(self, context, response):
+        """Called when an attempt receives a response, whatever its status code.
+        Args:
+            context (RequestContext): The attempt.
+            response (requests.Response): The response.
+        """
+
+    def on_error(self, context, error):
+        """Called when an attempt receives no response.
+        Args:
+            context (RequestContext): The attempt.
+            error (requests.exceptions.RequestException): The raised exception.
+        """
+
+    def on_retry(self, context, delay, reason):
+        """Called when a failed attempt is about to be retried.
+        Args:
+            context (RequestContext): The attempt that failed.
+            delay (float): The number of seconds before the next attempt.
+            reason (str): Why the attempt failed, such as "status code 409".
+        """
+
+
+class SlowRequestLogger(RequestHook):
+    """Log the attempts that take longer than a latency threshold, whether or not they receive a response.
+    Args:
+        threshold (float): The number of seconds above which an attempt is slow. Defaults to 1.
+        logger (logging.Logger): The logger to be used. Defaults to the `kafka_connect.slow_requests` logger.
+        level (int): The level of the log records. Defaults to `logging.WARNING`.
+    """
+
+    def __init__(self, threshold=1, logger=None, level=logging.WARNING):
+        self.threshold = threshold
+        self.logger = logger if logger else logging.getLogger("kafka_connect.slow_requests")
+        self.level = level
+
+    def __log(self, context, outcome):
+        if context.latency >= self.threshold:
+            self.logger.log(
+                self.level,
+                f"Slow request: {context.method} {context.path or '/'} to {context.url} took "
+                f"{context.latency:.3f}s on attempt {context.attempt} and {outcome}",
+            )
+
+    def after_response(self, context, response):
+        self.__log(context, f"returned status code {response.status_code}")
+
+    def on_error(self, context, error):
+        self.__log(context, f"failed: {error}")
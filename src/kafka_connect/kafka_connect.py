@@ -1,22 +1,93 @@
-from requests.exceptions import HTTPError, ConnectionError, JSONDecodeError
+from .apply import normalize_config, plan_changes
+from .cache import TTLCache, cached, evicts
+from .codec import encode, loads
+from .hooks import RequestContext
+from .metrics import RequestMetrics
+from .models import to_models
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .stream import iter_matching
+from .workers import WorkerPool
+from .watch import diff_snapshots, snapshot
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from requests.exceptions import HTTPError, ConnectionError, JSONDecodeError, RequestException
 
-import json
 import logging
 import re
 import requests
+import threading
+import time
 
 
 class KafkaConnect:
     """A client for the Confluent Platform Kafka Connect REST API.
     Args:
-        url (str): The base URL for the Kafka Connect REST API.
+        url (str or List[str]): The base URL for the Kafka Connect REST API. Pass a list, or a comma-delimited string,
+            of the URLs of several workers of the same cluster to spread reads over them and fail over between them.
         auth (str): A colon-delimited string of `username` and `password` to use for authenticating with the Kafka Connect REST API.
         ssl_verify (bool): Whether to verify the SSL certificate when making requests to the Kafka Connect REST API. Defaults to True.
         logger (logging.Logger): The logger to be used. If not specified, a new logger will be created.
+        pool_connections (int): The number of connection pools to cache. Defaults to 10.
+        pool_maxsize (int): The maximum number of connections to keep alive in each pool. Defaults to 10.
+        max_retries (int or urllib3.util.Retry): The transport-level retries for failed connections. Defaults to 0.
+        keep_alive (bool): Whether to reuse connections between requests. Defaults to True.
+        cache (bool or TTLCache): Whether to cache the responses of read endpoints such as `get_connector_config`.
+            Pass a `TTLCache` to tune the time-to-live and size. Defaults to None, which disables caching.
+        retry (bool or RetryPolicy): Whether to retry requests that fail with a retryable status code, such as a
+            409 during a rebalance, or a connection error. Pass a `RetryPolicy` to tune the attempts and backoff.
+            Defaults to None, which disables retries.
+        max_rps (float): The maximum number of requests per second, shared by every thread using the client.
+            Defaults to None, which disables rate limiting.
+        burst (int): The number of requests that may be sent at once under `max_rps`. Defaults to `max(1, max_rps)`.
+        max_inflight (int): The maximum number of concurrent requests, shared by every thread using the client.
+            Defaults to None, which does not cap concurrency.
+        strategy (str): How to spread requests over several workers, either "round-robin" or "least-latency".
+            Defaults to "round-robin".
+        cooldown (float): The number of seconds a worker is skipped after a connection error. Defaults to 30.
+        disk_cache (DiskCache): An on-disk cache, shared across processes, for the cluster info and the connector
+            plugins. The plugins are cached per cluster version and commit, so they are refetched after a worker
+            deploy. Defaults to None, which disables it.
+        metrics (bool or RequestMetrics): Whether to record the count, status codes, bytes, retries and latency
+            histogram of the requests to each endpoint, such as `GET /connectors/{name}/status`. Pass a
+            `RequestMetrics` to share it between clients or tune the histogram buckets. Defaults to None, which
+            disables it.
+        hooks (List[RequestHook]): The hooks called before and after every attempt of every request, and before
+            every retry, such as a `SlowRequestLogger` or a tracing integration. Defaults to None.
     """
 
-    def __init__(self, url="http://localhost:8083", auth=None, ssl_verify=True, logger=None):
-        self.url = url
+    # The number of bytes read at a time from streamed responses
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # The number of seconds the cluster version that keys the cached connector plugins is trusted before it is
+    # fetched again, so that a loop over the plugins sends at most one request per window
+    CLUSTER_VERSION_TTL = 5
+
+    def __init__(
+        self,
+        url="http://localhost:8083",
+        auth=None,
+        ssl_verify=True,
+        logger=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=0,
+        keep_alive=True,
+        cache=None,
+        retry=None,
+        max_rps=None,
+        burst=None,
+        max_inflight=None,
+        strategy="round-robin",
+        cooldown=30,
+        disk_cache=None,
+        metrics=None,
+        hooks=None,
+    ):
+        urls = url.split(",") if isinstance(url, str) else list(url)
+        self.urls = [u.strip().rstrip("/") for u in urls if u.strip()]
+        self.url = self.urls[0]
+        self.workers = WorkerPool(self.urls, strategy=strategy, cooldown=cooldown)
         self.headers = {"Content-Type": "application/json"}
 
         # Split the auth string into username and password and store them as a tuple
@@ -39,16 +110,297 @@ class KafkaConnect:
 
         self.logger = logger if logger else logging.getLogger()
 
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keep_alive = keep_alive
+        self._session = None
+        self._retired_adapters = []
+
+        self.cache = TTLCache() if cache is True else (cache or None)
+        self.retry = RetryPolicy() if retry is True else (retry or None)
+        self.disk_cache = disk_cache
+        self.__cluster_version = None
+        self.metrics = RequestMetrics() if metrics is True else (metrics or None)
+        self.hooks = list(hooks or [])
+
+        # Protect the workers, whose REST server shares a JVM with the tasks, from request floods
+        self.rate_limiter = TokenBucket(max_rps, burst) if max_rps else None
+        self.max_inflight = max_inflight
+        self.__inflight = (
+            threading.BoundedSemaphore(max_inflight) if max_inflight else nullcontext()
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def session(self):
+        """The pooled HTTP session shared by every endpoint method.
+        The session is created on first use so that constructing a client does not open any connections.
+        Returns:
+            requests.Session: The session.
+        """
+        if self._session is None:
+            session = requests.Session()
+            self.__mount(session)
+            if not self.keep_alive:
+                session.headers["Connection"] = "close"
+            self._session = session
+        return self._session
+
+    def __mount(self, session):
+        """Mount a connection pool sized by `pool_connections` and `pool_maxsize` on a session.
+        Args:
+            session (requests.Session): The session.
+        """
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    def close(self):
+        """Close the HTTP session and release its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        # The pools replaced while the session was in use may still hold idle connections
+        for adapter in self._retired_adapters:
+            adapter.close()
+        self._retired_adapters.clear()
+
+    def __call_hooks(self, name, *args):
+        """Call a method of every hook that implements it, logging and ignoring the exceptions it raises.
+        Args:
+            name (str): The name of the hook method, such as `before_request`.
+            *args: The arguments passed to the hook method.
+        """
+        for hook in self.hooks:
+            method = getattr(hook, name, None)
+            if method is None:
+                continue
+            try:
+                method(*args)
+            except Exception as e:
+                self.logger.warning(f"The {name} hook of {type(hook).__name__} failed: {e}")
+
+    def __release_on_close(self, response):
+        """Free the in-flight slot held by a streamed response once it is closed.
+        Args:
+            response (requests.Response): The streamed response.
+        """
+        close = response.close
+        released = []
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                # A response may be closed more than once, but its slot is only freed the first time
+                if not released:
+                    released.append(True)
+                    self.__inflight.release()
+
+        response.close = close_and_release
+
+    def __send(self, method, path, context=None, **kwargs):
+        """Send a single attempt of a request to a healthy worker.
+        Workers that cannot be reached are marked unhealthy. Reads fail over to the next worker; other requests are
+        not repeated here since they may not be idempotent.
+        Args:
+            method (str): The HTTP method.
+            path (str): The path relative to the base URL.
+            context (RequestContext): The attempt passed to the hooks, or `None` when there are no hooks.
+            **kwargs: Additional arguments passed to `requests.Session.request`.
+        Returns:
+            requests.Response: The response from the REST API.
+        Raises:
+            ConnectionError: If no worker that was tried could be reached.
+        """
+        tried = []
+        while True:
+            url = self.workers.select(exclude=tried)
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            if context is not None:
+                context.url = url
+                self.__call_hooks("before_request", context)
+            start = time.perf_counter()
+            try:
+                if self.max_inflight and kwargs.get("stream"):
+                    # The body of a streamed response is still being sent once the headers arrive, so its slot is
+                    # only freed when the response is closed
+                    self.__inflight.acquire()
+                    try:
+                        response = self.session.request(
+                            method, f"{url}{path}", auth=self.auth, verify=self.verify, **kwargs
+                        )
+                    except BaseException:
+                        self.__inflight.release()
+                        raise
+                    self.__release_on_close(response)
+                else:
+                    with self.__inflight:
+                        response = self.session.request(
+                            method, f"{url}{path}", auth=self.auth, verify=self.verify, **kwargs
+                        )
+            except RequestException as e:
+                latency = time.perf_counter() - start
+                if self.metrics is not None:
+                    self.metrics.observe(method, path, latency)
+                if context is not None:
+                    context.latency = latency
+                    self.__call_hooks("on_error", context, e)
+                if not isinstance(e, ConnectionError):
+                    raise
+                self.workers.mark_failed(url)
+                tried.append(url)
+                if method != "GET" or len(tried) >= len(self.urls):
+                    raise
+                self.logger.warning(f"Failing over {method} {path or '/'} from {url}: {e}")
+                continue
+            latency = time.perf_counter() - start
+            self.workers.mark_succeeded(url, latency)
+            if self.metrics is not None:
+                data = kwargs.get("data")
+                if kwargs.get("stream"):
+                    # The body has not been read yet, and reading it here would defeat the streaming
+                    received = int(response.headers.get("Content-Length") or 0)
+                else:
+                    received = len(response.content or b"")
+                self.metrics.observe(
+                    method,
+                    path,
+                    latency,
+                    status_code=response.status_code,
+                    bytes_sent=len(data) if data else 0,
+                    bytes_received=received,
+                )
+            if context is not None:
+                context.latency = latency
+                self.__call_hooks("after_response", context, response)
+            return response
+
+    def __request(self, method, path, **kwargs):
+        """Send a request to the Kafka Connect REST API over the pooled session.
+        Args:
+            method (str): The HTTP method.
+            path (str): The path relative to the base URL.
+            **kwargs: Additional arguments passed to `requests.Session.request`.
+        Returns:
+            requests.Response: The response from the REST API, which is the last one received when retries run out.
+        Raises:
+            ConnectionError: If the REST API cannot be reached and retries run out.
+        """
+        attempt = 1
+        while True:
+            context = RequestContext(method, path, attempt) if self.hooks else None
+            try:
+                response = self.__send(method, path, context, **kwargs)
+            except ConnectionError as e:
+                if not self.retry or not self.retry.should_retry(attempt, error=e):
+                    raise
+                reason = f"connection error: {e}"
+            else:
+                # Only the body of a 409 is read, which is small and tells a rebalance from other conflicts
+                message = (
+                    response.content.decode(errors="replace")
+                    if self.retry and response.status_code == 409
+                    else None
+                )
+                if not self.retry or not self.retry.should_retry(
+                    attempt, status_code=response.status_code, message=message
+                ):
+                    return response
+                response.close()
+                reason = f"status code {response.status_code}"
+
+            if self.metrics is not None:
+                self.metrics.retry(method, path)
+
+            delay = self.retry.delay(attempt)
+            if context is not None:
+                self.__call_hooks("on_retry", context, delay, reason)
+            self.logger.warning(
+                f"Retrying {method} {path or '/'} in {delay:.2f}s after attempt {attempt} of "
+                f"{self.retry.max_attempts} failed with {reason}"
+            )
+            time.sleep(delay)
+            attempt += 1
+
+    def __share_session(self, max_workers):
+        """Prepare the session to be shared by a pool of threads.
+        Args:
+            max_workers (int): The number of threads.
+        """
+        if max_workers > self.pool_maxsize:
+            self.pool_maxsize = max_workers
+            if self._session is not None:
+                # Mount a larger pool so that every worker thread can keep its connection alive. The live session
+                # may be in use by other threads, so the old pool is kept for the requests in flight to finish on,
+                # and closed along with the session.
+                self._retired_adapters.append(self._session.get_adapter("http://"))
+                self.__mount(self._session)
+        # Create the session up front so that the worker threads share it
+        self.session
+
+    def __run_all(self, action, connectors, max_workers=1, callback=None, **kwargs):
+        """Run a single connector action against many connectors with a bounded pool of threads.
+        Failures do not stop the remaining connectors; each outcome is logged in the order of `connectors`.
+        Args:
+            action (Callable): The single connector method to run, such as `pause_connector`.
+            connectors (Iterable[str]): The names of the connectors.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called on the calling thread with the name and the response, or
+                the raised exception, of each connector as soon as it completes. Defaults to `None`.
+            **kwargs: Additional arguments passed to `action`.
+        Returns:
+            Dict[str, Any]: The response, or the raised exception, for each connector in the order of `connectors`.
+        """
+        connectors = list(connectors)
+        self.__share_session(max_workers)
+
+        def run(connector):
+            try:
+                return action(connector, **kwargs)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(run, connector): connector for connector in connectors}
+            if callback is not None:
+                for future in as_completed(futures):
+                    callback(futures[future], future.result())
+            results = {connector: future.result() for future, connector in futures.items()}
+
+        for connector, result in results.items():
+            if isinstance(result, Exception):
+                self.logger.error(f"{action.__name__} failed for {connector} connector: {result}")
+            else:
+                self.logger.info(f"{action.__name__} succeeded for {connector} connector")
+        return results
+
+    @cached
     def get_cluster_info(self):
         """Get the version and other details of the Kafka Connect cluster.
         Returns:
             Dict[str, str]: The details of the cluster, including its version, commit ID, and Kafka cluster ID.
         """
+        if self.disk_cache is not None:
+            return self.disk_cache.get_or_load(self.url, "cluster-info", self.__get_cluster_info)
+        return self.__get_cluster_info()
+
+    def __get_cluster_info(self):
         self.logger.info("Getting cluster details")
-        url = f"{self.url}"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", "")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     def __filter_by_name(self, connectors, pattern):
         """Filter connectors based on a regex pattern.
@@ -70,73 +422,185 @@ class KafkaConnect:
             }
         return filtered_connectors
 
-    def __filter_by_state(self, connectors, state):
-        """Filter connectors based on state.
-
+    def list_connectors(self, expand=None, pattern=None, state=None, typed=False):
+        """Get the list of connectors.
         Args:
-            connectors (List[str] or Dict[str, Any]): The list or dictionary of connectors to filter.
-            state (str): The state of a connector to filter.
-
+            expand (str or List[str]): Optional parameter that retrieves additional information about the connectors.
+                Valid values are "status" and "info". Pass both to fetch them in a single request.
+            pattern (str): Only list connectors that match the regex pattern.
+            state (str): Only list connectors that match the state.
+            typed (bool): Whether to return the expansions as `ConnectorStatus` and `ConnectorInfo` objects, which
+                take a fraction of the memory of the dictionaries. Ignored without `expand`. Defaults to False.
         Returns:
-            List[str] or Dict[str, Any]: The filtered connectors.
+            list or dict: The list of connector names or dictionary of connector names and its details.
         """
-        if not state:
-            return connectors
-
-        if isinstance(connectors, list):
-            connectors_status = self.list_connectors(expand="status")
-            filtered_connectors = [
-                conn
-                for conn in connectors
-                if connectors_status.get(conn, {})
-                .get("status", {})
-                .get("connector", {})
-                .get("state", "")
-                .lower()
-                == state.lower()
-            ]
+        expansions = [expand] if isinstance(expand, str) else list(expand or [])
+        if state or (expansions and pattern):
+            # Filter the connectors while the body streams in: each one is decoded in turn and the ones filtered
+            # out are discarded right away, so only one connector beyond the matches is held in memory
+            connectors = self.stream_connectors(expand=expansions, pattern=pattern, state=state)
+            if not expansions:
+                return [name for name, _ in connectors]
+            connectors = dict(connectors)
+            return to_models(connectors) if typed else connectors
 
-        if isinstance(connectors, dict):
-            try:
-                filtered_connectors = {
-                    conn: data
-                    for conn, data in connectors.items()
-                    if data["status"]["connector"]["state"].lower() == state.lower()
-                }
-            except Exception as e:
-                connectors_status = self.list_connectors(expand="status")
-                filtered_connectors = {
-                    conn: data
-                    for conn, data in connectors.items()
-                    if connectors_status.get(conn, {})
-                    .get("status", {})
-                    .get("connector", {})
-                    .get("state", "")
-                    .lower()
-                    == state.lower()
-                }
-
-        return filtered_connectors
+        self.logger.info(
+            f"Listing connectors{' with expand=' + ','.join(expansions) if expansions else ''}"
+        )
+        params = {"expand": expansions[0] if len(expansions) == 1 else expansions or None}
+        response = self.__request("GET", "/connectors", params=params)
+        response.raise_for_status()
+        connectors = self.__filter_by_name(loads(response.content), pattern=pattern)
+        # A listing without expansions is a list of names, which has nothing to convert
+        return to_models(connectors) if typed and expansions else connectors
 
-    def list_connectors(self, expand=None, pattern=None, state=None):
-        """Get the list of connectors.
+    def stream_connectors(self, expand=None, pattern=None, state=None):
+        """Iterate over the connectors of a listing while the response body is read.
+        Unlike `list_connectors`, each connector is yielded as soon as it is decoded, so the first ones can be
+        processed before the whole listing has arrived. A listing without expansions is small and is read at once.
         Args:
-            expand (str): Optional parameter that retrieves additional information about the connectors.
-                Valid values are "status" and "info".
+            expand (str or List[str]): Optional parameter that retrieves additional information about the connectors.
+                Valid values are "status" and "info". Pass both to fetch them in a single request.
             pattern (str): Only list connectors that match the regex pattern.
             state (str): Only list connectors that match the state.
         Returns:
-            list or dict: The list of connector names or dictionary of connector names and its details.
+            Iterator[Tuple[str, Dict[str, Any]]]: The name and the expansions of each connector. The expansions are
+                empty when `expand` is not given.
         """
-        self.logger.info(f"Listing connectors{' with expand=' + expand if expand else ''}")
-        url = f"{self.url}/connectors"
-        params = {"expand": expand}
-        response = requests.get(url, auth=self.auth, verify=self.verify, params=params)
-        response.raise_for_status()
-        connectors = response.json()
-        return self.__filter_by_state(
-            self.__filter_by_name(connectors, pattern=pattern), state=state
+        expansions = [expand] if isinstance(expand, str) else list(expand or [])
+
+        # Fetch the status in the same request when it is needed to filter by state
+        fetched = expansions + ["status"] if state and "status" not in expansions else expansions
+
+        self.logger.info(
+            f"Listing connectors{' with expand=' + ','.join(fetched) if fetched else ''}"
         )
+        params = {"expand": fetched[0] if len(fetched) == 1 else fetched or None}
+        if not fetched:
+            response = self.__request("GET", "/connectors", params=params)
+            response.raise_for_status()
+            for name in self.__filter_by_name(loads(response.content), pattern=pattern):
+                yield name, {}
+            return
+
+        response = self.__request("GET", "/connectors", params=params, stream=True)
+        try:
+            response.raise_for_status()
+            yield from iter_matching(
+                response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE),
+                pattern=pattern,
+                state=state,
+                expand=expansions if fetched != expansions else None,
+            )
+        finally:
+            response.close()
+
+    def watch(self, pattern=None, state=None, min_interval=1, max_interval=30, initial=True):
+        """Poll the connector statuses and yield the connector and task state transitions.
+        The poll interval doubles while nothing changes, up to `max_interval`, and drops back to `min_interval`
+        after a change. Failed polls are logged and retried.
+        Args:
+            pattern (str): Only watch connectors that match the regex pattern.
+            state (str): Only yield the transitions from or to the state, such as a connector that fails and the
+                one that recovers.
+            min_interval (float): The shortest number of seconds between polls. Defaults to 1.
+            max_interval (float): The longest number of seconds between polls. Defaults to 30.
+            initial (bool): Whether to yield the states found by the first poll as transitions from `None`.
+                Defaults to True.
+        Yields:
+            Dict[str, Any]: A transition with its `type` ("connector" or "task"), `connector`, `task`, `from` and
+                `to` states, `worker_id` and `timestamp`.
+        """
+        previous = None
+        interval = min_interval
+        while True:
+            try:
+                # The state is not filtered on here, so that a connector leaving the state is still seen
+                current = snapshot(self.list_connectors(expand="status", pattern=pattern))
+            except RequestException as e:
+                self.logger.warning(f"Failed to poll connector statuses: {e}")
+                current = previous
+
+            if current is None or (previous is None and not initial):
+                events = []
+            else:
+                events = diff_snapshots(previous or {}, current)
+            if state:
+                events = [e for e in events if state.upper() in (e["from"], e["to"])]
+
+            timestamp = time.time()
+            for event in events:
+                event["timestamp"] = timestamp
+                yield event
+
+            previous = current
+            interval = min_interval if events else min(interval * 2, max_interval)
+            time.sleep(interval)
+
+    # The per-connector details that `iter_connectors` can include, and the methods that fetch them
+    DETAILS = {
+        "config": "get_connector_config",
+        "status": "get_connector_status",
+        "tasks": "list_connector_tasks",
+        "topics": "list_connector_topics",
+    }
+
+    def iter_connectors(
+        self, pattern=None, state=None, include=("config",), prefetch=8, ordered=False
+    ):
+        """List the connectors and yield each with the details that the `expand` listing does not include.
+        The details of the next `prefetch` connectors are fetched concurrently while the previous ones are consumed,
+        so at most `prefetch` connectors are held in memory however large the cluster is.
+        Args:
+            pattern (str): Only yield connectors that match the regex pattern.
+            state (str): Only yield connectors that match the state.
+            include (str or List[str]): The details to fetch for each connector: "config", "status", "tasks"
+                and "topics". Defaults to "config".
+            prefetch (int): The maximum number of connectors whose details are fetched ahead. Defaults to 8.
+            ordered (bool): Whether to yield the connectors in the order of the listing rather than as soon as
+                their details arrive. Defaults to False.
+        Yields:
+            Tuple[str, Dict[str, Any] or Exception]: The name of each connector and its details keyed by `include`,
+                or the exception raised while fetching them, such as when the connector was deleted meanwhile.
+        Raises:
+            ValueError: If `include` has an unknown detail.
+        """
+        include = [include] if isinstance(include, str) else list(include)
+        unknown = [detail for detail in include if detail not in self.DETAILS]
+        if unknown:
+            raise ValueError(
+                f"Invalid detail: {', '.join(unknown)}. Expected one of {', '.join(self.DETAILS)}."
+            )
+        names = iter(self.list_connectors(pattern=pattern, state=state))
+        self.__share_session(prefetch)
+
+        def fetch(connector):
+            try:
+                return {
+                    detail: getattr(self, self.DETAILS[detail])(connector) for detail in include
+                }
+            except Exception as e:
+                self.logger.error(f"Failed to get the details of {connector} connector: {e}")
+                return e
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = {}
+        try:
+            for connector in names:
+                pending[executor.submit(fetch, connector)] = connector
+                if len(pending) <= prefetch:
+                    continue
+                # Keep `prefetch` connectors fetching while the next one is consumed
+                future = next(iter(pending)) if ordered else next(as_completed(pending))
+                yield pending.pop(future), future.result()
+            while pending:
+                future = next(iter(pending)) if ordered else next(as_completed(pending))
+                yield pending.pop(future), future.result()
+        finally:
+            # Stop fetching ahead when the consumer stops early
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def create_connector(self, config):
         """Create a new connector.
@@ -148,21 +612,14 @@ class KafkaConnect:
             HTTPError: If the REST API responds with a non-200 status code.
         """
         self.logger.info(f"Creating connector: {config.get('name')}")
-        url = f"{self.url}/connectors"
-        response = requests.post(
-            url,
-            auth=self.auth,
-            verify=self.verify,
-            headers=self.headers,
-            data=json.dumps(config),
-        )
+        response = self.__request("POST", "/connectors", headers=self.headers, data=encode(config))
 
-        response.raise_for_status()
         if response.status_code == 409:
             self.logger.error("Connector already exists or rebalance is in process.")
-        else:
-            return response.json()
+        response.raise_for_status()
+        return loads(response.content)
 
+    @evicts
     def update_connector(self, connector, config):
         """Update an existing connector.
         Args:
@@ -178,21 +635,16 @@ class KafkaConnect:
             )
 
         self.logger.info(f"Updating {connector} connector")
-        url = f"{self.url}/connectors/{connector}/config"
-        response = requests.put(
-            url,
-            headers=self.headers,
-            auth=self.auth,
-            verify=self.verify,
-            data=json.dumps(config),
+        response = self.__request(
+            "PUT", f"/connectors/{connector}/config", headers=self.headers, data=encode(config)
         )
 
-        response.raise_for_status()
         if response.status_code == 409:
             self.logger.error("Connector rebalance is in process.")
-        else:
-            return response.json()
+        response.raise_for_status()
+        return loads(response.content)
 
+    @cached
     def get_connector(self, connector):
         """Get the details of a single connector.
         Args:
@@ -201,11 +653,11 @@ class KafkaConnect:
             Dict[str, Any]: The details of the connector.
         """
         self.logger.info(f"Getting {connector} connector")
-        url = f"{self.url}/connectors/{connector}"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
+    @cached
     def get_connector_config(self, connector):
         """Get the configuration of a single connector.
         Args:
@@ -214,10 +666,9 @@ class KafkaConnect:
             Dict[str, Any]: The configuration of the connector.
         """
         self.logger.info(f"Getting connector config: {connector}")
-        url = f"{self.url}/connectors/{connector}/config"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}/config")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     def get_connector_status(self, connector):
         """Get the status of a single connector.
@@ -227,11 +678,11 @@ class KafkaConnect:
             Dict[str, Any]: The status of the connector.
         """
         self.logger.info(f"Getting connector status: {connector}")
-        url = f"{self.url}/connectors/{connector}/status"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}/status")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
+    @evicts
     def restart_connector(self, connector, include_tasks=False, only_failed=False):
         """Restart a single connector.
         Args:
@@ -243,16 +694,15 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Restarting {connector} connector")
-        url = f"{self.url}/connectors/{connector}/restart"
         params = {"includeTasks": include_tasks, "onlyFailed": only_failed}
-        response = requests.post(url, auth=self.auth, verify=self.verify, params=params)
+        response = self.__request("POST", f"/connectors/{connector}/restart", params=params)
 
         if response.status_code == 200:
             self.logger.info("Connector restarted successfully, but no response body returned.")
-            return response.json()
+            return loads(response.content)
         elif response.status_code == 202:
             self.logger.info("Connector restart request accepted, but no response body returned.")
-            return response.json()
+            return loads(response.content)
         elif response.status_code == 204:
             self.logger.info("Connector restart request successful, but no response body returned.")
         elif response.status_code == 404:
@@ -269,7 +719,13 @@ class KafkaConnect:
         return None
 
     def restart_all_connectors(
-        self, include_tasks=False, only_failed=False, pattern=None, state=None
+        self,
+        include_tasks=False,
+        only_failed=False,
+        pattern=None,
+        state=None,
+        max_workers=1,
+        callback=None,
     ):
         """Restart all connectors.
         Args:
@@ -277,19 +733,71 @@ class KafkaConnect:
             only_failed (bool): Whether to only restart failed tasks. Default is False.
             pattern (str): The regex pattern to match the connector name. Defaults to `None`.
             state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to restart concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and the response, or the raised exception,
+                of each connector as soon as it completes. Defaults to `None`.
         Returns:
             Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
         """
         self.logger.info(
             f"Restarting all{' ' + state if state else ''} connectors{' matching the pattern: ' + pattern if pattern else ''}"
         )
-        responses = {}
-        for connector, status in self.list_connectors(
-            expand="status", pattern=pattern, state=state
-        ).items():
-            self.restart_connector(connector, include_tasks, only_failed)
-        return None
+        return self.__run_all(
+            self.restart_connector,
+            self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            callback,
+            include_tasks=include_tasks,
+            only_failed=only_failed,
+        )
+
+    def restart_failed_tasks(self, pattern=None, max_workers=1, callback=None):
+        """Restart every failed connector and task, found with a single `expand=status` listing.
+        A connector whose instance runs and that has a single failed task is restarted with a per-task call, which
+        leaves the instance alone. Otherwise the failed instance and tasks are restarted with a single
+        `restart_connector(include_tasks=True, only_failed=True)` call instead of one call per task.
+        Args:
+            pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to restart concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and what was restarted, or the raised
+                exception, of each connector as soon as it completes. Defaults to `None`.
+        Returns:
+            Dict[str, Any]: What was restarted, as a dictionary with whether the `connector` instance failed and
+                the IDs of the failed `tasks`, or the raised exception, keyed by the name of each connector with a
+                failure.
+        """
+        self.logger.info(
+            f"Restarting all failed connectors and tasks{' matching the pattern: ' + pattern if pattern else ''}"
+        )
+        start = time.perf_counter()
+        failures = {}
+        for connector, data in self.list_connectors(expand="status", pattern=pattern).items():
+            status = data.get("status", {})
+            failed = status.get("connector", {}).get("state") == "FAILED"
+            tasks = [
+                task.get("id") for task in status.get("tasks", []) if task.get("state") == "FAILED"
+            ]
+            if failed or tasks:
+                failures[connector] = {"connector": failed, "tasks": tasks}
+
+        def restart_failed(connector):
+            failure = failures[connector]
+            if not failure["connector"] and len(failure["tasks"]) == 1:
+                self.restart_connector_task(connector, failure["tasks"][0])
+            else:
+                self.restart_connector(connector, include_tasks=True, only_failed=True)
+            return failure
+
+        results = self.__run_all(restart_failed, failures, max_workers, callback)
+        restarted = [result for result in results.values() if not isinstance(result, Exception)]
+        self.logger.info(
+            f"Restarted {sum(result['connector'] for result in restarted)} connectors and "
+            f"{sum(len(result['tasks']) for result in restarted)} tasks of {len(restarted)} of {len(results)} "
+            f"failed connectors in {time.perf_counter() - start:.2f}s"
+        )
+        return results
 
+    @evicts
     def pause_connector(self, connector):
         """Pause a single connector.
         Args:
@@ -298,30 +806,34 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Pausing {connector} connector")
-        url = f"{self.url}/connectors/{connector}/pause"
-        response = requests.put(url, auth=self.auth, verify=self.verify)
+        response = self.__request("PUT", f"/connectors/{connector}/pause")
         if response.status_code == 202:
             self.logger.info("Connector paused successful, but no response body returned.")
         response.raise_for_status()
         return None
 
-    def pause_all_connectors(self, pattern=None, state=None):
+    def pause_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
         """Pause all connectors.
         Args:
             pattern (str): The regex pattern to match the connector name. Defaults to `None`.
             state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to pause concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and the response, or the raised exception,
+                of each connector as soon as it completes. Defaults to `None`.
         Returns:
             Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
         """
         self.logger.info(
             f"Pausing all{' ' + state if state else ''} connectors{' matching the pattern: ' + pattern if pattern else ''}"
         )
-        for connector, status in self.list_connectors(
-            expand="status", pattern=pattern, state=state
-        ).items():
-            self.pause_connector(connector)
-        return None
+        return self.__run_all(
+            self.pause_connector,
+            self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            callback,
+        )
 
+    @evicts
     def resume_connector(self, connector):
         """Resume a single connector.
         Args:
@@ -330,30 +842,34 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Resuming {connector} connector")
-        url = f"{self.url}/connectors/{connector}/resume"
-        response = requests.put(url, auth=self.auth, verify=self.verify)
+        response = self.__request("PUT", f"/connectors/{connector}/resume")
         if response.status_code == 202:
             self.logger.debug("Connector resumed successful, but no response body returned.")
         response.raise_for_status()
         return None
 
-    def resume_all_connectors(self, pattern=None, state=None):
+    def resume_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
         """Resume all connectors.
         Args:
             pattern (str): The regex pattern to match the connector name. Defaults to `None`.
             state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to resume concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and the response, or the raised exception,
+                of each connector as soon as it completes. Defaults to `None`.
         Returns:
             Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
         """
         self.logger.info(
             f"Resuming all{' ' + state if state else ''} connectors{' matching the pattern: ' + pattern if pattern else ''}"
         )
-        for connector, status in self.list_connectors(
-            expand="status", pattern=pattern, state=state
-        ).items():
-            self.resume_connector(connector)
-        return None
+        return self.__run_all(
+            self.resume_connector,
+            self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            callback,
+        )
 
+    @evicts
     def stop_connector(self, connector):
         """Stop a single connector.
         Args:
@@ -362,30 +878,34 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Stopping {connector} connector")
-        url = f"{self.url}/connectors/{connector}/stop"
-        response = requests.put(url, auth=self.auth, verify=self.verify)
+        response = self.__request("PUT", f"/connectors/{connector}/stop")
         if response.status_code == 202:
             self.logger.info("Connector stopped successfully, but no response body returned.")
         response.raise_for_status()
         return None
 
-    def stop_all_connectors(self, pattern=None, state=None):
+    def stop_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
         """Stop all connectors.
         Args:
             pattern (str): The regex pattern to match the connector name. Defaults to `None`.
             state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to stop concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and the response, or the raised exception,
+                of each connector as soon as it completes. Defaults to `None`.
         Returns:
             Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
         """
         self.logger.info(
             f"Stopping  all{' ' + state if state else ''} connectors{' matching the pattern: ' + pattern if pattern else ''}"
         )
-        for connector, status in self.list_connectors(
-            expand="status", pattern=pattern, state=state
-        ).items():
-            self.stop_connector(connector)
-        return None
+        return self.__run_all(
+            self.stop_connector,
+            self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            callback,
+        )
 
+    @evicts
     def delete_connector(self, connector):
         """Delete a single connector.
         Args:
@@ -394,30 +914,157 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Deleting {connector} connector")
-        url = f"{self.url}/connectors/{connector}"
-        response = requests.delete(url, auth=self.auth, verify=self.verify)
+        response = self.__request("DELETE", f"/connectors/{connector}")
         if response.status_code == 204:
             self.logger.info("Connector deleted successful, but no content returned.")
         response.raise_for_status()
         return None
 
-    def delete_all_connectors(self, pattern=None, state=None):
+    def delete_all_connectors(self, pattern=None, state=None, max_workers=1, callback=None):
         """Delete all connectors.
         Args:
             pattern (str): The regex pattern to match the connector name. Defaults to `None`.
             state (str): The connector state to match the connectors status. Defaults to `None`.
+            max_workers (int): The maximum number of connectors to delete concurrently. Defaults to 1.
+            callback (Callable[[str, Any], None]): Called with the name and the response, or the raised exception,
+                of each connector as soon as it completes. Defaults to `None`.
         Returns:
             Dict[str, Dict[str, Any]]: A dictionary of responses, where the keys are the connector names and the values are the responses.
         """
         self.logger.info(
             f"Deleting all{' ' + state if state else ''} connectors{' matching the pattern: ' + pattern if pattern else ''}"
         )
-        for connector, status in self.list_connectors(
-            expand="status", pattern=pattern, state=state
-        ).items():
-            self.delete_connector(connector)
-        return None
+        return self.__run_all(
+            self.delete_connector,
+            self.list_connectors(pattern=pattern, state=state),
+            max_workers,
+            callback,
+        )
 
+    def apply_connectors(self, configs, prune=False, dry_run=False, max_workers=1):
+        """Reconcile the cluster with the desired connector configurations.
+        The live configurations are fetched in a single `expand=info` request, and only the connectors whose
+        configuration differs are created or updated, so unchanged connectors are not rebalanced.
+        Args:
+            configs (Dict[str, Dict[str, Any]]): The desired configurations keyed by connector name.
+            prune (bool): Whether to delete the connectors that are not in `configs`. Defaults to False.
+            dry_run (bool): Whether to only plan the changes without making them. Defaults to False.
+            max_workers (int): The maximum number of connectors to change concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Any]: The connector names to `create`, `update` and `delete`, those left `unchanged`, and the
+                exception of each connector that `failed` to change.
+        """
+        live = {
+            conn: data.get("info", {}).get("config", {})
+            for conn, data in self.list_connectors(expand="info").items()
+        }
+        plan = plan_changes(configs, live, prune=prune)
+        plan["failed"] = {}
+        self.logger.info(
+            f"Planned {len(plan['create'])} to create, {len(plan['update'])} to update, "
+            f"{len(plan['delete'])} to delete and {len(plan['unchanged'])} unchanged connectors"
+        )
+        if dry_run:
+            return plan
+
+        def apply_connector(connector):
+            if connector in configs:
+                return self.update_connector(
+                    connector, normalize_config(configs[connector], connector)[1]
+                )
+            return self.delete_connector(connector)
+
+        results = self.__run_all(
+            apply_connector, plan["create"] + plan["update"] + plan["delete"], max_workers
+        )
+        plan["failed"] = {
+            conn: resp for conn, resp in results.items() if isinstance(resp, Exception)
+        }
+        return plan
+
+    # The details that `export_connectors` can add to the configurations
+    EXPORT_DETAILS = ("status", "tasks", "topics")
+
+    def export_connectors(self, pattern=None, include=(), max_workers=1):
+        """Fetch the configurations of the connectors to back them up, and optionally their details.
+        The configurations and statuses are fetched with a single `expand` listing. The task configurations and
+        topics need a request per connector, which run concurrently.
+        Args:
+            pattern (str): Only export the connectors that match the regex pattern.
+            include (str or List[str]): The details to add to each connector: "status", "tasks" and "topics".
+                Defaults to none.
+            max_workers (int): The maximum number of concurrent per-connector requests. Defaults to 1.
+        Returns:
+            Dict[str, Any]: The backup, with a `manifest` describing the cluster and the export, the `connectors`
+                keyed by name, each with its `name`, `config`, `type` and included details, and the exception of
+                each connector whose details `failed` to be fetched.
+        Raises:
+            ValueError: If `include` has an unknown detail.
+        """
+        include = [include] if isinstance(include, str) else list(include)
+        unknown = [detail for detail in include if detail not in self.EXPORT_DETAILS]
+        if unknown:
+            raise ValueError(
+                f"Invalid detail: {', '.join(unknown)}. "
+                f"Expected one of {', '.join(self.EXPORT_DETAILS)}."
+            )
+        start = time.perf_counter()
+        cluster = self.get_cluster_info()
+        expand = ["info", "status"] if "status" in include else ["info"]
+        connectors = {}
+        for name, data in self.list_connectors(expand=expand, pattern=pattern).items():
+            info = data.get("info", {})
+            connectors[name] = {
+                "name": name,
+                "config": info.get("config", {}),
+                "type": info.get("type"),
+            }
+            if "status" in data:
+                connectors[name]["status"] = data["status"]
+
+        details = [detail for detail in include if detail in ("tasks", "topics")]
+
+        def export_connector(connector):
+            if "tasks" in details:
+                connectors[connector]["tasks"] = self.list_connector_tasks(connector)
+            if "topics" in details:
+                topics = self.list_connector_topics(connector)
+                connectors[connector]["topics"] = topics.get(connector, {}).get("topics", [])
+
+        failed = {}
+        if details:
+            results = self.__run_all(export_connector, connectors, max_workers)
+            failed = {conn: resp for conn, resp in results.items() if isinstance(resp, Exception)}
+
+        self.logger.info(
+            f"Exported {len(connectors)} connectors in {time.perf_counter() - start:.2f}s"
+        )
+        manifest = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "cluster": cluster,
+            "include": include,
+            "connectors": len(connectors),
+        }
+        return {"manifest": manifest, "connectors": connectors, "failed": failed}
+
+    def import_connectors(self, backup, dry_run=False, max_workers=1):
+        """Recreate or update the connectors of a backup made by `export_connectors`.
+        The connectors whose live configuration is identical to the backed up one are skipped, so restoring a
+        backup onto a cluster that already runs it changes nothing. Connectors missing from the backup are kept.
+        Args:
+            backup (Dict[str, Any]): The backup, such as read by `kafka_connect.backup.read_backup`.
+            dry_run (bool): Whether to only plan the changes without making them. Defaults to False.
+            max_workers (int): The maximum number of connectors to change concurrently. Defaults to 1.
+        Returns:
+            Dict[str, Any]: The connector names to `create` and `update`, those left `unchanged`, and the
+                exception of each connector that `failed` to change, as returned by `apply_connectors`.
+        """
+        configs = {name: connector["config"] for name, connector in backup["connectors"].items()}
+        plan = self.apply_connectors(configs, dry_run=dry_run, max_workers=max_workers)
+        del plan["delete"]
+        return plan
+
+    @cached
     def list_connector_tasks(self, connector):
         """Get the list of tasks for a connector.
         Args:
@@ -426,10 +1073,9 @@ class KafkaConnect:
             List[int]: The list of task IDs for the connector.
         """
         self.logger.info(f"Getting tasks for {connector} connector")
-        url = f"{self.url}/connectors/{connector}/tasks"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}/tasks")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     def get_connector_task_status(self, connector, task_id):
         """Get the status of a specific task for a connector.
@@ -440,11 +1086,11 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API.
         """
         self.logger.info(f"Getting task status for {task_id} task for {connector} connector")
-        url = f"{self.url}/connectors/{connector}/tasks/{task_id}/status"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}/tasks/{task_id}/status")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
+    @evicts
     def restart_connector_task(self, connector, task_id):
         """Restart a specific task of a connector.
         Args:
@@ -454,8 +1100,7 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Restarting {task_id} task of {connector} connector")
-        url = f"{self.url}/connectors/{connector}/tasks/{task_id}/restart"
-        response = requests.post(url, auth=self.auth, verify=self.verify)
+        response = self.__request("POST", f"/connectors/{connector}/tasks/{task_id}/restart")
         if response.status_code == 200:
             self.logger.info(
                 "Connector topic names reset successful, but no response body returned."
@@ -463,6 +1108,7 @@ class KafkaConnect:
         response.raise_for_status()
         return None
 
+    @cached
     def list_connector_topics(self, connector):
         """Get the list of topics for a connector.
         Args:
@@ -471,11 +1117,11 @@ class KafkaConnect:
             List[str]: The list of topics for the connector.
         """
         self.logger.info(f"Getting topics for {connector} connector")
-        url = f"{self.url}/connectors/{connector}/topics"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", f"/connectors/{connector}/topics")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
+    @evicts
     def reset_connector_topics(self, connector):
         """Reset the list of topics for a connector.
         Args:
@@ -484,8 +1130,7 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Resetting topics for {connector} connector")
-        url = f"{self.url}/connectors/{connector}/topics/reset"
-        response = requests.put(url, auth=self.auth, verify=self.verify)
+        response = self.__request("PUT", f"/connectors/{connector}/topics/reset")
         if response.status_code == 200:
             self.logger.info(
                 "Connector topic names reset successful, but no response body returned."
@@ -493,17 +1138,45 @@ class KafkaConnect:
         response.raise_for_status()
         return None
 
+    @cached
     def list_connector_plugins(self):
         """Get the list of connector plugins.
         Args:
         Returns:
             List[Dict[str, Any]]: The list of connector plugins.
         """
+        if self.disk_cache is not None:
+            # The plugins only change when the workers are redeployed, which changes the version or commit
+            return self.disk_cache.get_or_load(
+                self.url,
+                "connector-plugins",
+                self.__list_connector_plugins,
+                version=self.__get_cluster_version(),
+            )
+        return self.__list_connector_plugins()
+
+    def __get_cluster_version(self):
+        """Get the version and commit of the cluster that key the cached connector plugins.
+        The cluster info cached on disk would keep serving the plugins of the old workers after a deploy, so it is
+        fetched fresh, and only trusted for `CLUSTER_VERSION_TTL` seconds.
+        Returns:
+            str: The version and commit, separated by a slash.
+        """
+        now = time.monotonic()
+        if (
+            self.__cluster_version is None
+            or now - self.__cluster_version[0] >= self.CLUSTER_VERSION_TTL
+        ):
+            info = self.__get_cluster_info()
+            self.disk_cache.set(self.url, "cluster-info", info)
+            self.__cluster_version = (now, f"{info.get('version')}/{info.get('commit')}")
+        return self.__cluster_version[1]
+
+    def __list_connector_plugins(self):
         self.logger.info("Getting connector plugins")
-        url = f"{self.url}/connector-plugins"
-        response = requests.get(url, auth=self.auth, verify=self.verify)
+        response = self.__request("GET", "/connector-plugins")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     def validate_connector_config(self, plugin, config):
         """Validate the configuration for a specific connector plugin.
@@ -514,13 +1187,11 @@ class KafkaConnect:
             Dict[str, Any]: The response from the REST API, or an empty dictionary if the response is null or if there is a JSONDecodeError.
         """
         self.logger.info(f"Validating config for plugin: {plugin}")
-        url = f"{self.url}/connector-plugins/{plugin}/config/validate"
-        response = requests.put(
-            url,
-            auth=self.auth,
-            verify=self.verify,
+        response = self.__request(
+            "PUT",
+            f"/connector-plugins/{plugin}/config/validate",
             headers=self.headers,
-            data=json.dumps(config),
+            data=encode(config),
         )
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
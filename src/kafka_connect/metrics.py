@@ -0,0 +1,199 @@
+import bisect
+import re
+import threading
+
+# The upper bounds in seconds of the latency histogram buckets, from a fast local read to a slow rebalance
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_TEMPLATES = [
+    (re.compile(r"^/connectors/[^/]+"), "/connectors/{name}"),
+    (re.compile(r"/tasks/[^/]+"), "/tasks/{task}"),
+    (re.compile(r"^/connector-plugins/[^/]+/"), "/connector-plugins/{plugin}/"),
+]
+
+
+def endpoint_template(path):
+    """Replace the connector name, task ID and plugin of a request path with placeholders.
+    Args:
+        path (str): The path relative to the base URL, such as `/connectors/my-connector/status`.
+    Returns:
+        str: The endpoint template, such as `/connectors/{name}/status`.
+    """
+    for pattern, template in _TEMPLATES:
+        path = pattern.sub(template, path, count=1)
+    return path or "/"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels):
+    """Format the labels of a Prometheus sample, escaping their values.
+    Args:
+        labels (Dict[str, Any]): The label values keyed by label name.
+    Returns:
+        str: The labels, such as `method="GET",endpoint="/connectors"`.
+    """
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _format(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Endpoint:
+    """The counters and latency histogram of a single endpoint."""
+
+    __slots__ = (
+        "status_codes",
+        "errors",
+        "retries",
+        "bytes_sent",
+        "bytes_received",
+        "buckets",
+        "sum",
+    )
+
+    def __init__(self, buckets):
+        self.status_codes = {}
+        self.errors = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        # One count per bucket plus one for the latencies above the largest bound
+        self.buckets = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+
+class RequestMetrics:
+    """Thread-safe request counters and latency histograms, keyed by HTTP method and endpoint template.
+    Every attempt of a request is recorded, so a request that is retried twice counts three times and two retries.
+    Args:
+        buckets (Iterable[float]): The upper bounds in seconds of the latency histogram buckets. Defaults to
+            `DEFAULT_BUCKETS`.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def __endpoint(self, key):
+        """Get the metrics of an endpoint, creating them on its first request. Must be called with the lock held."""
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = _Endpoint(self.buckets)
+        return endpoint
+
+    def observe(self, method, path, latency, status_code=None, bytes_sent=0, bytes_received=0):
+        """Record an attempt of a request.
+        Args:
+            method (str): The HTTP method.
+            path (str): The path relative to the base URL.
+            latency (float): The number of seconds until the response was received or the attempt failed.
+            status_code (int): The status code of the response, or `None` if no response was received.
+            bytes_sent (int): The size of the request body. Defaults to 0.
+            bytes_received (int): The size of the response body. Defaults to 0.
+        """
+        key = (method, endpoint_template(path))
+        index = bisect.bisect_left(self.buckets, latency)
+        with self._lock:
+            endpoint = self.__endpoint(key)
+            if status_code is None:
+                endpoint.errors += 1
+            else:
+                endpoint.status_codes[status_code] = endpoint.status_codes.get(status_code, 0) + 1
+            endpoint.bytes_sent += bytes_sent
+            endpoint.bytes_received += bytes_received
+            endpoint.buckets[index] += 1
+            endpoint.sum += latency
+
+    def retry(self, method, path):
+        """Record the retry of a failed attempt.
+        Args:
+            method (str): The HTTP method.
+            path (str): The path relative to the base URL.
+        """
+        key = (method, endpoint_template(path))
+        with self._lock:
+            self.__endpoint(key).retries += 1
+
+    def reset(self):
+        """Drop every recorded request."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self):
+        """Get a copy of the metrics.
+        Returns:
+            Dict[str, Dict[str, Any]]: The metrics keyed by method and endpoint template, such as
+                `GET /connectors/{name}/status`. Each holds the number of `requests`, their `status_codes`, the
+                `errors` without a response, the `retries`, the `bytes_sent` and `bytes_received`, and a `latency`
+                histogram with its `count`, `sum` and cumulative `buckets` keyed by upper bound.
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            snapshot = {}
+            for (method, template), endpoint in endpoints:
+                count, buckets = 0, {}
+                for bound, bucket in zip(self.buckets + (float("inf"),), endpoint.buckets):
+                    count += bucket
+                    buckets[bound] = count
+                snapshot[f"{method} {template}"] = {
+                    "requests": count,
+                    "status_codes": dict(sorted(endpoint.status_codes.items())),
+                    "errors": endpoint.errors,
+                    "retries": endpoint.retries,
+                    "bytes_sent": endpoint.bytes_sent,
+                    "bytes_received": endpoint.bytes_received,
+                    "latency": {"count": count, "sum": endpoint.sum, "buckets": buckets},
+                }
+        return snapshot
+
+    def to_prometheus(self, prefix="kafka_connect_client"):
+        """Export the metrics in the Prometheus text exposition format.
+        Args:
+            prefix (str): The prefix of the metric names. Defaults to "kafka_connect_client".
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        snapshot = self.snapshot()
+        families = [
+            ("requests_total", "counter", "The number of requests by status code."),
+            (
+                "request_errors_total",
+                "counter",
+                "The number of requests that received no response.",
+            ),
+            ("request_retries_total", "counter", "The number of retried requests."),
+            ("request_bytes_total", "counter", "The number of request body bytes sent."),
+            ("response_bytes_total", "counter", "The number of response body bytes received."),
+            ("request_duration_seconds", "histogram", "The latency of requests in seconds."),
+        ]
+        lines = []
+        for name, kind, description in families:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for key, endpoint in snapshot.items():
+                method, template = key.split(" ", 1)
+                labels = format_labels({"method": method, "endpoint": template})
+                if name == "requests_total":
+                    for code, count in endpoint["status_codes"].items():
+                        lines.append(f'{prefix}_{name}{{{labels},code="{code}"}} {count}')
+                elif name == "request_duration_seconds":
+                    latency = endpoint["latency"]
+                    for bound, count in latency["buckets"].items():
+                        le = "+Inf" if bound == float("inf") else _format(bound)
+                        lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f"{prefix}_{name}_sum{{{labels}}} {_format(latency['sum'])}")
+                    lines.append(f"{prefix}_{name}_count{{{labels}}} {latency['count']}")
+                else:
+                    field = {
+                        "request_errors_total": "errors",
+                        "request_retries_total": "retries",
+                        "request_bytes_total": "bytes_sent",
+                        "response_bytes_total": "bytes_received",
+                    }[name]
+                    lines.append(f"{prefix}_{name}{{{labels}}} {endpoint[field]}")
+        return "\n".join(lines) + "\n"
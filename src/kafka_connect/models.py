@@ -0,0 +1,199 @@
+import sys
+import zlib
+
+
+def intern_value(value):
+    """Keep a single copy of a string that repeats across connectors, such as a state, worker ID or type.
+    Args:
+        value (Any): The value. Values that are not strings, such as `None`, are returned unchanged.
+    Returns:
+        Any: The interned string, or the value.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Status:
+    """The state shared by the status of a connector instance and of a task."""
+
+    __slots__ = ("state", "worker_id", "_trace")
+
+    def __init__(self, state, worker_id=None, trace=None):
+        self.state = intern_value(state)
+        self.worker_id = intern_value(worker_id)
+        # Stack traces are large and rarely read, so they are kept compressed and decompressed on access
+        self._trace = zlib.compress(trace.encode(), 1) if trace else trace
+
+    @property
+    def trace(self):
+        """str: The stack trace of the failure, or `None`."""
+        return zlib.decompress(self._trace).decode() if self._trace else self._trace
+
+    def _fields(self):
+        fields = {"state": self.state, "worker_id": self.worker_id}
+        if self._trace is not None:
+            fields["trace"] = self.trace
+        return fields
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class TaskStatus(_Status):
+    """The status of a task, backed by `__slots__`.
+    Args:
+        id (int): The ID of the task.
+        state (str): The state, such as "RUNNING" or "FAILED".
+        worker_id (str): The worker the task is assigned to.
+        trace (str): The stack trace of the failure, if the task failed.
+    """
+
+    __slots__ = ("id",)
+
+    def __init__(self, id, state, worker_id=None, trace=None):
+        super().__init__(state, worker_id, trace)
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build the status of a task from the REST API representation.
+        Args:
+            data (Dict[str, Any]): The task status, such as returned by `get_connector_task_status`.
+        Returns:
+            TaskStatus: The status.
+        """
+        return cls(data.get("id"), data.get("state"), data.get("worker_id"), data.get("trace"))
+
+    def to_dict(self):
+        """Convert the status back to the REST API representation.
+        Returns:
+            Dict[str, Any]: The task status.
+        """
+        return {"id": self.id, **self._fields()}
+
+
+class ConnectorStatus(_Status):
+    """The status of a connector and its tasks, with the state of the connector instance as attributes.
+    Args:
+        name (str): The name of the connector.
+        state (str): The state of the connector instance.
+        worker_id (str): The worker the connector instance is assigned to.
+        tasks (Iterable[TaskStatus]): The statuses of the tasks. Defaults to none.
+        type (str): The type of the connector, "sink" or "source".
+        trace (str): The stack trace of the failure, if the connector instance failed.
+    """
+
+    __slots__ = ("name", "type", "tasks")
+
+    def __init__(self, name, state, worker_id=None, tasks=(), type=None, trace=None):
+        super().__init__(state, worker_id, trace)
+        self.name = name
+        self.type = intern_value(type)
+        self.tasks = tuple(tasks)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build the status of a connector from the REST API representation.
+        Args:
+            data (Dict[str, Any]): The connector status, such as returned by `get_connector_status`.
+        Returns:
+            ConnectorStatus: The status.
+        """
+        connector = data.get("connector", {})
+        return cls(
+            data.get("name"),
+            connector.get("state"),
+            connector.get("worker_id"),
+            tasks=(TaskStatus.from_dict(task) for task in data.get("tasks", [])),
+            type=data.get("type"),
+            trace=connector.get("trace"),
+        )
+
+    def to_dict(self):
+        """Convert the status back to the REST API representation.
+        Returns:
+            Dict[str, Any]: The connector status.
+        """
+        data = {
+            "name": self.name,
+            "connector": self._fields(),
+            "tasks": [task.to_dict() for task in self.tasks],
+        }
+        if self.type is not None:
+            data["type"] = self.type
+        return data
+
+
+class ConnectorInfo:
+    """The configuration and task IDs of a connector.
+    Args:
+        name (str): The name of the connector.
+        config (Dict[str, str]): The configuration.
+        tasks (Iterable[int]): The IDs of the tasks. Defaults to none.
+        type (str): The type of the connector, "sink" or "source".
+    """
+
+    __slots__ = ("name", "config", "tasks", "type")
+
+    def __init__(self, name, config, tasks=(), type=None):
+        self.name = name
+        self.config = {sys.intern(key): value for key, value in config.items()}
+        self.tasks = tuple(tasks)
+        self.type = intern_value(type)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build the details of a connector from the REST API representation.
+        Args:
+            data (Dict[str, Any]): The connector details, such as returned by `get_connector`.
+        Returns:
+            ConnectorInfo: The details.
+        """
+        return cls(
+            data.get("name"),
+            data.get("config", {}),
+            tasks=(task.get("task") for task in data.get("tasks", [])),
+            type=data.get("type"),
+        )
+
+    def to_dict(self):
+        """Convert the details back to the REST API representation.
+        Returns:
+            Dict[str, Any]: The connector details.
+        """
+        return {
+            "name": self.name,
+            "config": dict(self.config),
+            "tasks": [{"connector": self.name, "task": task} for task in self.tasks],
+            "type": self.type,
+        }
+
+    def __eq__(self, other):
+        if type(other) is not ConnectorInfo:
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"ConnectorInfo(name={self.name!r}, type={self.type!r}, tasks={self.tasks!r})"
+
+
+MODELS = {"status": ConnectorStatus, "info": ConnectorInfo}
+
+
+def to_models(connectors):
+    """Convert the expansions of a connector listing to typed models.
+    Args:
+        connectors (Dict[str, Dict[str, Any]]): The connectors listed with `expand="status"` or `expand="info"`.
+    Returns:
+        Dict[str, Dict[str, Any]]: The same listing with a `ConnectorStatus` and a `ConnectorInfo` in place of
+            the `status` and `info` dictionaries.
+    """
+    return {
+        name: {key: MODELS[key].from_dict(value) for key, value in data.items()}
+        for name, data in connectors.items()
+    }
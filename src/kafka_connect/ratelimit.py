@@ -0,0 +1,41 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """A thread-safe token bucket that limits the rate of requests.
+    Tokens refill continuously at `rate` per second up to `burst`. A caller that finds the bucket empty reserves
+    the next token and sleeps until it is due, so concurrent callers are served in turn without busy-waiting.
+    Args:
+        rate (float): The sustained number of requests per second.
+        burst (int): The number of requests that may be sent at once after an idle period. Defaults to
+            `max(1, rate)`.
+        clock (Callable[[], float]): The monotonic clock. Defaults to `time.monotonic`.
+        sleep (Callable[[float], None]): The function used to wait. Defaults to `time.sleep`.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("The rate must be a positive number of requests per second.")
+        self.rate = rate
+        self.burst = burst if burst else max(1, rate)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting until one is available.
+        Returns:
+            float: The number of seconds spent waiting.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            self.sleep(wait)
+        return wait
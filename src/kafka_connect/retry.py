@@ -0,0 +1,69 @@
+import random
+import threading
+
+# The REST API also answers 409 to conflicts that no retry resolves, such as creating a connector that already
+# exists, so a 409 is only retried when its message names a rebalance or a stale configuration
+REBALANCE_MESSAGES = ("rebalance", "stale configuration")
+
+
+class RetryPolicy:
+    """A policy for retrying requests that fail with a retryable status code or a connection error.
+    Retries wait for an exponentially growing delay with full jitter, i.e. a random delay between zero and
+    `min(max_delay, base_delay * 2 ** (attempt - 1))` seconds.
+    Args:
+        max_attempts (int): The maximum number of attempts, including the first one. Defaults to 5.
+        base_delay (float): The maximum number of seconds to wait before the first retry. Defaults to 0.5.
+        max_delay (float): The cap on the number of seconds to wait before any retry. Defaults to 30.
+        retry_on_status (Iterable[int]): The retryable status codes. Defaults to 409, 500 and 503. A 409 is only
+            retried while the workers rebalance.
+        retry_on_connection_errors (bool): Whether to retry connection errors. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        max_attempts=5,
+        base_delay=0.5,
+        max_delay=30,
+        retry_on_status=(409, 500, 503),
+        retry_on_connection_errors=True,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on_status = frozenset(retry_on_status)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def should_retry(self, attempt, status_code=None, error=None, message=None):
+        """Decide whether a failed attempt should be retried, counting the retry if so.
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+            status_code (int): The status code of the response, if one was received.
+            error (Exception): The connection error raised by the attempt, if any.
+            message (str): The body of the response, which tells a 409 during a rebalance from other conflicts.
+        Returns:
+            bool: Whether to retry.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            retryable = self.retry_on_connection_errors
+        else:
+            retryable = status_code in self.retry_on_status
+            if retryable and status_code == 409:
+                message = (message or "").lower()
+                retryable = any(m in message for m in REBALANCE_MESSAGES)
+        if retryable:
+            with self._lock:
+                self.retries += 1
+        return retryable
+
+    def delay(self, attempt):
+        """Get the number of seconds to wait before retrying a failed attempt.
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+        Returns:
+            float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
@@ -0,0 +1,112 @@
+import codecs
+import json
+import re
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+
+
+class _Buffer:
+    """The unread text of a JSON document that arrives in chunks.
+    Consumed text is dropped whenever a chunk is appended, so the buffer only grows to the size of the value being
+    read plus one chunk.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+
+    def more(self):
+        """Append the next non-empty chunk, returning False at the end of the document."""
+        for chunk in self.chunks:
+            if isinstance(chunk, bytes):
+                chunk = self.decoder.decode(chunk)
+            if chunk:
+                self.text = self.text[self.pos :] + chunk
+                self.pos = 0
+                return True
+        return False
+
+    def skip_whitespace(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not self.more():
+                return
+
+    def expect(self, chars):
+        """Consume one of the given structural characters."""
+        self.skip_whitespace()
+        if self.pos >= len(self.text) or self.text[self.pos] not in chars:
+            found = self.text[self.pos : self.pos + 20] or "the end of the document"
+            raise ValueError(f"Expected one of {chars!r} in the JSON document, found {found!r}")
+        self.pos += 1
+        return self.text[self.pos - 1]
+
+    def decode(self):
+        """Decode the next JSON value, appending chunks until it is complete."""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise ValueError("Unexpected end of the JSON document") from None
+                continue
+            # A number that ends the text may continue in the next chunk
+            if end < len(self.text) or not self.more():
+                self.pos = end
+                return value
+
+
+def iter_object(chunks):
+    """Iterate over the members of a JSON object document as it is read.
+    Only the member being decoded and the unread part of the current chunk are held in memory, so members that the
+    caller drops are released before the next one is decoded.
+    Args:
+        chunks (Iterable[bytes or str]): The chunks of the document. Bytes are decoded as UTF-8.
+    Returns:
+        Iterator[Tuple[str, Any]]: The key and the decoded value of each member.
+    Raises:
+        ValueError: If the document is not a well-formed JSON object.
+    """
+    buffer = _Buffer(chunks)
+    buffer.expect("{")
+    buffer.skip_whitespace()
+    if buffer.text.startswith("}", buffer.pos):
+        return
+    while True:
+        key = buffer.decode()
+        if not isinstance(key, str):
+            raise ValueError(
+                f"Expected a JSON string as the key of an object member, found {key!r}"
+            )
+        buffer.expect(":")
+        yield key, buffer.decode()
+        if buffer.expect(",}") == "}":
+            return
+
+
+def iter_matching(chunks, pattern=None, state=None, expand=None):
+    """Decode the connectors of an expanded `GET /connectors` response as it is read, yielding only the matches.
+    Each connector is matched as soon as it is decoded, so a caller that consumes them one at a time only holds the
+    connector being decoded.
+    Args:
+        chunks (Iterable[bytes or str]): The chunks of the response body.
+        pattern (str): The regex pattern to match the connector name. Defaults to `None`.
+        state (str): The connector state to match. Defaults to `None`.
+        expand (Iterable[str]): The expansions to keep, such as "info". Defaults to `None`, which keeps them all.
+    Returns:
+        Iterator[Tuple[str, Dict[str, Any]]]: The name and the expansions of each matching connector.
+    """
+    for name, data in iter_object(chunks):
+        if pattern and not re.match(pattern, name):
+            continue
+        if state:
+            connector = data.get("status", {}).get("connector", {})
+            if connector.get("state", "").lower() != state.lower():
+                continue
+        if expand is not None:
+            data = {key: value for key, value in data.items() if key in expand}
+        yield name, data
@@ -0,0 +1,58 @@
+def snapshot(connectors):
+    """Reduce an `expand=status` listing to the states needed to detect transitions.
+    Args:
+        connectors (Dict[str, Any]): The connectors listed with `expand="status"`.
+    Returns:
+        Dict[str, Tuple[str, str, Dict[int, Tuple[str, str]]]]: The connector state, worker ID and task states
+            keyed by connector name.
+    """
+    states = {}
+    for name, data in connectors.items():
+        status = data.get("status", {})
+        connector = status.get("connector", {})
+        tasks = {
+            task.get("id"): (task.get("state"), task.get("worker_id"))
+            for task in status.get("tasks", [])
+        }
+        states[name] = (connector.get("state"), connector.get("worker_id"), tasks)
+    return states
+
+
+def diff_snapshots(previous, current):
+    """List the connector and task state transitions between two snapshots.
+    A connector or task missing from one of the snapshots has a `None` state there.
+    Args:
+        previous (Dict[str, Any]): The previous snapshot.
+        current (Dict[str, Any]): The current snapshot.
+    Returns:
+        List[Dict[str, Any]]: The transitions, connectors before their tasks and in snapshot order.
+    """
+    events = []
+    absent = (None, None, {})
+    for name in list(previous) + [name for name in current if name not in previous]:
+        before, after = previous.get(name, absent), current.get(name, absent)
+        if before[:2] != after[:2]:
+            events.append(
+                {
+                    "type": "connector",
+                    "connector": name,
+                    "from": before[0],
+                    "to": after[0],
+                    "worker_id": after[1] or before[1],
+                }
+            )
+        for task_id in list(before[2]) + [t for t in after[2] if t not in before[2]]:
+            task_before = before[2].get(task_id, (None, None))
+            task_after = after[2].get(task_id, (None, None))
+            if task_before != task_after:
+                events.append(
+                    {
+                        "type": "task",
+                        "connector": name,
+                        "task": task_id,
+                        "from": task_before[0],
+                        "to": task_after[0],
+                        "worker_id": task_after[1] or task_before[1],
+                    }
+                )
+    return events
@@ -0,0 +1,78 @@
+import threading
+import time
+
+
+class WorkerPool:
+    """Track the health and latency of the workers of a Kafka Connect cluster and choose which one to call.
+    A worker that fails to connect is skipped for `cooldown` seconds and then probed again by the next request.
+    Args:
+        urls (List[str]): The base URLs of the workers.
+        strategy (str): How to spread requests over the healthy workers, either "round-robin" or "least-latency".
+            Defaults to "round-robin".
+        cooldown (float): The number of seconds an unhealthy worker is skipped. Defaults to 30.
+        clock (Callable[[], float]): The monotonic clock. Defaults to `time.monotonic`.
+    """
+
+    STRATEGIES = ("round-robin", "least-latency")
+
+    def __init__(self, urls, strategy="round-robin", cooldown=30, clock=time.monotonic):
+        if not urls:
+            raise ValueError("At least one worker URL is required.")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Invalid strategy. Expected one of {', '.join(self.STRATEGIES)}.")
+        self.urls = list(urls)
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.clock = clock
+        self._unhealthy_until = {url: 0.0 for url in self.urls}
+        self._latency = {url: 0.0 for url in self.urls}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def select(self, exclude=()):
+        """Choose the worker for the next request.
+        When every worker is unhealthy, the one that recovers first is chosen so that requests keep probing.
+        Args:
+            exclude (Iterable[str]): The workers already tried by this request. Defaults to none.
+        Returns:
+            str: The base URL of the worker.
+        """
+        with self._lock:
+            candidates = [url for url in self.urls if url not in exclude] or self.urls
+            now = self.clock()
+            healthy = [url for url in candidates if self._unhealthy_until[url] <= now]
+            if not healthy:
+                return min(candidates, key=self._unhealthy_until.get)
+            if self.strategy == "least-latency":
+                return min(healthy, key=self._latency.get)
+            url = healthy[self._next % len(healthy)]
+            self._next += 1
+            return url
+
+    def mark_failed(self, url):
+        """Skip a worker until its cooldown expires.
+        Args:
+            url (str): The base URL of the worker.
+        """
+        with self._lock:
+            self._unhealthy_until[url] = self.clock() + self.cooldown
+
+    def mark_succeeded(self, url, latency):
+        """Mark a worker healthy and record the latency of its last response.
+        Args:
+            url (str): The base URL of the worker.
+            latency (float): The latency of the response in seconds.
+        """
+        with self._lock:
+            self._unhealthy_until[url] = 0.0
+            # An exponentially weighted moving average smooths out single slow responses
+            previous = self._latency[url]
+            self._latency[url] = latency if not previous else 0.8 * previous + 0.2 * latency
+
+    def healthy(self):
+        """List the workers that are not cooling down.
+        Returns:
+            List[str]: The base URLs of the healthy workers.
+        """
+        now = self.clock()
+        return [url for url in self.urls if self._unhealthy_until[url] <= now]
@@ -0,0 +1,67 @@
+from kafka_connect.apply import load_connector_configs, normalize_config, plan_changes
+
+import json
+import os
+import tempfile
+import unittest
+
+
+class TestApply(unittest.TestCase):
+    def test_normalize_config(self):
+        self.assertEqual(
+            normalize_config({"name": "my-connector", "config": {"tasks.max": 1, "x": True}}),
+            ("my-connector", {"tasks.max": "1", "x": "true", "name": "my-connector"}),
+        )
+        self.assertEqual(
+            normalize_config({"tasks.max": "1"}, name="my-connector"),
+            ("my-connector", {"tasks.max": "1", "name": "my-connector"}),
+        )
+
+    def test_normalize_config_without_name(self):
+        with self.assertRaises(ValueError):
+            normalize_config({"tasks.max": "1"})
+
+    def test_plan_changes(self):
+        desired = {
+            "unchanged": {"tasks.max": 1},
+            "updated": {"tasks.max": "2"},
+            "created": {"tasks.max": "1"},
+        }
+        live = {
+            "unchanged": {"tasks.max": "1", "name": "unchanged"},
+            "updated": {"tasks.max": "1", "name": "updated"},
+            "extra": {"tasks.max": "1", "name": "extra"},
+        }
+
+        self.assertEqual(
+            plan_changes(desired, live),
+            {
+                "create": ["created"],
+                "update": ["updated"],
+                "delete": [],
+                "unchanged": ["unchanged"],
+            },
+        )
+        self.assertEqual(plan_changes(desired, live, prune=True)["delete"], ["extra"])
+
+    def test_load_connector_configs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for filename, config in [
+                ("my-jdbc-source.json", {"tasks.max": "1"}),
+                ("sink.json", {"name": "my-hdfs-sink", "config": {"tasks.max": "2"}}),
+            ]:
+                with open(os.path.join(directory, filename), "w") as f:
+                    json.dump(config, f)
+            open(os.path.join(directory, "README.md"), "w").close()
+
+            self.assertEqual(
+                load_connector_configs(directory),
+                {
+                    "my-hdfs-sink": {"tasks.max": "2", "name": "my-hdfs-sink"},
+                    "my-jdbc-source": {"tasks.max": "1", "name": "my-jdbc-source"},
+                },
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+from kafka_connect import AsyncKafkaConnect
+
+import asyncio
+import json
+import unittest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def status(name, state):
+    return {
+        "status": {
+            "name": name,
+            "connector": {"state": state, "worker_id": "10.0.0.162:8083"},
+            "tasks": [],
+            "type": "sink",
+        }
+    }
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncKafkaConnect(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.requests = []
+        self.kafka_connect = AsyncKafkaConnect()
+        self.kafka_connect._client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    async def asyncTearDown(self):
+        await self.kafka_connect.aclose()
+
+    def handle(self, request):
+        self.requests.append(request)
+        if request.url.path == "/connectors":
+            if request.url.params.get("expand") == "status":
+                return httpx.Response(
+                    200,
+                    json={
+                        "my-jdbc-source": status("my-jdbc-source", "RUNNING"),
+                        "my-hdfs-sink": status("my-hdfs-sink", "PAUSED"),
+                        "my-s3-sink": status("my-s3-sink", "RUNNING"),
+                    },
+                )
+            return httpx.Response(200, json=["my-jdbc-source", "my-hdfs-sink", "my-s3-sink"])
+        if request.url.path.endswith("/pause"):
+            if "my-hdfs-sink" in request.url.path:
+                return httpx.Response(409, json={"error_code": 409})
+            return httpx.Response(202)
+        if request.url.path.endswith("/config/validate"):
+            return httpx.Response(200, json={"error_count": 0, "echo": json.loads(request.content)})
+        return httpx.Response(404, json={"error_code": 404})
+
+    async def test_list_connectors_with_pattern_and_state(self):
+        result = await self.kafka_connect.list_connectors(pattern=".*-sink$", state="running")
+
+        # ensure the state filter reuses a single expand=status listing
+        self.assertEqual(result, ["my-s3-sink"])
+        self.assertEqual(
+            [str(request.url) for request in self.requests],
+            ["http://localhost:8083/connectors?expand=status"],
+        )
+
+    async def test_list_connectors_typed_without_expand(self):
+        result = await self.kafka_connect.list_connectors(pattern=".*-sink$", typed=True)
+
+        # ensure a listing of names is returned unchanged
+        self.assertEqual(result, ["my-hdfs-sink", "my-s3-sink"])
+
+    async def test_validate_connector_config(self):
+        config = {"connector.class": "FileStreamSinkConnector", "tasks.max": "1"}
+        result = await self.kafka_connect.validate_connector_config(
+            "FileStreamSinkConnector", config
+        )
+
+        self.assertEqual(self.requests[0].method, "PUT")
+        self.assertEqual(self.requests[0].headers["Content-Type"], "application/json")
+        self.assertEqual(result, {"error_count": 0, "echo": config})
+
+    async def test_get_connector_status_not_found(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            await self.kafka_connect.get_connector_status("missing")
+
+    async def test_pause_all_connectors(self):
+        result = await self.kafka_connect.pause_all_connectors(max_workers=2)
+
+        # ensure every connector is attempted and the results keep the listing order
+        self.assertEqual(list(result), ["my-jdbc-source", "my-hdfs-sink", "my-s3-sink"])
+        self.assertIsNone(result["my-jdbc-source"])
+        self.assertIsInstance(result["my-hdfs-sink"], httpx.HTTPStatusError)
+        self.assertEqual(len(self.requests), 4)
+
+    async def test_bulk_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def pause_connector(connector):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        pause_connector.__name__ = "pause_connector"
+        self.kafka_connect.pause_connector = pause_connector
+        await self.kafka_connect.pause_all_connectors(max_workers=2)
+        self.assertEqual(peak, 2)
+
+    async def test_bulk_concurrency_keeps_the_live_client(self):
+        client = self.kafka_connect.client
+        self.kafka_connect.pool_maxsize = 1
+        result, _ = await asyncio.gather(
+            self.kafka_connect.pause_all_connectors(max_workers=4),
+            self.kafka_connect.get_connector_status("my-jdbc-source"),
+            return_exceptions=True,
+        )
+
+        # ensure the shared client is neither closed nor replaced under a concurrent request
+        self.assertIs(self.kafka_connect.client, client)
+        self.assertFalse(client.is_closed)
+        self.assertEqual(self.kafka_connect.pool_maxsize, 1)
+        self.assertEqual(list(result), ["my-jdbc-source", "my-hdfs-sink", "my-s3-sink"])
+
+    async def test_bulk_concurrency_sizes_a_new_client(self):
+        await self.kafka_connect.aclose()
+
+        async def list_connectors(**kwargs):
+            return ["my-jdbc-source"]
+
+        async def pause_connector(connector):
+            pass
+
+        pause_connector.__name__ = "pause_connector"
+        self.kafka_connect.list_connectors = list_connectors
+        self.kafka_connect.pause_connector = pause_connector
+        await self.kafka_connect.pause_all_connectors(max_workers=16)
+
+        # ensure the pool is grown while no client exists yet
+        self.assertEqual(self.kafka_connect.pool_maxsize, 16)
+        self.assertIsNone(self.kafka_connect._client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+from kafka_connect.autoheal import AutoHealer
+from requests.exceptions import ConnectionError, HTTPError
+
+import mock
+import unittest
+
+
+def listing(**tasks):
+    return {
+        name: {
+            "status": {
+                "name": name,
+                "connector": {"state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+                "tasks": [
+                    {"id": task_id, "state": state, "worker_id": "10.0.0.2:8083"}
+                    for task_id, state in enumerate(states)
+                ],
+            }
+        }
+        for name, states in tasks.items()
+    }
+
+
+class TestAutoHealer(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.kafka_connect = mock.Mock()
+        self.healer = AutoHealer(
+            self.kafka_connect,
+            base_delay=10,
+            max_delay=40,
+            max_restarts=3,
+            window=100,
+            healthy_after=30,
+            clock=lambda: self.now,
+        )
+
+    def heal(self, now, **tasks):
+        self.now = now
+        self.kafka_connect.list_connectors.return_value = listing(**tasks)
+        self.kafka_connect.restart_connector_task.reset_mock()
+        return [
+            {k: v for k, v in event.items() if k != "timestamp"} for event in self.healer.heal()
+        ]
+
+    def test_delay(self):
+        self.assertEqual([self.healer.delay(n) for n in range(1, 5)], [10, 20, 40, 40])
+        self.assertEqual(self.healer.delay(10000), 40)
+
+    def test_restarts_only_failed_tasks(self):
+        events = self.heal(1000, sink=["RUNNING", "FAILED"], source=["RUNNING"])
+        self.kafka_connect.list_connectors.assert_called_once_with(expand="status", pattern=None)
+        self.kafka_connect.restart_connector_task.assert_called_once_with("sink", 1)
+        self.assertEqual(
+            events,
+            [
+                {
+                    "event": "restarted",
+                    "connector": "sink",
+                    "task": 1,
+                    "worker_id": "10.0.0.2:8083",
+                    "attempt": 1,
+                    "restarts": 2,
+                    "next_attempt": 10,
+                }
+            ],
+        )
+
+    def test_backoff(self):
+        self.heal(1000, sink=["FAILED"])
+        # ensure the task is not restarted again before its delay has passed
+        self.assertEqual(self.heal(1005, sink=["FAILED"]), [])
+        self.kafka_connect.restart_connector_task.assert_not_called()
+
+        events = self.heal(1010, sink=["FAILED"])
+        self.assertEqual([(e["attempt"], e["next_attempt"]) for e in events], [(2, 20)])
+        self.assertEqual(self.heal(1029, sink=["FAILED"]), [])
+        self.assertEqual(len(self.heal(1030, sink=["FAILED"])), 1)
+
+    def test_budget(self):
+        for now in (1000, 1010, 1030):
+            self.assertEqual(self.heal(now, sink=["FAILED"])[0]["event"], "restarted")
+
+        # ensure the exhausted budget is reported once
+        events = self.heal(1070, sink=["FAILED"])
+        self.assertEqual(events[0]["event"], "budget_exhausted")
+        self.assertEqual(events[0]["retry_in"], 30)
+        self.assertEqual(self.heal(1080, sink=["FAILED"]), [])
+        self.kafka_connect.restart_connector_task.assert_not_called()
+
+        # the first restart leaves the window
+        events = self.heal(1100, sink=["FAILED"])
+        self.assertEqual(
+            [(e["event"], e["attempt"], e["restarts"]) for e in events], [("restarted", 4, 0)]
+        )
+
+    def test_recovery_resets_the_backoff(self):
+        self.heal(1000, sink=["FAILED"])
+        self.heal(1010, sink=["FAILED"])
+        # a task that fails again before it has been running long enough keeps its backoff
+        self.assertEqual(self.heal(1020, sink=["RUNNING"]), [])
+        self.heal(1030, sink=["FAILED"])
+        self.kafka_connect.restart_connector_task.assert_called_once()
+        self.assertEqual(self.healer.tasks[("sink", 0)].attempts, 3)
+
+        self.assertEqual(self.heal(1040, sink=["RUNNING"]), [])
+        events = self.heal(1070, sink=["RUNNING"])
+        self.assertEqual(
+            events, [{"event": "recovered", "connector": "sink", "task": 0, "attempts": 3}]
+        )
+
+        # the restarts still in the window keep counting against the budget
+        events = self.heal(1120, sink=["FAILED"])
+        self.assertEqual([(e["attempt"], e["restarts"]) for e in events], [(1, 1)])
+
+    def test_forgets_healthy_tasks(self):
+        self.heal(1000, sink=["FAILED"], source=["FAILED"], other=["RUNNING"])
+        self.heal(1050, sink=["RUNNING"], other=["RUNNING"])
+        self.heal(1090, sink=["RUNNING"], other=["RUNNING"])
+        # ensure the restarts of a recovered or deleted task are kept until they leave the window
+        self.assertEqual(list(self.healer.tasks), [("sink", 0), ("source", 0)])
+        self.heal(1100, sink=["RUNNING"], other=["RUNNING"])
+        self.assertEqual(self.healer.tasks, {})
+
+    def test_failed_restart(self):
+        self.kafka_connect.restart_connector_task.side_effect = HTTPError("409 Conflict")
+        events = self.heal(1000, sink=["FAILED"])
+        self.kafka_connect.logger.warning.assert_called_once()
+        self.assertEqual(events[0]["event"], "restart_failed")
+        self.assertEqual(events[0]["error"], "409 Conflict")
+        # ensure a rejected restart backs off without using the budget
+        self.assertEqual((events[0]["next_attempt"], events[0]["restarts"]), (10, 3))
+
+    def test_max_restarts_per_pass(self):
+        self.healer.max_restarts_per_pass = 2
+        events = self.heal(1000, a=["FAILED"], b=["FAILED"], c=["FAILED"])
+        self.assertEqual([e["connector"] for e in events], ["a", "b"])
+        events = self.heal(1001, a=["FAILED"], b=["FAILED"], c=["FAILED"])
+        self.assertEqual([e["connector"] for e in events], ["c"])
+
+    def test_run(self):
+        self.healer.sleep = mock.Mock(side_effect=[None, KeyboardInterrupt])
+        self.kafka_connect.list_connectors.side_effect = [
+            ConnectionError("refused"),
+            listing(sink=["FAILED"]),
+        ]
+        events = []
+        with self.assertRaises(KeyboardInterrupt):
+            for event in self.healer.run():
+                events.append(event["event"])
+        self.assertEqual(events, ["restarted"])
+        self.healer.sleep.assert_called_with(10)
+        self.kafka_connect.logger.warning.assert_called_once()
+        self.kafka_connect.restart_connector_task.assert_called_once_with("sink", 0)
+
+    def test_many_tasks(self):
+        # ensure a pass over thousands of tasks only restarts the failed ones that are due
+        tasks = {f"connector-{i}": ["RUNNING"] * 9 + ["FAILED"] for i in range(500)}
+        self.healer.max_restarts_per_pass = 1000
+        self.assertEqual(len(self.heal(1000, **tasks)), 500)
+        self.assertEqual(self.heal(1001, **tasks), [])
+        self.kafka_connect.restart_connector_task.assert_not_called()
+        self.assertEqual(len(self.healer.tasks), 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
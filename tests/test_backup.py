@@ -0,0 +1,109 @@
+from kafka_connect.apply import load_connector_configs
+from kafka_connect.backup import backup_files, is_archive, is_backup, read_backup, write_backup
+
+import json
+import os
+import tempfile
+import unittest
+
+BACKUP = {
+    "manifest": {"cluster": {"version": "7.3.0"}, "include": [], "connectors": 2},
+    "connectors": {
+        "my-hdfs-sink": {
+            "name": "my-hdfs-sink",
+            "config": {"name": "my-hdfs-sink", "tasks.max": "1"},
+            "type": "sink",
+        },
+        "team/jdbc-source": {
+            "name": "team/jdbc-source",
+            "config": {"name": "team/jdbc-source", "tasks.max": "2"},
+            "type": "source",
+        },
+    },
+}
+
+
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_is_archive(self):
+        self.assertTrue(is_archive("backup.tar.gz"))
+        self.assertTrue(is_archive("backup.tgz"))
+        self.assertFalse(is_archive("backup"))
+
+    def test_backup_files(self):
+        files = backup_files(BACKUP)
+        # ensure names are safe file names
+        self.assertEqual(
+            sorted(files),
+            ["connectors/my-hdfs-sink.json", "connectors/team%2Fjdbc-source.json", "manifest.json"],
+        )
+        self.assertEqual(json.loads(files["manifest.json"])["format"], 1)
+
+    def test_round_trip(self):
+        for name in ("backup.tar.gz", "backup"):
+            path = os.path.join(self.tmp.name, name)
+            write_backup(path, BACKUP)
+            backup = read_backup(path)
+            self.assertEqual(backup["connectors"], BACKUP["connectors"])
+            self.assertEqual(backup["manifest"], {"format": 1, **BACKUP["manifest"]})
+            self.assertEqual(
+                list(read_backup(path, pattern="team/")["connectors"]), ["team/jdbc-source"]
+            )
+
+    def test_directory_can_be_applied(self):
+        path = os.path.join(self.tmp.name, "backup")
+        write_backup(path, BACKUP)
+        configs = load_connector_configs(os.path.join(path, "connectors"))
+        self.assertEqual(
+            configs["team/jdbc-source"], {"name": "team/jdbc-source", "tasks.max": "2"}
+        )
+
+    def test_overwrite(self):
+        for name in ("backup.tar.gz", "backup"):
+            path = os.path.join(self.tmp.name, name)
+            write_backup(path, BACKUP)
+            with self.assertRaises(FileExistsError):
+                write_backup(path, BACKUP)
+
+            smaller = {
+                **BACKUP,
+                "connectors": {"my-hdfs-sink": BACKUP["connectors"]["my-hdfs-sink"]},
+            }
+            write_backup(path, smaller, overwrite=True)
+            # ensure no connector of the replaced backup is left behind
+            self.assertEqual(list(read_backup(path)["connectors"]), ["my-hdfs-sink"])
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["backup", "backup.tar.gz"])
+
+    def test_overwrite_refuses_other_paths(self):
+        directory = os.path.join(self.tmp.name, "notes")
+        os.mkdir(directory)
+        with open(os.path.join(directory, "notes.txt"), "w") as f:
+            f.write("keep me")
+        archive = os.path.join(self.tmp.name, "notes.tar.gz")
+        with open(archive, "w") as f:
+            f.write("keep me")
+
+        for path in (directory, archive):
+            self.assertFalse(is_backup(path))
+            with self.assertRaisesRegex(FileExistsError, "is not a backup"):
+                write_backup(path, BACKUP, overwrite=True)
+
+        # ensure nothing was replaced
+        self.assertEqual(os.listdir(directory), ["notes.txt"])
+        with open(archive) as f:
+            self.assertEqual(f.read(), "keep me")
+
+    def test_not_a_backup(self):
+        with self.assertRaises(ValueError):
+            read_backup(self.tmp.name)
+        with open(os.path.join(self.tmp.name, "manifest.json"), "w") as f:
+            json.dump({"format": 99}, f)
+        with self.assertRaisesRegex(ValueError, "unknown format: 99"):
+            read_backup(self.tmp.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+from kafka_connect.cache import TTLCache
+
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(
+            ttl=10, ttls={"list_connector_plugins": 300}, maxsize=3, clock=self.clock
+        )
+
+    def test_hit_and_miss(self):
+        load = lambda: {"tasks.max": "1"}
+        first = self.cache.get_or_load("get_connector_config", ("my-connector",), load)
+        first["tasks.max"] = "2"
+        second = self.cache.get_or_load("get_connector_config", ("my-connector",), load)
+
+        # ensure a caller that mutates its value does not corrupt the cached one
+        self.assertEqual(second, {"tasks.max": "1"})
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_per_endpoint_ttl(self):
+        self.cache.get_or_load("get_connector_config", ("my-connector",), lambda: "config")
+        self.cache.get_or_load("list_connector_plugins", (), lambda: "plugins")
+        self.clock.now = 11
+
+        # ensure only the entries past their own time-to-live are reloaded
+        self.assertEqual(
+            self.cache.get_or_load("get_connector_config", ("my-connector",), lambda: "new"), "new"
+        )
+        self.assertEqual(
+            self.cache.get_or_load("list_connector_plugins", (), lambda: "new"), "plugins"
+        )
+
+    def test_lru_bound(self):
+        for name in ["a", "b", "c"]:
+            self.cache.get_or_load("get_connector", (name,), lambda: name)
+        self.cache.get_or_load("get_connector", ("a",), lambda: "reloaded")
+        self.cache.get_or_load("get_connector", ("d",), lambda: "d")
+
+        # ensure the least recently used entry is the one dropped
+        self.assertEqual(self.cache.stats()["size"], 3)
+        self.assertEqual(self.cache.get_or_load("get_connector", ("a",), lambda: "x"), "a")
+        self.assertEqual(self.cache.get_or_load("get_connector", ("b",), lambda: "x"), "x")
+
+    def test_errors_are_not_cached(self):
+        def load():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_load("get_connector", ("a",), load)
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_invalidate(self):
+        self.cache.get_or_load("get_connector", ("a",), lambda: "a")
+        self.cache.get_or_load("list_connector_tasks", ("a",), lambda: "a")
+        self.cache.get_or_load("get_connector", ("b",), lambda: "b")
+
+        self.cache.invalidate("a")
+        self.assertEqual(self.cache.stats()["size"], 1)
+        self.cache.invalidate()
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_invalidate_during_load(self):
+        def load(connector):
+            # another thread mutates the connector while its stale value is being loaded
+            self.cache.invalidate(connector)
+            return "stale"
+
+        for connector in ("a", None):
+            value = self.cache.get_or_load("get_connector", ("a",), lambda: load(connector))
+
+            # ensure the stale value is returned to its caller but never stored
+            self.assertEqual(value, "stale")
+            self.assertEqual(self.cache.stats()["size"], 0)
+        self.cache.get_or_load("get_connector", ("b",), lambda: load("a"))
+        self.assertEqual(self.cache.stats()["size"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
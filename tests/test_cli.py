@@ -0,0 +1,67 @@
+from unittest.mock import patch
+from click.testing import CliRunner
+from kafka_connect.cli import cli
+
+import json
+import mock
+import unittest
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.runner = CliRunner()
+
+    def invoke(self, *args):
+        return self.runner.invoke(cli, ["--url", "http://localhost:8083", *args], env={})
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_list(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value = mock.Mock(
+            status_code=200, content=b'["my-jdbc-source", "my-hdfs-sink"]'
+        )
+
+        result = self.invoke("list")
+
+        # ensure a single-cluster command runs end to end
+        self.assertIsNone(result.exception, result.output)
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(json.loads(result.output), ["my-jdbc-source", "my-hdfs-sink"])
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_list_ndjson(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value = mock.Mock(
+            status_code=200, content=b'["my-jdbc-source", "my-hdfs-sink"]'
+        )
+
+        result = self.invoke("list", "--output", "ndjson")
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            [json.loads(line) for line in result.output.splitlines()],
+            [{"name": "my-jdbc-source"}, {"name": "my-hdfs-sink"}],
+        )
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_list_ndjson_streams(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        body = {
+            "my-jdbc-source": {"status": {"connector": {"state": "RUNNING"}}},
+            "my-hdfs-sink": {"status": {"connector": {"state": "FAILED"}}},
+        }
+        raw = json.dumps(body).encode()
+        mock_request.return_value = mock.Mock(status_code=200)
+        mock_request.return_value.iter_content.return_value = [raw[:20], raw[20:]]
+
+        result = self.invoke("list", "--expand", "status", "--output", "ndjson")
+
+        # ensure the expanded listing is streamed rather than read at once
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+        self.assertEqual(
+            [json.loads(line) for line in result.output.splitlines()],
+            [{"name": name, **data} for name, data in body.items()],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
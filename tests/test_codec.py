@@ -0,0 +1,49 @@
+from kafka_connect.codec import CODECS, get_codec
+
+import json
+import mock
+import os
+import unittest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+CONFIG = {
+    "name": "my-jdbc-source",
+    "config": {"connection.url": "jdbc:postgresql://db/café", "tasks.max": 1, "enabled": True},
+}
+
+
+class TestCodec(unittest.TestCase):
+    def test_stdlib_codec(self):
+        codec = get_codec("json")
+        self.assertEqual(codec.name, "json")
+        self.assertEqual(codec.loads(codec.encode(CONFIG)), CONFIG)
+        self.assertEqual(codec.dumps({"a": [1, None]}), '{"a":[1,null]}')
+        self.assertEqual(codec.dumps({"e": ValueError("x")}, default=str), '{"e":"x"}')
+        with self.assertRaises(json.JSONDecodeError):
+            codec.loads(b"{")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec_matches_stdlib(self):
+        stdlib, fast = get_codec("json"), get_codec("orjson")
+        self.assertEqual(fast.encode(CONFIG), stdlib.encode(CONFIG))
+        self.assertEqual(fast.dumps({1: "task"}), stdlib.dumps({1: "task"}))
+        self.assertEqual(fast.loads(stdlib.encode(CONFIG)), CONFIG)
+        with self.assertRaises(json.JSONDecodeError):
+            fast.loads(b"{")
+
+    def test_get_codec(self):
+        with mock.patch.dict(os.environ, {"KAFKA_CONNECT_JSON": "json"}):
+            self.assertEqual(get_codec().name, "json")
+        self.assertEqual(get_codec().name, "orjson" if orjson else "json")
+        self.assertEqual(set(CODECS), {"json", "orjson"})
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from kafka_connect.disk_cache import DiskCache, default_cache_dir
+
+import mock
+import os
+import tempfile
+import unittest
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.now = 1000.0
+        self.cache = DiskCache(self.directory.name, ttl=60, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_or_load_is_shared_across_instances(self):
+        load = mock.Mock(return_value={"version": "7.3.0"})
+        self.assertEqual(
+            self.cache.get_or_load("http://a:8083", "cluster-info", load), {"version": "7.3.0"}
+        )
+
+        other = DiskCache(self.directory.name, ttl=60, clock=lambda: self.now)
+        self.assertEqual(
+            other.get_or_load("http://a:8083", "cluster-info", load), {"version": "7.3.0"}
+        )
+        other.get_or_load("http://b:8083", "cluster-info", load)
+        self.assertEqual(load.call_count, 2)
+
+    def test_ttl(self):
+        self.cache.set("http://a:8083", "cluster-info", {"version": "7.3.0"})
+        self.now += 59
+        self.assertEqual(
+            self.cache.get("http://a:8083", "cluster-info"), (True, {"version": "7.3.0"})
+        )
+        self.now += 1
+        self.assertEqual(self.cache.get("http://a:8083", "cluster-info"), (False, None))
+
+    def test_version(self):
+        self.cache.set("http://a:8083", "connector-plugins", ["v1"], version="7.3.0/abc")
+        self.now += 3600
+        self.assertEqual(
+            self.cache.get("http://a:8083", "connector-plugins", version="7.3.0/abc"),
+            (True, ["v1"]),
+        )
+        self.assertFalse(
+            self.cache.get("http://a:8083", "connector-plugins", version="7.3.1/def")[0]
+        )
+
+        # ensure storing a new version removes the entries of the old one
+        self.cache.set("http://a:8083", "connector-plugins", ["v2"], version="7.3.1/def")
+        self.assertFalse(
+            self.cache.get("http://a:8083", "connector-plugins", version="7.3.0/abc")[0]
+        )
+        files = os.listdir(os.path.join(self.directory.name, os.listdir(self.directory.name)[0]))
+        self.assertEqual(len(files), 1)
+
+    def test_refresh(self):
+        self.cache.set("http://a:8083", "cluster-info", {"version": "7.3.0"})
+        refreshing = DiskCache(self.directory.name, refresh=True, clock=lambda: self.now)
+        load = mock.Mock(return_value={"version": "7.3.1"})
+        self.assertEqual(
+            refreshing.get_or_load("http://a:8083", "cluster-info", load), {"version": "7.3.1"}
+        )
+        self.assertEqual(
+            self.cache.get("http://a:8083", "cluster-info"), (True, {"version": "7.3.1"})
+        )
+
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache.set("http://a:8083", "cluster-info", {"version": "7.3.0"})
+        directory = os.path.join(self.directory.name, os.listdir(self.directory.name)[0])
+        with open(os.path.join(directory, "cluster-info.json"), "w") as f:
+            f.write('{"url": ')
+        self.assertEqual(self.cache.get("http://a:8083", "cluster-info"), (False, None))
+
+    def test_clear(self):
+        self.cache.set("http://a:8083", "cluster-info", {"version": "7.3.0"})
+        self.cache.clear()
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_default_cache_dir(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/var/cache"}):
+            self.assertEqual(default_cache_dir(), "/var/cache/kafka-connect")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+from kafka_connect.exporter import ConnectorStateExporter, compact, render_states
+from kafka_connect.metrics import RequestMetrics
+
+import mock
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+CONNECTORS = {
+    "sink": {
+        "status": {
+            "name": "sink",
+            "connector": {"state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+            "tasks": [
+                {"id": 0, "state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+                {"id": 1, "state": "FAILED", "worker_id": "10.0.0.2:8083", "trace": "..."},
+            ],
+            "type": "sink",
+        },
+        "info": {"name": "sink", "config": {"tasks.max": "2"}, "tasks": [], "type": "sink"},
+    },
+    "source": {
+        "status": {
+            "name": "source",
+            "connector": {"state": "PAUSED", "worker_id": "10.0.0.2:8083"},
+            "tasks": [],
+        },
+        "info": {"name": "source", "config": {}, "tasks": [], "type": "source"},
+    },
+}
+
+
+class TestRenderStates(unittest.TestCase):
+    def test_compact(self):
+        self.assertEqual(
+            compact(CONNECTORS),
+            {
+                "sink": (
+                    "sink",
+                    "RUNNING",
+                    "10.0.0.1:8083",
+                    ((0, "RUNNING", "10.0.0.1:8083"), (1, "FAILED", "10.0.0.2:8083")),
+                ),
+                "source": ("source", "PAUSED", "10.0.0.2:8083", ()),
+            },
+        )
+
+    def test_render_states(self):
+        text = render_states(compact(CONNECTORS))
+        labels = 'connector="sink",type="sink",worker_id="10.0.0.1:8083"'
+        self.assertIn(f'kafka_connect_connector_state{{{labels},state="RUNNING"}} 1', text)
+        self.assertIn(f'kafka_connect_connector_state{{{labels},state="FAILED"}} 0', text)
+        labels = 'connector="sink",task="1",type="sink",worker_id="10.0.0.2:8083"'
+        self.assertIn(f'kafka_connect_task_state{{{labels},state="FAILED"}} 1', text)
+        self.assertIn('kafka_connect_connectors{state="PAUSED"} 1', text)
+        self.assertIn('kafka_connect_connectors{state="FAILED"} 0', text)
+        self.assertIn('kafka_connect_tasks{state="FAILED"} 1', text)
+        self.assertIn("# TYPE kafka_connect_task_state gauge", text)
+
+    def test_render_unknown_state(self):
+        text = render_states({"a": ("sink", "DEGRADED", "w", ())}, prefix="kc")
+        self.assertIn(
+            'kc_connector_state{connector="a",type="sink",worker_id="w",state="DEGRADED"} 1', text
+        )
+        self.assertIn('kc_connectors{state="DEGRADED"} 1', text)
+
+
+class TestConnectorStateExporter(unittest.TestCase):
+    def setUp(self):
+        self.kafka_connect = mock.Mock(metrics=None)
+        self.kafka_connect.list_connectors.return_value = CONNECTORS
+        self.exporter = ConnectorStateExporter(self.kafka_connect, clock=lambda: 1700000000.0)
+
+    def test_poll(self):
+        self.assertEqual(self.exporter.scrape().count(b"kafka_connect_up 0"), 1)
+        self.assertTrue(self.exporter.poll())
+        self.kafka_connect.list_connectors.assert_called_once_with(expand=["status", "info"])
+
+        body = self.exporter.scrape().decode()
+        self.assertIn("kafka_connect_up 1", body)
+        self.assertIn("kafka_connect_exporter_last_success_timestamp_seconds 1700000000.0", body)
+        self.assertIn('connector="source"', body)
+
+    def test_failed_poll_keeps_the_last_states(self):
+        self.exporter.poll()
+        self.kafka_connect.list_connectors.side_effect = ConnectionError("refused")
+        self.assertFalse(self.exporter.poll())
+
+        body = self.exporter.scrape().decode()
+        self.assertIn("kafka_connect_up 0", body)
+        self.assertIn("kafka_connect_exporter_poll_errors_total 1", body)
+        self.assertIn('connector="source"', body)
+
+    def test_scrape_includes_request_metrics(self):
+        self.kafka_connect.metrics = RequestMetrics()
+        self.kafka_connect.metrics.observe("GET", "/connectors", 0.01, status_code=200)
+        self.assertIn(b"kafka_connect_client_requests_total", self.exporter.scrape())
+
+    def test_server(self):
+        self.exporter.poll()
+        httpd = self.exporter.server("127.0.0.1", 0)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_address[1]}"
+        try:
+            for _ in range(3):
+                with urllib.request.urlopen(f"{url}/metrics") as response:
+                    self.assertEqual(response.status, 200)
+                    self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+                    self.assertIn(b"kafka_connect_up 1", response.read())
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(f"{url}/")
+            self.assertEqual(cm.exception.code, 404)
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+        # ensure scrapes are answered from the last poll
+        self.kafka_connect.list_connectors.assert_called_once()
+
+    def test_start_and_stop(self):
+        polled = threading.Event()
+        self.kafka_connect.list_connectors.side_effect = lambda **kwargs: polled.set() or {}
+        self.exporter.interval = 60
+        self.exporter.start()
+        self.assertTrue(polled.wait(5))
+        self.exporter.stop()
+        self.assertEqual(self.exporter.up, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+from kafka_connect.fleet import KafkaConnectFleet, load_clusters, select_clusters
+from kafka_connect.kafka_connect import KafkaConnect
+from requests.exceptions import ConnectionError
+
+import json
+import mock
+import os
+import tempfile
+import threading
+import unittest
+
+
+class TestLoadClusters(unittest.TestCase):
+    def test_load_clusters(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clusters.json")
+            with open(path, "w") as f:
+                json.dump(
+                    {
+                        "prod-eu": "https://connect.eu.example.com",
+                        "prod-us": {"url": "https://connect.us.example.com", "auth": "user:pass"},
+                    },
+                    f,
+                )
+            clusters = load_clusters(path)
+        self.assertEqual(
+            clusters,
+            {
+                "prod-eu": {"url": "https://connect.eu.example.com"},
+                "prod-us": {"url": "https://connect.us.example.com", "auth": "user:pass"},
+            },
+        )
+
+    def test_load_clusters_without_url(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "clusters.json")
+            with open(path, "w") as f:
+                json.dump({"prod-eu": {"auth": "user:pass"}}, f)
+            with self.assertRaises(ValueError):
+                load_clusters(path)
+
+    def test_select_clusters(self):
+        clusters = {"prod-eu": 1, "prod-us": 2, "dev-eu": 3}
+        self.assertEqual(select_clusters(clusters, ["prod-*"]), {"prod-eu": 1, "prod-us": 2})
+        self.assertEqual(
+            select_clusters(clusters, ["dev-eu", "prod-eu"]), {"prod-eu": 1, "dev-eu": 3}
+        )
+        with self.assertRaises(ValueError):
+            select_clusters(clusters, ["staging-*"])
+
+
+class TestKafkaConnectFleet(unittest.TestCase):
+    def test_clusters(self):
+        client = KafkaConnect(url="http://localhost:8083")
+        fleet = KafkaConnectFleet(
+            {"a": client, "b": "http://b:8083", "c": {"url": "http://c:8083", "auth": "user:pass"}},
+            retry=True,
+        )
+        self.assertIs(fleet.clusters["a"], client)
+        self.assertEqual(fleet.clusters["b"].url, "http://b:8083")
+        self.assertIsNotNone(fleet.clusters["b"].retry)
+        self.assertEqual(fleet.clusters["c"].auth, ("user", "pass"))
+        self.assertEqual(fleet.max_workers, 3)
+
+    def test_is_fleet(self):
+        from kafka_connect.cli import is_fleet
+
+        self.assertTrue(is_fleet(KafkaConnectFleet({"a": "http://a:8083"})))
+        self.assertFalse(is_fleet(KafkaConnect(url="http://localhost:8083")))
+
+    def test_list_connectors(self):
+        a, b = mock.MagicMock(), mock.MagicMock()
+        a.list_connectors.return_value = ["source-a"]
+        b.list_connectors.side_effect = ConnectionError("unreachable")
+        fleet = KafkaConnectFleet({"a": a, "b": b})
+
+        results = fleet.list_connectors(state="FAILED")
+
+        a.list_connectors.assert_called_with(expand=None, pattern=None, state="FAILED", typed=False)
+        self.assertEqual(list(results), ["a", "b"])
+        self.assertEqual(results["a"], ["source-a"])
+        self.assertIsInstance(results["b"], ConnectionError)
+
+    def test_fan_out_is_concurrent(self):
+        barrier = threading.Barrier(3, timeout=5)
+        clusters = {}
+        for name in "abc":
+            clusters[name] = mock.MagicMock()
+            clusters[name].get_connector_status.side_effect = lambda connector: barrier.wait()
+        fleet = KafkaConnectFleet(clusters)
+
+        # Each call waits for the other two, so a sequential fan-out would break the barrier
+        results = fleet.get_connector_status("source")
+
+        self.assertFalse(any(isinstance(result, Exception) for result in results.values()))
+
+    def test_pause_all_connectors(self):
+        a = mock.MagicMock()
+        a.pause_all_connectors.return_value = {"source": None}
+        fleet = KafkaConnectFleet({"a": a})
+
+        results = fleet.pause_all_connectors(pattern="^source", max_workers=4)
+
+        a.pause_all_connectors.assert_called_with(
+            callback=None, pattern="^source", state=None, max_workers=4
+        )
+        self.assertEqual(results, {"a": {"source": None}})
+
+    def test_restart_failed_tasks(self):
+        a = mock.MagicMock()
+        a.restart_failed_tasks.return_value = {"sink": {"connector": False, "tasks": [0]}}
+        fleet = KafkaConnectFleet({"a": a})
+
+        results = fleet.restart_failed_tasks(max_workers=4)
+
+        a.restart_failed_tasks.assert_called_with(callback=None, pattern=None, max_workers=4)
+        self.assertEqual(results, {"a": {"sink": {"connector": False, "tasks": [0]}}})
+
+    def test_delete_all_connectors_callback(self):
+        clusters = {}
+        for name in "ab":
+            clusters[name] = mock.MagicMock()
+            clusters[name].delete_all_connectors.side_effect = lambda callback, **kwargs: callback(
+                "source", None
+            ) or {"source": None}
+        outcomes = []
+        fleet = KafkaConnectFleet(clusters)
+
+        fleet.delete_all_connectors(callback=lambda *args: outcomes.append(args))
+
+        self.assertEqual(sorted(outcomes), [("a", "source", None), ("b", "source", None)])
+
+    def test_close(self):
+        a, b = mock.MagicMock(), mock.MagicMock()
+        with KafkaConnectFleet({"a": a, "b": b}):
+            pass
+        a.close.assert_called_once_with()
+        b.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
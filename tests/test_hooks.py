@@ -0,0 +1,112 @@
+from unittest.mock import patch
+from kafka_connect import KafkaConnect
+from kafka_connect.hooks import RequestContext, RequestHook, SlowRequestLogger
+from kafka_connect.retry import RetryPolicy
+from requests.exceptions import ConnectionError
+
+import logging
+import mock
+import unittest
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, context):
+        self.calls.append(("before_request", context.endpoint, context.connector, context.attempt))
+
+    def after_response(self, context, response):
+        self.calls.append(("after_response", response.status_code, context.latency is not None))
+
+    def on_error(self, context, error):
+        self.calls.append(("on_error", str(error)))
+
+    def on_retry(self, context, delay, reason):
+        self.calls.append(("on_retry", context.attempt, reason))
+
+
+class TestRequestContext(unittest.TestCase):
+    def test_connector_request(self):
+        context = RequestContext("GET", "/connectors/my-connector/tasks/0/status", attempt=2)
+        self.assertEqual(context.endpoint, "/connectors/{name}/tasks/{task}/status")
+        self.assertEqual(context.connector, "my-connector")
+        self.assertEqual(context.attempt, 2)
+
+    def test_cluster_request(self):
+        context = RequestContext("GET", "")
+        self.assertEqual(context.endpoint, "/")
+        self.assertIsNone(context.connector)
+
+
+class TestSlowRequestLogger(unittest.TestCase):
+    def context(self, latency):
+        context = RequestContext("PUT", "/connectors/my-connector/pause")
+        context.url = "http://localhost:8083"
+        context.latency = latency
+        return context
+
+    def test_logs_slow_requests(self):
+        hook = SlowRequestLogger(threshold=0.5)
+        with self.assertLogs("kafka_connect.slow_requests", level="WARNING") as cm:
+            hook.after_response(self.context(0.75), mock.Mock(status_code=202))
+            hook.on_error(self.context(2), ConnectionError("timed out"))
+        self.assertEqual(len(cm.output), 2)
+        self.assertIn("PUT /connectors/my-connector/pause", cm.output[0])
+        self.assertIn("took 0.750s on attempt 1 and returned status code 202", cm.output[0])
+        self.assertIn("failed: timed out", cm.output[1])
+
+    def test_ignores_fast_requests(self):
+        logger = mock.Mock()
+        hook = SlowRequestLogger(threshold=0.5, logger=logger, level=logging.INFO)
+        hook.after_response(self.context(0.1), mock.Mock(status_code=202))
+        logger.log.assert_not_called()
+
+
+class TestKafkaConnectHooks(unittest.TestCase):
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_hooks(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.side_effect = [
+            ConnectionError("refused"),
+            mock.Mock(status_code=409, content=b'{"message": "a rebalance is expected"}'),
+            mock.Mock(status_code=200, content=b"{}"),
+        ]
+        hook = RecordingHook()
+        kc = KafkaConnect(hooks=[hook], retry=RetryPolicy(max_attempts=3, base_delay=0))
+
+        kc.get_connector_status("my-connector")
+
+        # ensure every attempt and retry goes through the hooks in order
+        endpoint = "/connectors/{name}/status"
+        self.assertEqual(
+            hook.calls,
+            [
+                ("before_request", endpoint, "my-connector", 1),
+                ("on_error", "refused"),
+                ("on_retry", 1, "connection error: refused"),
+                ("before_request", endpoint, "my-connector", 2),
+                ("after_response", 409, True),
+                ("on_retry", 2, "status code 409"),
+                ("before_request", endpoint, "my-connector", 3),
+                ("after_response", 200, True),
+            ],
+        )
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_failing_hook_does_not_fail_the_request(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value = mock.Mock(
+            status_code=200, content=b'{"version": "7.3.0"}'
+        )
+        hook = mock.Mock(spec=["before_request"])
+        hook.before_request.side_effect = RuntimeError("broken")
+        kc = KafkaConnect(hooks=[hook])
+
+        with self.assertLogs(level="WARNING") as cm:
+            self.assertEqual(kc.get_cluster_info(), {"version": "7.3.0"})
+        hook.before_request.assert_called_once()
+        self.assertIn("before_request hook of Mock failed: broken", cm.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
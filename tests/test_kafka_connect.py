@@ -1,8 +1,16 @@
 from unittest.mock import patch
 from kafka_connect import KafkaConnect
+from kafka_connect.codec import encode
+from kafka_connect.disk_cache import DiskCache
+from kafka_connect.retry import RetryPolicy
+from requests.exceptions import ConnectionError, HTTPError
 
+import itertools
 import mock
 import logging
+import tempfile
+import threading
+import time
 import unittest
 import json
 
@@ -36,18 +44,319 @@ class TestKafkaConnect(unittest.TestCase):
             "Invalid auth string. Expected a colon-delimited string of `username` and `password`.",
         )
 
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_session_is_reused(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value.content = b"{}"
+        kc = KafkaConnect(pool_connections=4, pool_maxsize=32, max_retries=3)
+        kc.get_connector_status("my-connector")
+        kc.get_connector_config("my-connector")
+
+        # ensure every endpoint method shares one pooled session
+        mock_requests.Session.assert_called_once()
+        mock_requests.adapters.HTTPAdapter.assert_called_once_with(
+            pool_connections=4, pool_maxsize=32, max_retries=3
+        )
+        self.assertEqual(mock_requests.Session.return_value.request.call_count, 2)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_session_without_keep_alive(self, mock_requests):
+        mock_session = mock_requests.Session.return_value
+        mock_session.headers = {}
+        kc = KafkaConnect(keep_alive=False)
+        self.assertEqual(kc.session.headers, {"Connection": "close"})
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_close(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value.content = b"[]"
+        with KafkaConnect() as kc:
+            kc.list_connectors()
+        mock_requests.Session.return_value.close.assert_called_once()
+        self.assertIsNone(kc._session)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_cache(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.return_value.content = json.dumps({"tasks.max": "1"}).encode()
+        kc = KafkaConnect(cache=True)
+
+        kc.get_connector_config("my-connector")
+        kc.get_connector_config("my-connector")
+        kc.list_connector_plugins()
+        self.assertEqual(mock_request.call_count, 2)
+
+        # ensure mutating a connector evicts only its own cached responses
+        kc.pause_connector("my-connector")
+        kc.get_connector_config("my-connector")
+        kc.list_connector_plugins()
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertEqual(kc.cache.stats(), {"hits": 2, "misses": 3, "size": 2})
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_cache_keyword_arguments(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.return_value.content = json.dumps({"tasks.max": "1"}).encode()
+
+        for cache in (None, True):
+            mock_request.reset_mock()
+            kc = KafkaConnect(cache=cache)
+            self.assertEqual(kc.get_connector_config(connector="my-connector"), {"tasks.max": "1"})
+            kc.get_connector_config("my-connector")
+            self.assertEqual(mock_request.call_count, 2 if cache is None else 1)
+
+        # ensure keyword and positional calls share the entry that mutations evict
+        kc.pause_connector(connector="my-connector")
+        kc.get_connector_config(connector="my-connector")
+        self.assertEqual(kc.cache.stats(), {"hits": 1, "misses": 2, "size": 1})
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_disk_cache(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        commit = {"commit": "abc"}
+
+        def request(method, url, **kwargs):
+            if url.endswith("/connector-plugins"):
+                return mock.Mock(status_code=200, content=b'[{"class": "FileStreamSink"}]')
+            return mock.Mock(status_code=200, content=json.dumps(commit).encode())
+
+        mock_request.side_effect = request
+        with tempfile.TemporaryDirectory() as directory:
+            # each client stands for a separate kc invocation
+            for _ in range(3):
+                kc = KafkaConnect(disk_cache=DiskCache(directory, ttl=0))
+                self.assertEqual(kc.list_connector_plugins(), [{"class": "FileStreamSink"}])
+            commit["commit"] = "def"
+            KafkaConnect(disk_cache=DiskCache(directory, ttl=0)).list_connector_plugins()
+
+        # ensure the plugins are only refetched once the cluster commit changes
+        urls = [c.args[1] for c in mock_request.call_args_list]
+        self.assertEqual(urls.count("http://localhost:8083/connector-plugins"), 2)
+        self.assertEqual(urls.count("http://localhost:8083"), 4)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_disk_cache_validates_plugins_with_fresh_cluster_info(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        cluster = {"version": "7.4.0", "commit": "abc"}
+
+        def request(method, url, **kwargs):
+            if url.endswith("/connector-plugins"):
+                return mock.Mock(status_code=200, content=json.dumps([cluster]).encode())
+            return mock.Mock(status_code=200, content=json.dumps(cluster).encode())
+
+        mock_request.side_effect = request
+        with tempfile.TemporaryDirectory() as directory, patch(
+            "kafka_connect.kafka_connect.time.monotonic", return_value=100.0
+        ) as mock_monotonic:
+            KafkaConnect(disk_cache=DiskCache(directory)).get_cluster_info()
+            kc = KafkaConnect(disk_cache=DiskCache(directory))
+            for _ in range(3):
+                kc.list_connector_plugins()
+
+            # ensure a loop over the plugins checks the cluster version once per window
+            urls = [c.args[1] for c in mock_request.call_args_list]
+            self.assertEqual(urls.count("http://localhost:8083"), 2)
+            self.assertEqual(urls.count("http://localhost:8083/connector-plugins"), 1)
+
+            # ensure the plugins of a redeployed cluster are refetched while the cluster info is still cached
+            cluster["commit"] = "def"
+            self.assertEqual(kc.list_connector_plugins(), [{"version": "7.4.0", "commit": "abc"}])
+            mock_monotonic.return_value += KafkaConnect.CLUSTER_VERSION_TTL
+            self.assertEqual(kc.list_connector_plugins(), [{"version": "7.4.0", "commit": "def"}])
+            self.assertEqual(
+                KafkaConnect(disk_cache=DiskCache(directory)).get_cluster_info()["commit"], "def"
+            )
+
+    @patch("kafka_connect.kafka_connect.time")
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_retry(self, mock_requests, mock_time):
+        mock_request = mock_requests.Session.return_value.request
+        rebalancing = mock.Mock(
+            status_code=409,
+            content=b'{"error_code": 409, "message": "Cannot complete request because of a '
+            b'conflicting operation (e.g. worker rebalance)"}',
+        )
+        created = mock.Mock(status_code=201, content=b'{"name": "my-connector"}')
+        mock_request.side_effect = [ConnectionError("refused"), rebalancing, created]
+        retry = RetryPolicy(max_attempts=3)
+        kc = KafkaConnect(retry=retry)
+
+        result = kc.create_connector({"name": "my-connector", "config": {}})
+
+        # ensure the connection error and the 409 are retried with a backoff
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_time.sleep.call_count, 2)
+        self.assertEqual(retry.retries, 2)
+        rebalancing.close.assert_called_once()
+        self.assertEqual(result, json.loads(created.content))
+
+    @patch("kafka_connect.kafka_connect.time")
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_retry_skips_existing_connector(self, mock_requests, mock_time):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.return_value = mock.Mock(
+            status_code=409,
+            content=b'{"error_code": 409, "message": "Connector my-connector already exists"}',
+        )
+        mock_request.return_value.raise_for_status.side_effect = HTTPError("409 Conflict")
+        kc = KafkaConnect(retry=RetryPolicy(max_attempts=3))
+
+        # ensure a conflict that no retry resolves is raised right away
+        with self.assertRaises(HTTPError):
+            kc.create_connector({"name": "my-connector", "config": {}})
+        self.assertEqual(mock_request.call_count, 1)
+        mock_time.sleep.assert_not_called()
+
+    @patch("kafka_connect.kafka_connect.time")
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_retry_exhausted(self, mock_requests, mock_time):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.side_effect = ConnectionError("refused")
+        kc = KafkaConnect(retry=RetryPolicy(max_attempts=2))
+
+        with self.assertRaises(ConnectionError):
+            kc.get_cluster_info()
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_metrics(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        status = mock.Mock(status_code=200, content=b'{"name": "a"}')
+        mock_request.side_effect = [
+            status,
+            status,
+            ConnectionError("refused"),
+            mock.Mock(status_code=201, content=b"{}"),
+        ]
+        kc = KafkaConnect(metrics=True, retry=RetryPolicy(max_attempts=2, base_delay=0))
+
+        kc.get_connector_status("a")
+        kc.get_connector_status("b")
+        kc.create_connector({"name": "c"})
+
+        # ensure the requests are recorded per endpoint template, including the failed attempt and its retry
+        snapshot = kc.metrics.snapshot()
+        self.assertEqual(list(snapshot), ["GET /connectors/{name}/status", "POST /connectors"])
+        status_metrics = snapshot["GET /connectors/{name}/status"]
+        self.assertEqual(status_metrics["requests"], 2)
+        self.assertEqual(status_metrics["status_codes"], {200: 2})
+        self.assertEqual(status_metrics["bytes_received"], 2 * len(status.content))
+        create_metrics = snapshot["POST /connectors"]
+        self.assertEqual(create_metrics["requests"], 2)
+        self.assertEqual(create_metrics["errors"], 1)
+        self.assertEqual(create_metrics["retries"], 1)
+        self.assertEqual(create_metrics["bytes_sent"], len(encode({"name": "c"})))
+        self.assertIn('code="201"', kc.metrics.to_prometheus())
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_max_inflight(self, mock_requests):
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def request(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return mock.Mock(status_code=202)
+
+        mock_requests.Session.return_value.request.side_effect = request
+        kc = KafkaConnect(max_inflight=2)
+        with patch.object(kc, "list_connectors", return_value=[f"c-{i}" for i in range(8)]):
+            kc.pause_all_connectors(max_workers=8)
+
+        # ensure the in-flight cap is shared by every worker thread
+        self.assertEqual(peak, 2)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_max_inflight_streamed_listing(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.return_value = mock.Mock(status_code=200)
+        mock_request.return_value.iter_content.return_value = [
+            b'{"my-jdbc-source": {"status": {"connector": {"state": "RUNNING"}}},',
+            b' "my-hdfs-sink": {"status": {"connector": {"state": "RUNNING"}}}}',
+        ]
+        kc = KafkaConnect(max_inflight=1)
+        inflight = kc._KafkaConnect__inflight
+
+        connectors = kc.stream_connectors(expand="status")
+        next(connectors)
+        # ensure the streamed listing keeps its slot while its body is being read
+        self.assertFalse(inflight.acquire(blocking=False))
+        self.assertEqual([name for name, _ in connectors], ["my-hdfs-sink"])
+        self.assertTrue(inflight.acquire(blocking=False))
+        inflight.release()
+
+        # ensure the slot is freed once however many times the response is closed
+        mock_request.return_value.close()
+        with self.assertRaises(ValueError):
+            inflight.release()
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_max_rps(self, mock_requests):
+        mock_requests.Session.return_value.request.return_value.content = b"{}"
+        kc = KafkaConnect(max_rps=5, burst=3)
+        with patch.object(kc.rate_limiter, "sleep") as mock_sleep:
+            for _ in range(4):
+                kc.get_connector_status("my-connector")
+        mock_sleep.assert_called_once()
+        self.assertGreater(mock_sleep.call_args.args[0], 0)
+        self.assertLessEqual(mock_sleep.call_args.args[0], 0.2)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_failover(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        kc = KafkaConnect(url="http://worker-0:8083, http://worker-1:8083/")
+        self.assertEqual(kc.url, "http://worker-0:8083")
+
+        def request(method, url, **kwargs):
+            if url.startswith("http://worker-0:8083"):
+                raise ConnectionError("refused")
+            return mock.Mock(status_code=200, content=b"{}")
+
+        mock_request.side_effect = request
+        kc.get_connector_status("my-connector")
+
+        # ensure reads fail over transparently and the failed worker is skipped afterwards
+        self.assertEqual(
+            [c.args[1] for c in mock_request.call_args_list],
+            [
+                "http://worker-0:8083/connectors/my-connector/status",
+                "http://worker-1:8083/connectors/my-connector/status",
+            ],
+        )
+        self.assertEqual(kc.workers.healthy(), ["http://worker-1:8083"])
+        kc.get_connector_status("my-connector")
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_no_failover_for_writes(self, mock_requests):
+        mock_request = mock_requests.Session.return_value.request
+        mock_request.side_effect = ConnectionError("refused")
+        kc = KafkaConnect(url=["http://worker-0:8083", "http://worker-1:8083"])
+
+        with self.assertRaises(ConnectionError):
+            kc.pause_connector("my-connector")
+        mock_request.assert_called_once()
+
     @patch("kafka_connect.kafka_connect.requests")
     def test_get_cluster_info(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "version": "1.0.0",
-            "commit": "abc123",
-            "kafka_cluster_id": "def456",
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "version": "1.0.0",
+                "commit": "abc123",
+                "kafka_cluster_id": "def456",
+            }
+        ).encode()
         result = self.kafka_connect.get_cluster_info()
-        mock_requests.get.assert_called_with("http://localhost:8083", auth=None, verify=True)
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET", "http://localhost:8083", auth=None, verify=True
+        )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     def test_filter_by_pattern_without_expand(self):
         connectors = ["my-jdbc-source", "my-hdfs-sink"]
@@ -68,264 +377,288 @@ class TestKafkaConnect(unittest.TestCase):
         self.assertEqual(filtered_connectors, ["my-jdbc-source", "my-hdfs-sink"])
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_filter_by_state_no_state(self, mock_requests):
-        connectors = ["my-jdbc-source", "my-hdfs-sink"]
-        filtered_connectors = self.kafka_connect._KafkaConnect__filter_by_state(
-            connectors, state=None
-        )
-        self.assertEqual(filtered_connectors, ["my-jdbc-source", "my-hdfs-sink"])
-
-    @patch("kafka_connect.kafka_connect.requests")
-    def test_filter_by_state_without_expand(self, mock_requests):
-        connectors = ["my-jdbc-source", "my-hdfs-sink"]
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "my-jdbc-source": {
-                "status": {
-                    "name": "my-jdbc-source",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "sink",
-                }
-            },
-            "my-hdfs-sink": {
-                "status": {
-                    "name": "my-hdfs-sink",
-                    "connector": {"state": "PAUSED", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "source",
-                }
-            },
-        }
+    def test_list_connectors_without_expand(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(json.dumps(["my-jdbc-source", "my-hdfs-sink"])).encode()
 
-        filtered_connectors = self.kafka_connect._KafkaConnect__filter_by_state(
-            connectors, state="RUNNING"
-        )
+        result = self.kafka_connect.list_connectors()
 
-        # ensure the filter function calls list expand=status to get the connector status when not provided.
-        mock_requests.get.assert_called_once_with(
-            "http://localhost:8083/connectors", auth=None, verify=True, params={"expand": "status"}
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": None},
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(filtered_connectors, ["my-jdbc-source"])
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_filter_by_state_with_expand_status(self, mock_requests):
-        connectors = {
-            "my-jdbc-source": {
-                "status": {
-                    "name": "my-jdbc-source",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "sink",
-                }
-            },
-            "my-hdfs-sink": {
-                "status": {
-                    "name": "my-hdfs-sink",
-                    "connector": {"state": "FAILED", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "source",
-                }
-            },
-        }
-
-        mock_response = mock_requests.get.return_value
-        mock_response.get.return_value.json.return_value = {
-            "my-jdbc-source": {
-                "status": {
-                    "name": "my-jdbc-source",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "sink",
-                }
+    def test_list_connectors_with_expand_status(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "FileStreamSinkConnectorConnector_0": {
+                    "status": {
+                        "name": "FileStreamSinkConnectorConnector_0",
+                        "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
+                        "tasks": [{"id": 0, "state": "RUNNING", "worker_id": "10.0.0.162:8083"}],
+                        "type": "sink",
+                    }
+                },
+                "DatagenConnectorConnector_0": {
+                    "status": {
+                        "name": "DatagenConnectorConnector_0",
+                        "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
+                        "tasks": [{"id": 0, "state": "RUNNING", "worker_id": "10.0.0.162:8083"}],
+                        "type": "source",
+                    }
+                },
             }
-        }
+        ).encode()
 
-        filtered_connectors = self.kafka_connect._KafkaConnect__filter_by_state(
-            connectors, state="RUNNING"
-        )
+        result = self.kafka_connect.list_connectors(expand="status")
 
-        # ensure the filter function does not make redundant calls to expand=status when already provided
-        mock_requests.get.assert_not_called()
-        self.assertEqual(filtered_connectors, {"my-jdbc-source": connectors["my-jdbc-source"]})
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": "status"},
+        )
+        mock_response.raise_for_status.assert_called_once()
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_filter_by_state_with_expand_info(self, mock_requests):
-        connectors = {
-            "FileStreamSinkConnectorConnector_0": {
-                "info": {
-                    "name": "FileStreamSinkConnectorConnector_0",
-                    "config": {
-                        "connector.class": "org.apache.kafka.connect.file.FileStreamSinkConnector",
-                        "file": "/Users/smogili/file.txt",
-                        "tasks.max": "1",
-                        "topics": "datagen",
+    def test_list_connectors_with_expand_info(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "FileStreamSinkConnectorConnector_0": {
+                    "info": {
                         "name": "FileStreamSinkConnectorConnector_0",
-                    },
-                    "tasks": [],
-                    "type": "sink",
-                }
-            },
-            "DatagenConnectorConnector_0": {
-                "info": {
-                    "name": "DatagenConnectorConnector_0",
-                    "config": {
-                        "connector.class": "io.confluent.kafka.connect.datagen.DatagenConnector",
-                        "quickstart": "clickstream",
-                        "tasks.max": "1",
+                        "config": {
+                            "connector.class": "org.apache.kafka.connect.file.FileStreamSinkConnector",
+                            "file": "/Users/smogili/file.txt",
+                            "tasks.max": "1",
+                            "topics": "datagen",
+                            "name": "FileStreamSinkConnectorConnector_0",
+                        },
+                        "tasks": [{"connector": "FileStreamSinkConnectorConnector_0", "task": 0}],
+                        "type": "sink",
+                    }
+                },
+                "DatagenConnectorConnector_0": {
+                    "info": {
                         "name": "DatagenConnectorConnector_0",
-                        "kafka.topic": "datagen",
-                    },
-                    "tasks": [],
-                    "type": "source",
-                }
-            },
-        }
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "FileStreamSinkConnectorConnector_0": {
-                "status": {
-                    "name": "FileStreamSinkConnectorConnector_0",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "sink",
-                }
-            },
-            "DatagenConnectorConnector_0": {
-                "status": {
-                    "name": "DatagenConnectorConnector_0",
-                    "connector": {"state": "FAILED", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [],
-                    "type": "source",
-                }
-            },
-        }
+                        "config": {
+                            "connector.class": "io.confluent.kafka.connect.datagen.DatagenConnector",
+                            "quickstart": "clickstream",
+                            "tasks.max": "1",
+                            "name": "DatagenConnectorConnector_0",
+                            "kafka.topic": "datagen",
+                        },
+                        "tasks": [{"connector": "DatagenConnectorConnector_0", "task": 0}],
+                        "type": "source",
+                    }
+                },
+            }
+        ).encode()
 
-        filtered_connectors = self.kafka_connect._KafkaConnect__filter_by_state(
-            connectors, state="FAILED"
-        )
+        result = self.kafka_connect.list_connectors(expand="info")
 
-        # ensure the filter function calls expand=status when expand=info is provided
-        mock_requests.get.assert_called_once_with(
-            "http://localhost:8083/connectors", auth=None, verify=True, params={"expand": "status"}
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": "info"},
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(
-            filtered_connectors,
-            {"DatagenConnectorConnector_0": connectors["DatagenConnectorConnector_0"]},
+        self.assertEqual(result, json.loads(mock_response.content))
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_list_connectors_with_expand_status_and_info(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "my-jdbc-source": {"status": {"connector": {"state": "RUNNING"}}, "info": {}},
+            }
+        ).encode()
+
+        result = self.kafka_connect.list_connectors(expand=["status", "info"])
+
+        # ensure both expansions are fetched in a single request
+        mock_requests.Session.return_value.request.assert_called_once_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": ["status", "info"]},
         )
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_list_connectors_without_expand(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = json.dumps(["my-jdbc-source", "my-hdfs-sink"])
+    def test_list_connectors_with_state(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        body = {
+            "my-jdbc-source": {"status": {"connector": {"state": "RUNNING"}}},
+            "my-hdfs-sink": {"status": {"connector": {"state": "FAILED"}}},
+        }
+        mock_response.iter_content.return_value = [json.dumps(body).encode()]
 
-        result = self.kafka_connect.list_connectors()
+        result = self.kafka_connect.list_connectors(state="failed")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors", auth=None, verify=True, params={"expand": None}
+        # ensure the state filter reuses a single, streamed expand=status listing
+        mock_requests.Session.return_value.request.assert_called_once_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": "status"},
+            stream=True,
         )
-        mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        mock_response.close.assert_called_once_with()
+        self.assertEqual(result, ["my-hdfs-sink"])
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_list_connectors_with_expand_status(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "FileStreamSinkConnectorConnector_0": {
-                "status": {
-                    "name": "FileStreamSinkConnectorConnector_0",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [{"id": 0, "state": "RUNNING", "worker_id": "10.0.0.162:8083"}],
-                    "type": "sink",
-                }
+    def test_list_connectors_with_expand_info_and_state(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        body = {
+            "my-jdbc-source": {
+                "status": {"connector": {"state": "RUNNING"}},
+                "info": {"type": "source"},
             },
-            "DatagenConnectorConnector_0": {
-                "status": {
-                    "name": "DatagenConnectorConnector_0",
-                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.162:8083"},
-                    "tasks": [{"id": 0, "state": "RUNNING", "worker_id": "10.0.0.162:8083"}],
-                    "type": "source",
-                }
+            "my-hdfs-sink": {
+                "status": {"connector": {"state": "FAILED"}},
+                "info": {"type": "sink"},
             },
         }
+        # split the body mid-token to exercise the incremental parser
+        raw = json.dumps(body).encode()
+        mock_response.iter_content.return_value = [raw[:7], raw[7:50], raw[50:]]
 
-        result = self.kafka_connect.list_connectors(expand="status")
+        result = self.kafka_connect.list_connectors(expand="info", state="running")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors", auth=None, verify=True, params={"expand": "status"}
+        # ensure the status is fetched alongside the info and dropped from the result
+        mock_requests.Session.return_value.request.assert_called_once_with(
+            "GET",
+            "http://localhost:8083/connectors",
+            auth=None,
+            verify=True,
+            params={"expand": ["info", "status"]},
+            stream=True,
         )
-        mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, {"my-jdbc-source": {"info": {"type": "source"}}})
 
     @patch("kafka_connect.kafka_connect.requests")
-    def test_list_connectors_with_expand_info(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "FileStreamSinkConnectorConnector_0": {
-                "info": {
-                    "name": "FileStreamSinkConnectorConnector_0",
-                    "config": {
-                        "connector.class": "org.apache.kafka.connect.file.FileStreamSinkConnector",
-                        "file": "/Users/smogili/file.txt",
-                        "tasks.max": "1",
-                        "topics": "datagen",
-                        "name": "FileStreamSinkConnectorConnector_0",
-                    },
-                    "tasks": [{"connector": "FileStreamSinkConnectorConnector_0", "task": 0}],
+    def test_list_connectors_typed(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        body = {
+            "my-hdfs-sink": {
+                "status": {
+                    "name": "my-hdfs-sink",
+                    "connector": {"state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+                    "tasks": [{"id": 0, "state": "FAILED", "worker_id": "10.0.0.1:8083"}],
                     "type": "sink",
-                }
-            },
-            "DatagenConnectorConnector_0": {
-                "info": {
-                    "name": "DatagenConnectorConnector_0",
-                    "config": {
-                        "connector.class": "io.confluent.kafka.connect.datagen.DatagenConnector",
-                        "quickstart": "clickstream",
-                        "tasks.max": "1",
-                        "name": "DatagenConnectorConnector_0",
-                        "kafka.topic": "datagen",
-                    },
-                    "tasks": [{"connector": "DatagenConnectorConnector_0", "task": 0}],
-                    "type": "source",
-                }
+                },
+                "info": {"name": "my-hdfs-sink", "config": {"tasks.max": "1"}, "tasks": []},
             },
         }
+        mock_response.content = json.dumps(body).encode()
+        mock_response.iter_content.return_value = [mock_response.content]
+
+        for kwargs in ({}, {"pattern": "my-"}):
+            result = self.kafka_connect.list_connectors(
+                expand=["status", "info"], typed=True, **kwargs
+            )
+            connector = result["my-hdfs-sink"]
+            self.assertEqual(connector["status"].tasks[0].state, "FAILED")
+            self.assertEqual(connector["info"].config, {"tasks.max": "1"})
+            self.assertEqual(connector["status"].to_dict(), body["my-hdfs-sink"]["status"])
 
-        result = self.kafka_connect.list_connectors(expand="info")
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_list_connectors_typed_without_expand(self, mock_requests):
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = b'["my-jdbc-source", "my-hdfs-sink"]'
+
+        # ensure a listing of names is returned unchanged
+        for kwargs in ({}, {"pattern": "my-"}):
+            result = self.kafka_connect.list_connectors(typed=True, **kwargs)
+            self.assertEqual(result, ["my-jdbc-source", "my-hdfs-sink"])
+
+    @patch("kafka_connect.kafka_connect.time")
+    def test_watch(self, mock_time):
+        running = {"my-connector": {"status": {"connector": {"state": "RUNNING"}, "tasks": []}}}
+        failed = {"my-connector": {"status": {"connector": {"state": "FAILED"}, "tasks": []}}}
+        polls = [running, running, running, failed]
+        mock_time.time.return_value = 1700000000.0
+
+        with patch.object(self.kafka_connect, "list_connectors", side_effect=polls):
+            events = self.kafka_connect.watch(min_interval=1, max_interval=3)
+            first, second = next(events), next(events)
+
+        self.assertEqual((first["from"], first["to"]), (None, "RUNNING"))
+        self.assertEqual((second["from"], second["to"]), ("RUNNING", "FAILED"))
+        self.assertEqual(second["timestamp"], 1700000000.0)
+
+        # ensure the poll interval backs off while stable and is capped
+        self.assertEqual([c.args[0] for c in mock_time.sleep.call_args_list], [1, 2, 3])
+
+    @patch("kafka_connect.kafka_connect.time")
+    def test_watch_state(self, mock_time):
+        def poll(*states):
+            return {
+                name: {"status": {"connector": {"state": state}, "tasks": []}}
+                for name, state in zip(("my-jdbc-source", "my-hdfs-sink"), states)
+            }
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors", auth=None, verify=True, params={"expand": "info"}
+        polls = [poll("FAILED", "RUNNING"), poll("RUNNING", "PAUSED"), poll("RUNNING", "FAILED")]
+        with patch.object(
+            self.kafka_connect, "list_connectors", side_effect=polls
+        ) as mock_list_connectors:
+            events = self.kafka_connect.watch(state="failed")
+            transitions = [
+                (e["connector"], e["from"], e["to"]) for e in itertools.islice(events, 3)
+            ]
+
+        # ensure a recovery is reported with its new state rather than as the connector vanishing
+        mock_list_connectors.assert_called_with(expand="status", pattern=None)
+        self.assertEqual(
+            transitions,
+            [
+                ("my-jdbc-source", None, "FAILED"),
+                ("my-jdbc-source", "FAILED", "RUNNING"),
+                ("my-hdfs-sink", "PAUSED", "FAILED"),
+            ],
         )
-        mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_create_connector(self, mock_requests):
-        mock_response = mock_requests.get.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         mock_response.status_code = 201
-        mock_response.json.return_value = json.dumps(
-            {
-                "name": "hdfs-sink-connector",
-                "config": {
-                    "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
-                    "tasks.max": "10",
-                    "topics": "test-topic",
-                    "hdfs.url": "hdfs://fakehost:9000",
-                    "hadoop.conf.dir": "/opt/hadoop/conf",
-                    "hadoop.home": "/opt/hadoop",
-                    "flush.size": "100",
-                    "rotate.interval.ms": "1000",
-                },
-                "tasks": [
-                    {"connector": "hdfs-sink-connector", "task": 1},
-                    {"connector": "hdfs-sink-connector", "task": 2},
-                    {"connector": "hdfs-sink-connector", "task": 3},
-                ],
-            }
-        )
-        mock_requests.post.return_value = mock_response
+        mock_response.content = json.dumps(
+            json.dumps(
+                {
+                    "name": "hdfs-sink-connector",
+                    "config": {
+                        "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
+                        "tasks.max": "10",
+                        "topics": "test-topic",
+                        "hdfs.url": "hdfs://fakehost:9000",
+                        "hadoop.conf.dir": "/opt/hadoop/conf",
+                        "hadoop.home": "/opt/hadoop",
+                        "flush.size": "100",
+                        "rotate.interval.ms": "1000",
+                    },
+                    "tasks": [
+                        {"connector": "hdfs-sink-connector", "task": 1},
+                        {"connector": "hdfs-sink-connector", "task": 2},
+                        {"connector": "hdfs-sink-connector", "task": 3},
+                    ],
+                }
+            )
+        ).encode()
         self.kafka_connect.requests = mock_requests
 
         config = {
@@ -343,41 +676,43 @@ class TestKafkaConnect(unittest.TestCase):
         }
         result = self.kafka_connect.create_connector(config)
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors",
             auth=None,
             verify=True,
             headers={"Content-Type": "application/json"},
-            data=json.dumps(config),
+            data=encode(config),
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_update_connector(self, mock_requests):
-        mock_response = mock_requests.get.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         mock_response.status_code = 200
-        mock_response.json.return_value = json.dumps(
-            {
-                "name": "hdfs-sink-connector",
-                "config": {
-                    "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
-                    "tasks.max": "3",
-                    "topics": "test-topic",
-                    "hdfs.url": "hdfs://fakehost:9000",
-                    "hadoop.conf.dir": "/opt/hadoop/conf",
-                    "hadoop.home": "/opt/hadoop",
-                    "flush.size": "100",
-                    "rotate.interval.ms": "1000",
-                },
-                "tasks": [
-                    {"connector": "hdfs-sink-connector", "task": 1},
-                    {"connector": "hdfs-sink-connector", "task": 2},
-                    {"connector": "hdfs-sink-connector", "task": 3},
-                ],
-            }
-        )
-        mock_requests.put.return_value = mock_response
+        mock_response.content = json.dumps(
+            json.dumps(
+                {
+                    "name": "hdfs-sink-connector",
+                    "config": {
+                        "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
+                        "tasks.max": "3",
+                        "topics": "test-topic",
+                        "hdfs.url": "hdfs://fakehost:9000",
+                        "hadoop.conf.dir": "/opt/hadoop/conf",
+                        "hadoop.home": "/opt/hadoop",
+                        "flush.size": "100",
+                        "rotate.interval.ms": "1000",
+                    },
+                    "tasks": [
+                        {"connector": "hdfs-sink-connector", "task": 1},
+                        {"connector": "hdfs-sink-connector", "task": 2},
+                        {"connector": "hdfs-sink-connector", "task": 3},
+                    ],
+                }
+            )
+        ).encode()
         self.kafka_connect.requests = mock_requests
 
         config = {
@@ -392,171 +727,453 @@ class TestKafkaConnect(unittest.TestCase):
         }
         result = self.kafka_connect.update_connector("hdfs-sink-connector", config)
 
-        mock_requests.put.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "PUT",
             "http://localhost:8083/connectors/hdfs-sink-connector/config",
             auth=None,
             verify=True,
             headers={"Content-Type": "application/json"},
-            data=json.dumps(config),
+            data=encode(config),
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_get_connector(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "name": "hdfs-sink-connector",
-            "config": {
-                "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
-                "tasks.max": "10",
-                "topics": "test-topic",
-                "hdfs.url": "hdfs://fakehost:9000",
-                "hadoop.conf.dir": "/opt/hadoop/conf",
-                "hadoop.home": "/opt/hadoop",
-                "flush.size": "100",
-                "rotate.interval.ms": "1000",
-            },
-            "tasks": [
-                {"connector": "hdfs-sink-connector", "task": 1},
-                {"connector": "hdfs-sink-connector", "task": 2},
-                {"connector": "hdfs-sink-connector", "task": 3},
-            ],
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "name": "hdfs-sink-connector",
+                "config": {
+                    "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
+                    "tasks.max": "10",
+                    "topics": "test-topic",
+                    "hdfs.url": "hdfs://fakehost:9000",
+                    "hadoop.conf.dir": "/opt/hadoop/conf",
+                    "hadoop.home": "/opt/hadoop",
+                    "flush.size": "100",
+                    "rotate.interval.ms": "1000",
+                },
+                "tasks": [
+                    {"connector": "hdfs-sink-connector", "task": 1},
+                    {"connector": "hdfs-sink-connector", "task": 2},
+                    {"connector": "hdfs-sink-connector", "task": 3},
+                ],
+            }
+        ).encode()
 
         result = self.kafka_connect.get_connector("hdfs-sink-connector")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors/hdfs-sink-connector", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET", "http://localhost:8083/connectors/hdfs-sink-connector", auth=None, verify=True
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_get_connector_config(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
-            "tasks.max": "10",
-            "topics": "test-topic",
-            "hdfs.url": "hdfs://fakehost:9000",
-            "hadoop.conf.dir": "/opt/hadoop/conf",
-            "hadoop.home": "/opt/hadoop",
-            "flush.size": "100",
-            "rotate.interval.ms": "1000",
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
+                "tasks.max": "10",
+                "topics": "test-topic",
+                "hdfs.url": "hdfs://fakehost:9000",
+                "hadoop.conf.dir": "/opt/hadoop/conf",
+                "hadoop.home": "/opt/hadoop",
+                "flush.size": "100",
+                "rotate.interval.ms": "1000",
+            }
+        ).encode()
 
         result = self.kafka_connect.get_connector_config("hdfs-sink-connector")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors/hdfs-sink-connector/config", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors/hdfs-sink-connector/config",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_get_connector_status(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "name": "hdfs-sink-connector",
-            "connector": {"state": "RUNNING", "worker_id": "fakehost:8083"},
-            "tasks": [
-                {"id": 0, "state": "RUNNING", "worker_id": "fakehost:8083"},
-                {
-                    "id": 1,
-                    "state": "FAILED",
-                    "worker_id": "fakehost:8083",
-                    "trace": "org.apache.kafka.common.errors.RecordTooLargeException\n",
-                },
-            ],
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "name": "hdfs-sink-connector",
+                "connector": {"state": "RUNNING", "worker_id": "fakehost:8083"},
+                "tasks": [
+                    {"id": 0, "state": "RUNNING", "worker_id": "fakehost:8083"},
+                    {
+                        "id": 1,
+                        "state": "FAILED",
+                        "worker_id": "fakehost:8083",
+                        "trace": "org.apache.kafka.common.errors.RecordTooLargeException\n",
+                    },
+                ],
+            }
+        ).encode()
 
         result = self.kafka_connect.get_connector_status("hdfs-sink-connector")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors/hdfs-sink-connector/status", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors/hdfs-sink-connector/status",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_restart_connector(self, mock_requests):
-        mock_response = mock_requests.post.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         mock_response.status_code = 200
+        mock_response.content = b"{}"
 
         result = self.kafka_connect.restart_connector("my-connector")
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors/my-connector/restart",
             auth=None,
             verify=True,
             params={"includeTasks": False, "onlyFailed": False},
         )
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_restart_connector_with_include_tasks(self, mock_requests):
-        mock_response = mock_requests.post.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         mock_response.status_code = 202
+        mock_response.content = json.dumps({"connector": {"state": "RESTARTING"}}).encode()
 
         result = self.kafka_connect.restart_connector("my-connector", include_tasks=True)
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors/my-connector/restart",
             auth=None,
             verify=True,
             params={"includeTasks": True, "onlyFailed": False},
         )
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_restart_connector_with_only_failed(self, mock_requests):
-        mock_response = mock_requests.post.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         mock_response.status_code = 202
-        mock_response.json.return_value = {
-            "name": "my-connector",
-            "config": {
-                "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
-                "tasks.max": "1",
-                "file": "/tmp/test.txt",
-                "topics": "test",
-                "hdfs.url": "hdfs://localhost:8020",
-            },
-            "tasks": [{"connector": "my-connector", "task": 0, "status": "FAILED"}],
-            "type": "sink",
-        }
+        mock_response.content = json.dumps(
+            {
+                "name": "my-connector",
+                "config": {
+                    "connector.class": "io.confluent.connect.hdfs.HdfsSinkConnector",
+                    "tasks.max": "1",
+                    "file": "/tmp/test.txt",
+                    "topics": "test",
+                    "hdfs.url": "hdfs://localhost:8020",
+                },
+                "tasks": [{"connector": "my-connector", "task": 0, "status": "FAILED"}],
+                "type": "sink",
+            }
+        ).encode()
 
         result = self.kafka_connect.restart_connector("my-connector", only_failed=True)
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors/my-connector/restart",
             auth=None,
             verify=True,
             params={"includeTasks": False, "onlyFailed": True},
         )
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_pause_connector(self, mock_requests):
-        mock_response = mock_requests.put.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         connector_name = "hdfs-sink-connector"
 
         result = self.kafka_connect.pause_connector(connector_name)
 
-        mock_requests.put.assert_called_with(
-            f"http://localhost:8083/connectors/{connector_name}/pause", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "PUT",
+            f"http://localhost:8083/connectors/{connector_name}/pause",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(result, None)
 
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_pause_all_connectors(self, mock_requests):
+        connectors = {f"connector-{i}": {"status": {}} for i in range(20)}
+
+        def pause_connector(connector):
+            if connector == "connector-7":
+                raise HTTPError("409 Client Error: Conflict")
+
+        with patch.object(self.kafka_connect, "list_connectors", return_value=connectors):
+            with patch.object(
+                self.kafka_connect, "pause_connector", side_effect=pause_connector
+            ) as mock_pause:
+                mock_pause.__name__ = "pause_connector"
+                result = self.kafka_connect.pause_all_connectors(max_workers=8)
+
+        # ensure every connector is attempted and the results keep the listing order
+        self.assertEqual(mock_pause.call_count, 20)
+        self.assertEqual(list(result), list(connectors))
+        self.assertIsInstance(result["connector-7"], HTTPError)
+        self.assertEqual(
+            [conn for conn, resp in result.items() if resp is not None], ["connector-7"]
+        )
+        self.assertEqual(self.kafka_connect.pool_maxsize, 10)
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_stop_all_connectors_callback(self, mock_requests):
+        connectors = {f"connector-{i}": {"status": {}} for i in range(5)}
+        outcomes = []
+        main_thread = threading.current_thread()
+
+        def callback(connector, response):
+            # callbacks run on the calling thread, so they need no locking
+            self.assertIs(threading.current_thread(), main_thread)
+            outcomes.append(connector)
+
+        with patch.object(self.kafka_connect, "list_connectors", return_value=connectors):
+            result = self.kafka_connect.stop_all_connectors(max_workers=3, callback=callback)
+
+        self.assertEqual(sorted(outcomes), list(connectors))
+        self.assertEqual(list(result), list(connectors))
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_pause_all_connectors_grows_pool_of_live_session(self, mock_requests):
+        connectors = {"my-jdbc-source": {"status": {}}}
+        session = self.kafka_connect.session
+        with patch.object(self.kafka_connect, "list_connectors", return_value=connectors):
+            self.kafka_connect.pause_all_connectors(max_workers=16)
+
+        # ensure the live session is kept, with a larger pool mounted for the worker threads
+        self.assertIs(self.kafka_connect.session, session)
+        session.close.assert_not_called()
+        mock_requests.adapters.HTTPAdapter.assert_called_with(
+            pool_connections=10, pool_maxsize=16, max_retries=0
+        )
+        session.mount.assert_called_with(
+            "https://", mock_requests.adapters.HTTPAdapter.return_value
+        )
+
+        # ensure the replaced pool is closed along with the session
+        replaced = session.get_adapter.return_value
+        replaced.close.assert_not_called()
+        self.kafka_connect.close()
+        session.close.assert_called_once()
+        replaced.close.assert_called_once()
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_restart_all_connectors_grows_pool(self, mock_requests):
+        connectors = {"my-jdbc-source": {"status": {}}, "my-hdfs-sink": {"status": {}}}
+        with patch.object(self.kafka_connect, "list_connectors", return_value=connectors):
+            result = self.kafka_connect.restart_all_connectors(
+                include_tasks=True, only_failed=True, max_workers=16
+            )
+
+        self.assertEqual(self.kafka_connect.pool_maxsize, 16)
+        mock_requests.adapters.HTTPAdapter.assert_called_with(
+            pool_connections=10, pool_maxsize=16, max_retries=0
+        )
+        mock_requests.Session.return_value.request.assert_any_call(
+            "POST",
+            "http://localhost:8083/connectors/my-hdfs-sink/restart",
+            auth=None,
+            verify=True,
+            params={"includeTasks": True, "onlyFailed": True},
+        )
+        self.assertEqual(list(result), ["my-jdbc-source", "my-hdfs-sink"])
+
+    @patch("kafka_connect.kafka_connect.requests")
+    def test_restart_failed_tasks(self, mock_requests):
+        def status(state, *task_states):
+            tasks = [{"id": i, "state": task_state} for i, task_state in enumerate(task_states)]
+            return {"status": {"connector": {"state": state}, "tasks": tasks}}
+
+        connectors = {
+            "healthy": status("RUNNING", "RUNNING", "RUNNING"),
+            "one-task": status("RUNNING", "RUNNING", "FAILED"),
+            "many-tasks": status("RUNNING", "FAILED", "FAILED"),
+            "instance": status("FAILED", "RUNNING"),
+            "rebalancing": status("RUNNING", "FAILED", "FAILED"),
+        }
+
+        def restart_connector(connector, include_tasks=False, only_failed=False):
+            if connector == "rebalancing":
+                raise HTTPError("409 Client Error: Conflict")
+
+        with patch.object(
+            self.kafka_connect, "list_connectors", return_value=connectors
+        ) as mock_list, patch.object(
+            self.kafka_connect, "restart_connector", side_effect=restart_connector
+        ) as mock_restart, patch.object(
+            self.kafka_connect, "restart_connector_task"
+        ) as mock_restart_task:
+            result = self.kafka_connect.restart_failed_tasks(pattern="^[a-z]", max_workers=4)
+
+        # ensure the failures are found with a single listing, and a lone failed task is restarted on its own
+        mock_list.assert_called_once_with(expand="status", pattern="^[a-z]")
+        mock_restart_task.assert_called_once_with("one-task", 1)
+        self.assertEqual(
+            sorted(c.args[0] for c in mock_restart.call_args_list),
+            ["instance", "many-tasks", "rebalancing"],
+        )
+        mock_restart.assert_any_call("many-tasks", include_tasks=True, only_failed=True)
+        self.assertEqual(list(result), ["one-task", "many-tasks", "instance", "rebalancing"])
+        self.assertEqual(result["one-task"], {"connector": False, "tasks": [1]})
+        self.assertEqual(result["instance"], {"connector": True, "tasks": []})
+        self.assertIsInstance(result["rebalancing"], HTTPError)
+
+    def test_iter_connectors(self):
+        names = [f"connector-{i}" for i in range(20)]
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def get_connector_config(connector):
+            with lock:
+                active.append(connector)
+                peak.append(len(active))
+            time.sleep(0.001)
+            with lock:
+                active.remove(connector)
+            if connector == "connector-3":
+                raise HTTPError("404 Client Error: Not Found")
+            return {"name": connector}
+
+        with patch.object(
+            self.kafka_connect, "list_connectors", return_value=names
+        ) as mock_list, patch.object(
+            self.kafka_connect, "get_connector_config", side_effect=get_connector_config
+        ), patch.object(
+            self.kafka_connect, "list_connector_tasks", return_value=[0]
+        ):
+            results = list(
+                self.kafka_connect.iter_connectors(
+                    pattern="^connector", include=["config", "tasks"], prefetch=4, ordered=True
+                )
+            )
+
+        mock_list.assert_called_once_with(pattern="^connector", state=None)
+        self.assertEqual([name for name, _ in results], names)
+        self.assertEqual(results[0][1], {"config": {"name": "connector-0"}, "tasks": [0]})
+        # ensure a failed connector does not stop the others
+        self.assertIsInstance(results[3][1], HTTPError)
+        self.assertLessEqual(max(peak), 4)
+
+    def test_iter_connectors_stops_early(self):
+        names = [f"connector-{i}" for i in range(100)]
+        with patch.object(self.kafka_connect, "list_connectors", return_value=names), patch.object(
+            self.kafka_connect, "list_connector_topics", return_value={}
+        ) as mock_topics:
+            connectors = self.kafka_connect.iter_connectors(include="topics", prefetch=2)
+            name, details = next(connectors)
+            connectors.close()
+
+        self.assertIn(name, names[:3])
+        self.assertEqual(details, {"topics": {}})
+        # ensure only the connectors in the window were fetched
+        self.assertLessEqual(mock_topics.call_count, 3)
+
+    def test_iter_connectors_unknown_detail(self):
+        with self.assertRaises(ValueError):
+            next(self.kafka_connect.iter_connectors(include=["plugins"]))
+
+    def test_export_connectors(self):
+        listing = {
+            "my-hdfs-sink": {
+                "info": {"name": "my-hdfs-sink", "config": {"tasks.max": "1"}, "type": "sink"},
+                "status": {"connector": {"state": "RUNNING"}, "tasks": []},
+            },
+            "deleted": {"info": {"name": "deleted", "config": {}, "type": "source"}, "status": {}},
+        }
+
+        def list_connector_tasks(connector):
+            if connector == "deleted":
+                raise HTTPError("404 Client Error: Not Found")
+            return [{"id": {"connector": connector, "task": 0}, "config": {}}]
+
+        with patch.object(
+            self.kafka_connect, "get_cluster_info", return_value={"version": "7.3.0"}
+        ), patch.object(
+            self.kafka_connect, "list_connectors", return_value=listing
+        ) as mock_list, patch.object(
+            self.kafka_connect, "list_connector_tasks", side_effect=list_connector_tasks
+        ), patch.object(
+            self.kafka_connect, "list_connector_topics"
+        ) as mock_topics:
+            backup = self.kafka_connect.export_connectors(
+                pattern="^my", include=["status", "tasks"], max_workers=4
+            )
+
+        # ensure the configurations and statuses come from a single listing
+        mock_list.assert_called_once_with(expand=["info", "status"], pattern="^my")
+        mock_topics.assert_not_called()
+        self.assertEqual(
+            backup["connectors"]["my-hdfs-sink"],
+            {
+                "name": "my-hdfs-sink",
+                "config": {"tasks.max": "1"},
+                "type": "sink",
+                "status": {"connector": {"state": "RUNNING"}, "tasks": []},
+                "tasks": [{"id": {"connector": "my-hdfs-sink", "task": 0}, "config": {}}],
+            },
+        )
+        self.assertEqual(backup["manifest"]["cluster"], {"version": "7.3.0"})
+        self.assertEqual(backup["manifest"]["connectors"], 2)
+        self.assertEqual(list(backup["failed"]), ["deleted"])
+
+        with self.assertRaises(ValueError):
+            self.kafka_connect.export_connectors(include=["plugins"])
+
+    def test_import_connectors(self):
+        backup = {
+            "manifest": {},
+            "connectors": {
+                "same": {"name": "same", "config": {"name": "same", "tasks.max": "1"}},
+                "changed": {"name": "changed", "config": {"name": "changed", "tasks.max": "2"}},
+                "missing": {"name": "missing", "config": {"name": "missing"}},
+            },
+        }
+        live = {
+            "same": {"info": {"config": {"name": "same", "tasks.max": "1"}}},
+            "changed": {"info": {"config": {"name": "changed", "tasks.max": "1"}}},
+            "extra": {"info": {"config": {"name": "extra"}}},
+        }
+        with patch.object(self.kafka_connect, "list_connectors", return_value=live), patch.object(
+            self.kafka_connect, "update_connector"
+        ) as mock_update:
+            plan = self.kafka_connect.import_connectors(backup, max_workers=2)
+
+        # ensure identical connectors are skipped and connectors missing from the backup are kept
+        self.assertEqual(
+            plan,
+            {"create": ["missing"], "update": ["changed"], "unchanged": ["same"], "failed": {}},
+        )
+        self.assertEqual(
+            sorted(c.args[0] for c in mock_update.call_args_list), ["changed", "missing"]
+        )
+
     @patch("kafka_connect.kafka_connect.requests")
     def test_resume_connector(self, mock_requests):
         connector_name = "hdfs-sink-connector"
-        mock_response = mock_requests.put.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         result = self.kafka_connect.resume_connector(connector_name)
 
-        mock_requests.put.assert_called_with(
-            f"http://localhost:8083/connectors/{connector_name}/resume", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "PUT",
+            f"http://localhost:8083/connectors/{connector_name}/resume",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
         self.assertEqual(result, None)
@@ -564,81 +1181,125 @@ class TestKafkaConnect(unittest.TestCase):
     @patch("kafka_connect.kafka_connect.requests")
     def test_stop_connector(self, mock_requests):
         connector_name = "hdfs-sink-connector"
-        mock_response = mock_requests.put.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         result = self.kafka_connect.stop_connector(connector_name)
 
-        mock_requests.put.assert_called_with(
-            f"http://localhost:8083/connectors/{connector_name}/stop", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "PUT", f"http://localhost:8083/connectors/{connector_name}/stop", auth=None, verify=True
         )
         mock_response.raise_for_status.assert_called_with()
         self.assertEqual(result, None)
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_delete_connector(self, mock_requests):
-        mock_response = mock_requests.delete.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
         connector_name = "hdfs-sink-connector"
 
         result = self.kafka_connect.delete_connector(connector_name)
 
-        mock_requests.delete.assert_called_with(
-            f"http://localhost:8083/connectors/{connector_name}", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "DELETE", f"http://localhost:8083/connectors/{connector_name}", auth=None, verify=True
         )
         mock_response.raise_for_status.assert_called_with()
         self.assertEqual(result, None)
 
+    def test_apply_connectors(self):
+        live = {
+            "unchanged": {"info": {"config": {"tasks.max": "1", "name": "unchanged"}}},
+            "updated": {"info": {"config": {"tasks.max": "1", "name": "updated"}}},
+            "extra": {"info": {"config": {"tasks.max": "1", "name": "extra"}}},
+        }
+        desired = {"unchanged": {"tasks.max": 1}, "updated": {"tasks.max": 2}, "created": {}}
+
+        with patch.object(self.kafka_connect, "list_connectors", return_value=live), patch.object(
+            self.kafka_connect, "update_connector"
+        ) as mock_update, patch.object(self.kafka_connect, "delete_connector") as mock_delete:
+            mock_delete.side_effect = HTTPError("500 Server Error")
+            plan = self.kafka_connect.apply_connectors(desired, prune=True, max_workers=4)
+
+        # ensure only changed connectors are written
+        self.assertEqual(
+            sorted(c.args for c in mock_update.call_args_list),
+            [
+                ("created", {"name": "created"}),
+                ("updated", {"tasks.max": "2", "name": "updated"}),
+            ],
+        )
+        mock_delete.assert_called_once_with("extra")
+        self.assertEqual(plan["unchanged"], ["unchanged"])
+        self.assertEqual(list(plan["failed"]), ["extra"])
+
+    def test_apply_connectors_dry_run(self):
+        with patch.object(self.kafka_connect, "list_connectors", return_value={}), patch.object(
+            self.kafka_connect, "update_connector"
+        ) as mock_update:
+            plan = self.kafka_connect.apply_connectors({"created": {}}, dry_run=True)
+
+        mock_update.assert_not_called()
+        self.assertEqual(plan["create"], ["created"])
+
     @patch("kafka_connect.kafka_connect.requests")
     def test_list_connector_tasks(self, mock_requests):
         connector_name = "hdfs-sink-connector"
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = [
-            {
-                "id": {"connector": connector_name, "task": 0},
-                "config": {
-                    "task.class": "io.confluent.connect.hdfs.HdfsSinkTask",
-                    "topics": "test-topic",
-                    "hdfs.url": "hdfs://fakehost:9000",
-                    "hadoop.conf.dir": "/opt/hadoop/conf",
-                    "hadoop.home": "/opt/hadoop",
-                    "flush.size": "100",
-                    "rotate.interval.ms": "1000",
-                },
-            }
-        ]
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            [
+                {
+                    "id": {"connector": connector_name, "task": 0},
+                    "config": {
+                        "task.class": "io.confluent.connect.hdfs.HdfsSinkTask",
+                        "topics": "test-topic",
+                        "hdfs.url": "hdfs://fakehost:9000",
+                        "hadoop.conf.dir": "/opt/hadoop/conf",
+                        "hadoop.home": "/opt/hadoop",
+                        "flush.size": "100",
+                        "rotate.interval.ms": "1000",
+                    },
+                }
+            ]
+        ).encode()
 
         result = self.kafka_connect.list_connector_tasks(connector_name)
 
-        mock_requests.get.assert_called_with(
-            f"http://localhost:8083/connectors/{connector_name}/tasks", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            f"http://localhost:8083/connectors/{connector_name}/tasks",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_with()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_get_connector_task_status(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "state": "RUNNING",
-            "id": 1,
-            "worker_id": "192.168.86.101:8083",
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "state": "RUNNING",
+                "id": 1,
+                "worker_id": "192.168.86.101:8083",
+            }
+        ).encode()
 
         result = self.kafka_connect.get_connector_task_status("hdfs-sink-connector", 1)
 
-        mock_requests.get.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
             "http://localhost:8083/connectors/hdfs-sink-connector/tasks/1/status",
             auth=None,
             verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_restart_connector_task(self, mock_requests):
-        mock_response = mock_requests.post.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
 
         result = self.kafka_connect.restart_connector_task("hdfs-sink-connector", 1)
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors/hdfs-sink-connector/tasks/1/restart",
             auth=None,
             verify=True,
@@ -647,26 +1308,30 @@ class TestKafkaConnect(unittest.TestCase):
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_list_connector_topics(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = {
-            "hdfs-sink-connector": {"topics": ["test-topic-1", "test-topic-2", "test-topic-3"]}
-        }
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {"hdfs-sink-connector": {"topics": ["test-topic-1", "test-topic-2", "test-topic-3"]}}
+        ).encode()
 
         result = self.kafka_connect.list_connector_topics("hdfs-sink-connector")
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connectors/hdfs-sink-connector/topics", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET",
+            "http://localhost:8083/connectors/hdfs-sink-connector/topics",
+            auth=None,
+            verify=True,
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def reset_connector_topics(self, mock_requests):
-        mock_response = mock_requests.post.return_value
+        mock_response = mock_requests.Session.return_value.request.return_value
 
         result = self.kafka_connect.reset_connector_topics("hdfs-sink-connector", 1)
 
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "POST",
             "http://localhost:8083/connectors/hdfs-sink-connector/topics/reset",
             auth=None,
             verify=True,
@@ -675,19 +1340,21 @@ class TestKafkaConnect(unittest.TestCase):
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_list_connector_plugins(self, mock_requests):
-        mock_response = mock_requests.get.return_value
-        mock_response.json.return_value = [
-            {"class": "io.confluent.connect.hdfs.HdfsSinkConnector"},
-            {"class": "io.confluent.connect.jdbc.JdbcSourceConnector"},
-        ]
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            [
+                {"class": "io.confluent.connect.hdfs.HdfsSinkConnector"},
+                {"class": "io.confluent.connect.jdbc.JdbcSourceConnector"},
+            ]
+        ).encode()
 
         result = self.kafka_connect.list_connector_plugins()
 
-        mock_requests.get.assert_called_with(
-            "http://localhost:8083/connector-plugins", auth=None, verify=True
+        mock_requests.Session.return_value.request.assert_called_with(
+            "GET", "http://localhost:8083/connector-plugins", auth=None, verify=True
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
     @patch("kafka_connect.kafka_connect.requests")
     def test_validate_connector_config(self, mock_requests):
@@ -698,64 +1365,67 @@ class TestKafkaConnect(unittest.TestCase):
             "topics": "test-topic",
         }
 
-        mock_response = mock_requests.put.return_value
-        mock_response.json.return_value = {
-            "name": "FileStreamSinkConnector",
-            "error_count": 1,
-            "groups": ["Common"],
-            "configs": [
-                {
-                    "definition": {
-                        "name": "topics",
-                        "type": "LIST",
-                        "required": False,
-                        "default_value": "",
-                        "importance": "HIGH",
-                        "documentation": "",
-                        "group": "Common",
-                        "width": "LONG",
-                        "display_name": "Topics",
-                        "dependents": [],
-                        "order": 4,
-                    },
-                    "value": {
-                        "name": "topics",
-                        "value": "test-topic",
-                        "recommended_values": [],
-                        "errors": [],
-                        "visible": True,
+        mock_response = mock_requests.Session.return_value.request.return_value
+        mock_response.content = json.dumps(
+            {
+                "name": "FileStreamSinkConnector",
+                "error_count": 1,
+                "groups": ["Common"],
+                "configs": [
+                    {
+                        "definition": {
+                            "name": "topics",
+                            "type": "LIST",
+                            "required": False,
+                            "default_value": "",
+                            "importance": "HIGH",
+                            "documentation": "",
+                            "group": "Common",
+                            "width": "LONG",
+                            "display_name": "Topics",
+                            "dependents": [],
+                            "order": 4,
+                        },
+                        "value": {
+                            "name": "topics",
+                            "value": "test-topic",
+                            "recommended_values": [],
+                            "errors": [],
+                            "visible": True,
+                        },
                     },
-                },
-                {
-                    "definition": {
-                        "name": "file",
-                        "type": "STRING",
-                        "required": True,
-                        "default_value": "",
-                        "importance": "HIGH",
-                        "documentation": "Destination filename.",
-                        "group": None,
-                        "width": "NONE",
-                        "display_name": "file",
-                        "dependents": [],
-                        "order": -1,
+                    {
+                        "definition": {
+                            "name": "file",
+                            "type": "STRING",
+                            "required": True,
+                            "default_value": "",
+                            "importance": "HIGH",
+                            "documentation": "Destination filename.",
+                            "group": None,
+                            "width": "NONE",
+                            "display_name": "file",
+                            "dependents": [],
+                            "order": -1,
+                        },
+                        "value": {},
                     },
-                    "value": {},
-                },
-            ],
-        }
+                ],
+            }
+        ).encode()
 
         result = self.kafka_connect.validate_connector_config(connector_class, config)
 
-        mock_requests.put.assert_called_with(
+        mock_requests.Session.return_value.request.assert_called_with(
+            "PUT",
             f"http://localhost:8083/connector-plugins/{connector_class}/config/validate",
             auth=None,
             verify=True,
             headers={"Content-Type": "application/json"},
-            data=json.dumps(config),
+            data=encode(config),
         )
         mock_response.raise_for_status.assert_called_once()
-        self.assertEqual(result, mock_response.json())
+        self.assertEqual(result, json.loads(mock_response.content))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+from kafka_connect.metrics import RequestMetrics, endpoint_template
+
+import threading
+import unittest
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    def test_endpoint_template(self):
+        self.assertEqual(endpoint_template(""), "/")
+        self.assertEqual(endpoint_template("/connectors"), "/connectors")
+        self.assertEqual(endpoint_template("/connectors/my-connector"), "/connectors/{name}")
+        self.assertEqual(
+            endpoint_template("/connectors/my-connector/tasks/0/status"),
+            "/connectors/{name}/tasks/{task}/status",
+        )
+        self.assertEqual(
+            endpoint_template("/connector-plugins/FileStreamSink/config/validate"),
+            "/connector-plugins/{plugin}/config/validate",
+        )
+        self.assertEqual(endpoint_template("/connector-plugins"), "/connector-plugins")
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def test_snapshot(self):
+        metrics = RequestMetrics(buckets=(0.1, 1))
+        metrics.observe("GET", "/connectors/a/status", 0.05, status_code=200, bytes_received=10)
+        metrics.observe("GET", "/connectors/b/status", 0.5, status_code=404, bytes_received=5)
+        metrics.observe("GET", "/connectors/c/status", 2)
+        metrics.retry("GET", "/connectors/c/status")
+
+        self.assertEqual(
+            metrics.snapshot(),
+            {
+                "GET /connectors/{name}/status": {
+                    "requests": 3,
+                    "status_codes": {200: 1, 404: 1},
+                    "errors": 1,
+                    "retries": 1,
+                    "bytes_sent": 0,
+                    "bytes_received": 15,
+                    "latency": {
+                        "count": 3,
+                        "sum": 2.55,
+                        "buckets": {0.1: 1, 1: 2, float("inf"): 3},
+                    },
+                }
+            },
+        )
+
+    def test_bucket_bounds_are_inclusive(self):
+        metrics = RequestMetrics(buckets=(0.1, 1))
+        metrics.observe("GET", "/connectors", 0.1, status_code=200)
+        buckets = metrics.snapshot()["GET /connectors"]["latency"]["buckets"]
+        self.assertEqual(buckets[0.1], 1)
+
+    def test_reset(self):
+        metrics = RequestMetrics()
+        metrics.observe("GET", "/connectors", 0.01, status_code=200)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_to_prometheus(self):
+        metrics = RequestMetrics(buckets=(0.1, 1))
+        metrics.observe("PUT", "/connectors/a/pause", 0.25, status_code=202, bytes_sent=2)
+        text = metrics.to_prometheus()
+
+        labels = 'method="PUT",endpoint="/connectors/{name}/pause"'
+        self.assertIn("# TYPE kafka_connect_client_requests_total counter", text)
+        self.assertIn(f'kafka_connect_client_requests_total{{{labels},code="202"}} 1', text)
+        self.assertIn(f"kafka_connect_client_request_bytes_total{{{labels}}} 2", text)
+        self.assertIn("# TYPE kafka_connect_client_request_duration_seconds histogram", text)
+        self.assertIn(
+            f'kafka_connect_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 0', text
+        )
+        self.assertIn(
+            f'kafka_connect_client_request_duration_seconds_bucket{{{labels},le="1"}} 1', text
+        )
+        self.assertIn(
+            f'kafka_connect_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', text
+        )
+        self.assertIn(f"kafka_connect_client_request_duration_seconds_sum{{{labels}}} 0.25", text)
+        self.assertIn(f"kafka_connect_client_request_duration_seconds_count{{{labels}}} 1", text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_to_prometheus_escapes_labels(self):
+        metrics = RequestMetrics()
+        metrics.observe("GET", '/weird"path', 0.01, status_code=200)
+        self.assertIn('endpoint="/weird\\"path"', metrics.to_prometheus(prefix="kc"))
+
+    def test_thread_safety(self):
+        metrics = RequestMetrics()
+
+        def observe():
+            for _ in range(1000):
+                metrics.observe("GET", "/connectors", 0.01, status_code=200)
+
+        threads = [threading.Thread(target=observe) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(metrics.snapshot()["GET /connectors"]["requests"], 8000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from kafka_connect.models import (
+    ConnectorInfo,
+    ConnectorStatus,
+    TaskStatus,
+    intern_value,
+    to_models,
+)
+
+import sys
+import unittest
+
+TRACE = "org.apache.kafka.connect.errors.ConnectException: refused\n" + "\tat Worker.run\n" * 100
+
+STATUS = {
+    "name": "my-hdfs-sink",
+    "connector": {"state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+    "tasks": [
+        {"id": 0, "state": "RUNNING", "worker_id": "10.0.0.1:8083"},
+        {"id": 1, "state": "FAILED", "worker_id": "10.0.0.2:8083", "trace": TRACE},
+    ],
+    "type": "sink",
+}
+
+INFO = {
+    "name": "my-hdfs-sink",
+    "config": {"connector.class": "HdfsSinkConnector", "tasks.max": "2"},
+    "tasks": [{"connector": "my-hdfs-sink", "task": 0}, {"connector": "my-hdfs-sink", "task": 1}],
+    "type": "sink",
+}
+
+
+class TestModels(unittest.TestCase):
+    def test_connector_status(self):
+        status = ConnectorStatus.from_dict(STATUS)
+        self.assertEqual(
+            (status.name, status.state, status.type), ("my-hdfs-sink", "RUNNING", "sink")
+        )
+        self.assertIsNone(status.trace)
+        self.assertEqual([task.state for task in status.tasks], ["RUNNING", "FAILED"])
+        self.assertEqual(status.to_dict(), STATUS)
+        self.assertEqual(status, ConnectorStatus.from_dict(STATUS))
+
+    def test_task_status(self):
+        task = TaskStatus.from_dict(STATUS["tasks"][1])
+        # ensure the trace is kept compressed and restored on access
+        self.assertLess(len(task._trace), len(TRACE) // 10)
+        self.assertEqual(task.trace, TRACE)
+        self.assertEqual(
+            repr(TaskStatus(0, "RUNNING", "w")), "TaskStatus(id=0, state='RUNNING', worker_id='w')"
+        )
+        with self.assertRaises(AttributeError):
+            task.extra = True
+
+    def test_interned_strings(self):
+        # build the strings at runtime so that they are distinct objects
+        state = "".join(["RUN", "NING"])
+        task = TaskStatus(0, state, "".join(["10.0.0.1", ":8083"]))
+        self.assertIs(task.state, sys.intern("RUNNING"))
+        self.assertIs(task.worker_id, TaskStatus(1, "RUNNING", "10.0.0.1:8083").worker_id)
+        self.assertIs(intern_value("".join(["FAI", "LED"])), sys.intern("FAILED"))
+        self.assertIsNone(intern_value(None))
+
+    def test_connector_info(self):
+        info = ConnectorInfo.from_dict(INFO)
+        self.assertEqual(info.tasks, (0, 1))
+        self.assertEqual(info.config["tasks.max"], "2")
+        self.assertEqual(info.to_dict(), INFO)
+        self.assertEqual(
+            repr(info), "ConnectorInfo(name='my-hdfs-sink', type='sink', tasks=(0, 1))"
+        )
+
+    def test_to_models(self):
+        models = to_models({"my-hdfs-sink": {"status": STATUS, "info": INFO}})
+        self.assertIsInstance(models["my-hdfs-sink"]["status"], ConnectorStatus)
+        self.assertIsInstance(models["my-hdfs-sink"]["info"], ConnectorInfo)
+        self.assertEqual(to_models({}), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
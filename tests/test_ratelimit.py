@@ -0,0 +1,44 @@
+from kafka_connect.ratelimit import TokenBucket
+
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(rate=10, burst=2, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst(self):
+        self.assertEqual([self.bucket.acquire() for _ in range(2)], [0, 0])
+        self.assertAlmostEqual(self.bucket.acquire(), 0.1)
+
+    def test_sustained_rate(self):
+        for _ in range(22):
+            self.bucket.acquire()
+
+        # ensure the burst is followed by the sustained rate
+        self.assertAlmostEqual(self.clock.now, 2.0)
+
+    def test_refill_is_capped_at_burst(self):
+        self.clock.now = 60
+        self.assertEqual([self.bucket.acquire() for _ in range(2)], [0, 0])
+        self.assertGreater(self.bucket.acquire(), 0)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
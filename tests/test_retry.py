@@ -0,0 +1,41 @@
+from kafka_connect.retry import RetryPolicy
+from unittest.mock import patch
+
+import unittest
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+        self.assertTrue(policy.should_retry(1, status_code=500))
+        self.assertTrue(policy.should_retry(2, error=ConnectionError()))
+        self.assertFalse(policy.should_retry(1, status_code=404))
+        self.assertFalse(policy.should_retry(3, status_code=503))
+        self.assertEqual(policy.retries, 2)
+
+    def test_should_retry_conflict_only_during_rebalance(self):
+        policy = RetryPolicy()
+        rebalance = "Request cannot be completed because a rebalance is expected"
+        stale = "Cannot complete request momentarily due to stale configuration"
+        self.assertTrue(policy.should_retry(1, status_code=409, message=rebalance))
+        self.assertTrue(policy.should_retry(1, status_code=409, message=stale))
+        # ensure a conflict that no retry resolves fails right away
+        exists = '{"error_code": 409, "message": "Connector my-connector already exists"}'
+        self.assertFalse(policy.should_retry(1, status_code=409, message=exists))
+        self.assertFalse(policy.should_retry(1, status_code=409))
+        self.assertEqual(policy.retries, 2)
+
+    def test_should_not_retry_connection_errors(self):
+        policy = RetryPolicy(retry_on_connection_errors=False)
+        self.assertFalse(policy.should_retry(1, error=ConnectionError()))
+
+    @patch("kafka_connect.retry.random")
+    def test_delay(self, mock_random):
+        mock_random.uniform.side_effect = lambda low, high: high
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)], [1, 2, 4, 5, 5])
+        mock_random.uniform.assert_called_with(0, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import kafka_connect
+import os
+import subprocess
+import sys
+import unittest
+
+SCRIPT = """
+import sys
+from kafka_connect.cli import cli
+
+try:
+    cli.main(["--help"], prog_name="kc")
+except SystemExit:
+    pass
+print(",".join(sorted(module for module in {modules} if module in sys.modules)))
+"""
+
+
+class TestStartup(unittest.TestCase):
+    def test_help_does_not_import_the_client(self):
+        heavy = (
+            "requests",
+            "urllib3",
+            "asyncio",
+            "httpx",
+            "logging",
+            "traceback",
+            "kafka_connect.kafka_connect",
+        )
+        env = dict(os.environ)
+        src = os.path.dirname(os.path.dirname(os.path.abspath(kafka_connect.__file__)))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(modules=heavy)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # ensure `kc --help` only imports what it needs to parse the command line
+        self.assertEqual(result.stdout.splitlines()[-1], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+from kafka_connect.stream import iter_matching, iter_object
+
+import json
+import unittest
+
+
+BODY = {
+    "my-jdbc-source": {
+        "status": {"name": "my-jdbc-source", "connector": {"state": "RUNNING"}, "tasks": []},
+        "info": {
+            "config": {"query": 'SELECT "a", \'b\' FROM t WHERE c = "\\\\"', "tasks.max": "1"}
+        },
+    },
+    "my-hdfs-sink": {
+        "status": {"name": "my-hdfs-sink", "connector": {"state": "FAILED"}, "tasks": []},
+        "info": {"config": {"topics": "café,[x],{y}", "flush.size": 3, "enabled": True}},
+    },
+    "my-s3-sink": {"status": {"connector": {"state": "FAILED"}}, "info": None},
+}
+
+
+class TestStream(unittest.TestCase):
+    def test_iter_object(self):
+        members = list(iter_object([json.dumps(BODY)]))
+        self.assertEqual(members, list(BODY.items()))
+
+    def test_iter_object_split_at_every_byte(self):
+        raw = json.dumps(BODY, ensure_ascii=False, indent=2).encode()
+        for i in range(1, len(raw)):
+            chunks = [raw[:i], b"", raw[i:]]
+            self.assertEqual(dict(iter_object(chunks)), BODY)
+
+    def test_iter_object_number_split_across_chunks(self):
+        self.assertEqual(list(iter_object(['{"a": 12', "34}"])), [("a", 1234)])
+
+    def test_iter_object_empty(self):
+        self.assertEqual(list(iter_object([b" { } "])), [])
+
+    def test_iter_object_invalid(self):
+        with self.assertRaises(ValueError):
+            list(iter_object([b'["my-jdbc-source"]']))
+        with self.assertRaises(ValueError):
+            list(iter_object([b'{"my-jdbc-source": {"status": {']))
+
+    def test_iter_matching(self):
+        chunks = [json.dumps(BODY).encode()]
+        self.assertEqual(dict(iter_matching(chunks)), BODY)
+        self.assertEqual(
+            dict(iter_matching([json.dumps(BODY)], pattern="my-.*-sink", state="failed")),
+            {"my-hdfs-sink": BODY["my-hdfs-sink"], "my-s3-sink": BODY["my-s3-sink"]},
+        )
+        self.assertEqual(
+            dict(iter_matching([json.dumps(BODY)], state="running", expand=["info"])),
+            {"my-jdbc-source": {"info": BODY["my-jdbc-source"]["info"]}},
+        )
+        self.assertEqual(
+            dict(iter_matching([json.dumps(BODY)], pattern="my-s3", expand=[])), {"my-s3-sink": {}}
+        )
+
+    def test_iter_matching_is_lazy(self):
+        raw = json.dumps(BODY).encode()
+        chunks = iter([raw[:210], raw[210:]])
+        matches = iter_matching(chunks, state="running")
+
+        # ensure the first match is yielded before the rest of the body is read
+        self.assertEqual(next(matches), ("my-jdbc-source", BODY["my-jdbc-source"]))
+        self.assertEqual(next(chunks), raw[210:])
+
+
+if __name__ == "__main__":
+    unittest.main()
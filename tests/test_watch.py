@@ -0,0 +1,59 @@
+from kafka_connect.watch import diff_snapshots, snapshot
+
+import unittest
+
+
+def status(state, tasks):
+    return {
+        "status": {
+            "connector": {"state": state, "worker_id": "10.0.0.1:8083"},
+            "tasks": [
+                {"id": task_id, "state": task_state, "worker_id": "10.0.0.2:8083"}
+                for task_id, task_state in enumerate(tasks)
+            ],
+        }
+    }
+
+
+class TestWatch(unittest.TestCase):
+    def test_snapshot(self):
+        self.assertEqual(
+            snapshot({"my-connector": status("RUNNING", ["RUNNING"])}),
+            {"my-connector": ("RUNNING", "10.0.0.1:8083", {0: ("RUNNING", "10.0.0.2:8083")})},
+        )
+
+    def test_diff_snapshots_without_changes(self):
+        current = snapshot({"my-connector": status("RUNNING", ["RUNNING", "RUNNING"])})
+        self.assertEqual(diff_snapshots(current, current), [])
+
+    def test_diff_snapshots(self):
+        previous = snapshot(
+            {
+                "my-jdbc-source": status("RUNNING", ["RUNNING", "RUNNING"]),
+                "my-hdfs-sink": status("RUNNING", []),
+            }
+        )
+        current = snapshot(
+            {
+                "my-jdbc-source": status("RUNNING", ["RUNNING", "FAILED"]),
+                "my-s3-sink": status("PAUSED", ["PAUSED"]),
+            }
+        )
+
+        events = diff_snapshots(previous, current)
+
+        self.assertEqual(
+            [(e["type"], e["connector"], e.get("task"), e["from"], e["to"]) for e in events],
+            [
+                ("task", "my-jdbc-source", 1, "RUNNING", "FAILED"),
+                ("connector", "my-hdfs-sink", None, "RUNNING", None),
+                ("connector", "my-s3-sink", None, None, "PAUSED"),
+                ("task", "my-s3-sink", 0, None, "PAUSED"),
+            ],
+        )
+        self.assertEqual(events[0]["worker_id"], "10.0.0.2:8083")
+        self.assertEqual(events[1]["worker_id"], "10.0.0.1:8083")
+
+
+if __name__ == "__main__":
+    unittest.main()
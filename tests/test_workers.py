@@ -0,0 +1,53 @@
+from kafka_connect.workers import WorkerPool
+
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.urls = ["http://worker-0:8083", "http://worker-1:8083", "http://worker-2:8083"]
+
+    def test_round_robin(self):
+        pool = WorkerPool(self.urls, clock=self.clock)
+        self.assertEqual([pool.select() for _ in range(4)], self.urls + self.urls[:1])
+
+    def test_least_latency(self):
+        pool = WorkerPool(self.urls, strategy="least-latency", clock=self.clock)
+        for url, latency in zip(self.urls, [0.3, 0.1, 0.2]):
+            pool.mark_succeeded(url, latency)
+        self.assertEqual(pool.select(), "http://worker-1:8083")
+        self.assertEqual(pool.select(exclude=["http://worker-1:8083"]), "http://worker-2:8083")
+
+    def test_cooldown(self):
+        pool = WorkerPool(self.urls, cooldown=30, clock=self.clock)
+        pool.mark_failed("http://worker-0:8083")
+        self.assertEqual(pool.healthy(), self.urls[1:])
+        self.assertNotIn("http://worker-0:8083", [pool.select() for _ in range(4)])
+
+        # ensure the worker is probed again once the cooldown expires
+        self.clock.now = 31
+        self.assertEqual(pool.healthy(), self.urls)
+
+    def test_all_unhealthy(self):
+        pool = WorkerPool(self.urls, clock=self.clock)
+        for url in reversed(self.urls):
+            pool.mark_failed(url)
+            self.clock.now += 1
+        self.assertEqual(pool.select(), "http://worker-2:8083")
+
+    def test_invalid_strategy(self):
+        with self.assertRaises(ValueError):
+            WorkerPool(self.urls, strategy="random")
+
+
+if __name__ == "__main__":
+    unittest.main()